@@ -0,0 +1,343 @@
+# archive_backends.py
+# NewsRepository의 아카이브(raw_archive / selected_archive) 저장 방식 (config.ARCHIVE_BACKEND)
+# - "csv"    : 기존 방식. 매 실행마다 전체 CSV를 읽어 병합/정렬 후 다시 쓴다.
+# - "parquet": pubDate(KST) 날짜별 폴더에 실행마다 파티션 파일만 추가하고 manifest.json에 기록한다.
+#              읽을 때는 최신 날짜 파티션부터 필요한 만큼만 읽어 pubDate 내림차순으로 정렬한다.
+# - "sqlite" : 모든 키워드 아카이브를 archive/articles.sqlite 하나에 저장한다. (api/article_store.py)
+
+import json
+import os
+import uuid
+from datetime import datetime
+from typing import List, Optional
+
+import pandas as pd
+
+ARCHIVE_BACKENDS = ("csv", "parquet", "sqlite")
+
+
+# 네이버 API pubDate 형식 (예: "Mon, 26 Jan 2026 07:56:00 +0900")
+PUBDATE_FORMAT = "%a, %d %b %Y %H:%M:%S %z"
+
+
+def pubdate_sort_key(pub_dates: pd.Series) -> pd.Series:
+    """pubDate 문자열 → 정렬용 datetime (UTC, 파싱 실패는 NaT)"""
+    keys = pd.to_datetime(pub_dates, format=PUBDATE_FORMAT, errors="coerce", utc=True)
+    # 다른 형식으로 저장된 값만 개별 파싱
+    missing = keys.isna() & pub_dates.notna()
+    if missing.any():
+        keys[missing] = pd.to_datetime(pub_dates[missing], errors="coerce", utc=True)
+    return keys
+
+
+def sort_by_pubdate(df: pd.DataFrame) -> pd.DataFrame:
+    """pubDate 내림차순 (파싱 실패 행은 마지막)"""
+    if df.empty or "pubDate" not in df.columns:
+        return df
+    keys = pubdate_sort_key(df["pubDate"]).reset_index(drop=True)
+    order = keys.sort_values(ascending=False, na_position="last", kind="stable").index
+    return df.iloc[order]
+
+
+def _save_csv(df: pd.DataFrame, path: str):
+    from utils.dataframe_utils import raw_df_save
+    raw_df_save(df, path)
+
+
+class CsvArchive:
+    """
+    기존 CSV 방식
+    - 파일은 항상 pubDate 내림차순으로 저장되어 있으므로 앞에서부터 읽으면 최신 기사다.
+    - append는 기존 파일 전체를 읽어 합친 뒤 다시 정렬/저장한다.
+    """
+
+    def __init__(self, csv_path: str, reorder=None):
+        self.csv_path = csv_path
+        self.reorder = reorder  # 저장 전 컬럼 순서 재배치 함수 (선택)
+
+    def exists(self) -> bool:
+        return os.path.exists(self.csv_path)
+
+    def version(self) -> str:
+        """저장 상태 식별값 (파일 크기 + 수정 시각)"""
+        if not self.exists():
+            return ""
+        stat = os.stat(self.csv_path)
+        return f"csv:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def read(self, columns: Optional[List[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """앞에서부터 limit건 (columns 중 파일에 있는 컬럼만)"""
+        if not self.exists():
+            return pd.DataFrame(columns=columns or [])
+        usecols = None if columns is None else (lambda c: c in columns)
+        return pd.read_csv(self.csv_path, usecols=usecols, nrows=limit)
+
+    def iter_chunks(self, chunksize: int, columns: Optional[List[str]] = None):
+        """전체 행을 chunksize건씩 (파일 순서). 파일 전체를 메모리에 올리지 않는다."""
+        if not self.exists():
+            return
+        usecols = None if columns is None else (lambda c: c in columns)
+        yield from pd.read_csv(self.csv_path, usecols=usecols, chunksize=chunksize)
+
+    def append(self, df_new: pd.DataFrame):
+        if df_new.empty:
+            return
+        if self.exists():
+            df_total = pd.concat([df_new, pd.read_csv(self.csv_path)], ignore_index=True)
+        else:
+            df_total = df_new
+
+        df_total = sort_by_pubdate(df_total)
+        if self.reorder:
+            df_total = self.reorder(df_total)
+        _save_csv(df_total, self.csv_path)
+
+    def export_csv(self, path: Optional[str] = None):
+        """CSV 방식은 저장 파일 자체가 CSV이므로 다른 경로일 때만 복사 저장"""
+        if path and os.path.abspath(path) != os.path.abspath(self.csv_path) and self.exists():
+            _save_csv(self.read(), path)
+
+
+class ParquetArchive:
+    """
+    날짜 파티션 Parquet 방식 (append-only)
+
+    <dir>/
+      manifest.json                          ← 파티션 파일 목록 (rows, 생성 시각)
+      2026-01-26/part-20260126T075600-xxxx.parquet
+      unknown/part-....parquet               ← pubDate 파싱 실패 행
+
+    - append는 이번 실행의 신규 행만 날짜별로 나눠 새 파일로 쓰고 manifest를 원자적으로 교체한다.
+      manifest에 없는 파일(기록 도중 중단된 파일)은 읽지 않는다.
+    - read(limit=N)은 최신 날짜 폴더부터 N건이 찰 때까지만 읽는다. (날짜 폴더끼리는 pubDate 범위가 겹치지 않음)
+    - 같은 이름의 기존 CSV가 있고 manifest가 없으면, 첫 쓰기(append) 때 한 번 가져와 첫 파티션들로 만든다. (migrate_from_csv)
+      그 전까지 읽기(read / iter_chunks)는 기존 CSV를 그대로 읽는다. 읽기만 하는 쪽(aggregator 등)은 아카이브를 바꾸지 않는다.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+    UNKNOWN_PARTITION = "unknown"
+    PARTITION_TZ = "Asia/Seoul"
+    # 한 날짜 폴더의 파일 수가 이 값을 넘으면 하나로 합친다. (작은 파일 누적 방지)
+    COMPACT_FILES = 16
+
+    def __init__(self, dir_path: str, legacy_csv_path: Optional[str] = None, reorder=None):
+        self.dir_path = dir_path
+        self.legacy_csv_path = legacy_csv_path
+        self.reorder = reorder
+        self.manifest_path = os.path.join(dir_path, self.MANIFEST_NAME)
+        self._manifest = self._load_manifest()
+        self._legacy = CsvArchive(legacy_csv_path) if legacy_csv_path else None
+
+    def _legacy_pending(self) -> bool:
+        """아직 가져오지 않은 기존 CSV만 있는 상태"""
+        return self._manifest is None and self._legacy is not None and self._legacy.exists()
+
+    def migrate_from_csv(self) -> bool:
+        """manifest가 없고 기존 CSV가 있으면 한 번 가져와 첫 파티션들로 만든다. (가져왔으면 True)"""
+        if not self._legacy_pending():
+            return False
+        print(f"[Archive] 기존 CSV를 파티션으로 가져옵니다: {self.legacy_csv_path}")
+        self._write(pd.read_csv(self.legacy_csv_path))
+        return True
+
+    def exists(self) -> bool:
+        if self._legacy_pending():
+            return True
+        return bool(self._manifest and self._manifest["files"])
+
+    def version(self) -> str:
+        """저장 상태 식별값 (마지막 append의 실행 태그)"""
+        if self._legacy_pending():
+            return self._legacy.version()
+        if not self.exists():
+            return ""
+        return f"parquet:{self._manifest.get('last_run', '')}"
+
+    def _load_manifest(self) -> Optional[dict]:
+        if not os.path.exists(self.manifest_path):
+            return None
+        with open(self.manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_manifest(self, manifest: dict):
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+        self._manifest = manifest
+
+    def _partition_keys(self, df: pd.DataFrame) -> pd.Series:
+        if "pubDate" not in df.columns:
+            return pd.Series(self.UNKNOWN_PARTITION, index=df.index)
+        dates = pubdate_sort_key(df["pubDate"]).dt.tz_convert(self.PARTITION_TZ).dt.strftime("%Y-%m-%d")
+        return dates.fillna(self.UNKNOWN_PARTITION)
+
+    @staticmethod
+    def _to_storable(df: pd.DataFrame) -> pd.DataFrame:
+        """object 컬럼은 문자열로 통일 (파티션마다 타입이 달라지지 않도록)"""
+        df = df.copy()
+        for col in df.columns:
+            if df[col].dtype == object:
+                df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+        return df
+
+    def append(self, df_new: pd.DataFrame):
+        if df_new.empty:
+            return
+        self.migrate_from_csv()
+        self._write(df_new)
+
+    def _write(self, df_new: pd.DataFrame):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if df_new.empty:
+            return
+
+        os.makedirs(self.dir_path, exist_ok=True)
+        manifest = dict(self._manifest or {"version": 1, "files": []})
+        files = list(manifest["files"])
+        run_tag = datetime.now().strftime("%Y%m%dT%H%M%S") + "-" + uuid.uuid4().hex[:8]
+
+        df_new = self._to_storable(df_new)
+        keys = self._partition_keys(df_new)
+        for partition, df_part in df_new.groupby(keys, sort=True):
+            df_part = sort_by_pubdate(df_part)
+
+            rel_path = os.path.join(partition, f"part-{run_tag}.parquet")
+            abs_path = os.path.join(self.dir_path, rel_path)
+            os.makedirs(os.path.dirname(abs_path), exist_ok=True)
+            pq.write_table(pa.Table.from_pandas(df_part, preserve_index=False), abs_path)
+            files.append({"file": rel_path, "partition": partition, "rows": len(df_part)})
+
+            if sum(f["partition"] == partition for f in files) > self.COMPACT_FILES:
+                files = self._compact(files, partition, run_tag)
+
+        manifest["files"] = files
+        manifest["last_run"] = run_tag
+        manifest["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        old_files = {f["file"] for f in (self._manifest or {"files": []})["files"]}
+        self._save_manifest(manifest)
+
+        # 합쳐진 이전 파일은 manifest 교체 후에 삭제
+        for rel_path in old_files - {f["file"] for f in files}:
+            try:
+                os.remove(os.path.join(self.dir_path, rel_path))
+            except OSError:
+                pass
+
+    def _compact(self, files: List[dict], partition: str, run_tag: str) -> List[dict]:
+        """한 날짜 폴더의 파일들을 정렬된 파일 하나로 합친다. (manifest 교체 전까지 기존 파일은 유지)"""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        targets = [f for f in files if f["partition"] == partition]
+        # 나중에 추가된 파일이 앞 (read와 같은 순서)
+        frames = [pq.read_table(os.path.join(self.dir_path, f["file"])).to_pandas() for f in reversed(targets)]
+        df = sort_by_pubdate(pd.concat(frames, ignore_index=True))
+
+        rel_path = os.path.join(partition, f"compact-{run_tag}.parquet")
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), os.path.join(self.dir_path, rel_path))
+        return [f for f in files if f["partition"] != partition] + [{"file": rel_path, "partition": partition, "rows": len(df)}]
+
+    def _partitions_newest_first(self) -> List[str]:
+        partitions = sorted({f["partition"] for f in self._manifest["files"]} - {self.UNKNOWN_PARTITION}, reverse=True)
+        if any(f["partition"] == self.UNKNOWN_PARTITION for f in self._manifest["files"]):
+            partitions.append(self.UNKNOWN_PARTITION)
+        return partitions
+
+    def read(self, columns: Optional[List[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        """pubDate 내림차순 정렬 뷰의 앞 limit건 (columns 중 저장된 컬럼만)"""
+        import pyarrow.parquet as pq
+
+        if self._legacy_pending():
+            return self._legacy.read(columns=columns, limit=limit)
+        if not self.exists():
+            return pd.DataFrame(columns=columns or [])
+
+        # 정렬에 pubDate가 필요하므로 요청 컬럼에 없으면 읽은 뒤 버린다.
+        read_columns = None
+        if columns is not None:
+            read_columns = list(columns) + ([] if "pubDate" in columns else ["pubDate"])
+
+        # 같은 날짜 안에서는 나중에 추가된 파일을 앞에 둔다. (CSV 방식의 "신규 행을 앞에 붙여 정렬"과 같은 순서)
+        frames, total = [], 0
+        for partition in self._partitions_newest_first():
+            for entry in reversed(self._manifest["files"]):
+                if entry["partition"] != partition:
+                    continue
+                path = os.path.join(self.dir_path, entry["file"])
+                if read_columns is None:
+                    frames.append(pq.read_table(path).to_pandas())
+                else:
+                    available = set(pq.read_schema(path).names)
+                    frames.append(pq.read_table(path, columns=[c for c in read_columns if c in available]).to_pandas())
+                total += entry["rows"]
+            if limit is not None and total >= limit:
+                break
+
+        df = sort_by_pubdate(pd.concat(frames, ignore_index=True))
+        if limit is not None:
+            df = df.head(limit)
+        if columns is not None:
+            df = df[[c for c in columns if c in df.columns]]
+        return df.reset_index(drop=True)
+
+    def iter_chunks(self, chunksize: int, columns: Optional[List[str]] = None):
+        """
+        전체 행을 최대 chunksize건씩 (최신 날짜 폴더부터, 폴더 안에서는 나중에 추가된 파일부터).
+        파일 단위로 읽으므로 read()와 달리 전체 정렬은 하지 않는다.
+        """
+        import pyarrow.parquet as pq
+
+        if self._legacy_pending():
+            yield from self._legacy.iter_chunks(chunksize, columns=columns)
+            return
+        if not self.exists():
+            return
+        for partition in self._partitions_newest_first():
+            for entry in reversed(self._manifest["files"]):
+                if entry["partition"] != partition:
+                    continue
+                parquet_file = pq.ParquetFile(os.path.join(self.dir_path, entry["file"]))
+                read_columns = None
+                if columns is not None:
+                    read_columns = [c for c in columns if c in parquet_file.schema_arrow.names]
+                for batch in parquet_file.iter_batches(batch_size=chunksize, columns=read_columns):
+                    yield batch.to_pandas()
+
+    def export_csv(self, path: Optional[str] = None):
+        """정렬된 전체 뷰를 CSV로 내보낸다. (기본 경로: 기존 CSV 파일 위치)"""
+        path = path or self.legacy_csv_path
+        if self._legacy_pending() and os.path.abspath(path) == os.path.abspath(self.legacy_csv_path):
+            return  # 아직 가져오지 않은 기존 CSV 자체가 내보낼 내용
+        if path and self.exists():
+            df = self.read()
+            if self.reorder:
+                df = self.reorder(df)
+            _save_csv(df, path)
+
+
+def open_archive(backend: str, csv_path: str, reorder=None, store_path: Optional[str] = None):
+    """
+    csv_path(예: archive/<keyword>/selected_archive.csv) 기준으로 아카이브를 연다.
+    parquet은 확장자를 뺀 같은 이름의 폴더(archive/<keyword>/selected_archive/)를 쓴다.
+    sqlite는 store_path(기본: archive/articles.sqlite)의 (selected_archive, <keyword>) 구간을 쓴다.
+    """
+    if backend == "csv":
+        return CsvArchive(csv_path, reorder=reorder)
+    if backend == "parquet":
+        return ParquetArchive(os.path.splitext(csv_path)[0], legacy_csv_path=csv_path, reorder=reorder)
+    if backend == "sqlite":
+        from .article_store import ARTICLE_STORE_NAME, SqliteArchive, get_article_store
+
+        keyword_dir = os.path.dirname(csv_path)
+        store = get_article_store(store_path or os.path.join(os.path.dirname(keyword_dir), ARTICLE_STORE_NAME))
+        return SqliteArchive(
+            store,
+            archive=os.path.splitext(os.path.basename(csv_path))[0],
+            keyword=os.path.basename(keyword_dir),
+            csv_path=csv_path,
+            reorder=reorder,
+        )
+    raise ValueError(f"ARCHIVE_BACKEND는 {ARCHIVE_BACKENDS} 중 하나여야 합니다: {backend}")
@@ -0,0 +1,395 @@
+# article_store.py
+# 기사 저장소 (SQLite, WAL) — ARCHIVE_BACKEND = "sqlite"
+# - 키워드별 raw/selected 아카이브와 전역 canonical 아카이브를 하나의 DB 파일에 보관한다.
+# - 시간 구간("최근 12시간") / 키워드 조회는 인덱스로 처리한다. (CSV 전체를 읽지 않음)
+
+import json
+import os
+import sqlite3
+import threading
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .archive_backends import pubdate_sort_key, _save_csv
+
+# articles 테이블에 컬럼으로 두는 기사 공통 필드 (그 외 컬럼은 article_keywords.extra에 JSON으로 보관)
+ARTICLE_COLUMNS = ["news_id", "pubDate", "title", "description", "link", "originallink", "content"]
+# 키워드(아카이브)마다 값이 달라지는 필드
+KEYWORD_COLUMNS = ["search_keyword", "collected_at"]
+
+ARTICLE_STORE_NAME = "articles.sqlite"
+
+ARCHIVE_RAW = "raw_archive"
+ARCHIVE_SELECTED = "selected_archive"
+ARCHIVE_CANONICAL = "canonical_archive"
+# 필터 탈락 기사 로그 (processors/single_news_pre_post_filter.py): 로그 파일 이름별 archive, 키워드는 그대로
+ARCHIVE_FILTERED_LOG_PREFIX = "filtered_logs/"
+
+
+def filter_log_archive(filename: str) -> str:
+    """필터 로그 파일 이름(step3_short_snippet.csv) → 저장소 archive 이름 (filtered_logs/step3_short_snippet)"""
+    return ARCHIVE_FILTERED_LOG_PREFIX + os.path.splitext(os.path.basename(filename))[0]
+
+# load_canonical_archive: csv에서 시간 구간을 읽을 때 한 번에 읽는 행 수
+CSV_WINDOW_CHUNK_ROWS = 50_000
+
+
+def _to_epoch(value) -> Optional[int]:
+    if value is None:
+        return None
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize("Asia/Seoul")
+    return int(ts.timestamp())
+
+
+def _clean(value):
+    """SQLite / JSON에 넣을 수 있는 값으로 변환 (NaN/NaT → None)"""
+    if isinstance(value, (list, dict)):
+        return value
+    if value is None or pd.isna(value):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, pd.Timestamp):
+        return str(value)
+    return value
+
+
+def _text(value) -> Optional[str]:
+    value = _clean(value)
+    return None if value is None else str(value)
+
+
+class ArticleStore:
+    """
+    tables
+    - articles         : (archive, news_id) 기준 기사 1건. pub_ts = pubDate의 epoch 초(UTC, 파싱 실패 시 NULL)
+    - article_keywords : 기사 ↔ 키워드 매핑 (archive, search_keyword, news_id) + 키워드별 필드(collected_at, extra JSON)
+
+    indexes
+    - articles(news_id), articles(archive, pub_ts)
+    - article_keywords(archive, search_keyword, news_id), article_keywords(archive, news_id)
+
+    - 같은 기사가 여러 키워드에서 수집되면 articles에는 한 번, article_keywords에는 키워드마다 기록된다.
+    - (archive, keyword) 안에서 news_id는 한 번만 저장된다. (CSV와 달리 같은 배치 안의 중복도 합쳐짐)
+    - 키워드 병렬 실행 시 파이프라인마다 연결을 열어도 되도록 WAL + busy timeout을 사용한다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS articles (
+                archive      TEXT NOT NULL,
+                news_id      TEXT NOT NULL,
+                pub_ts       INTEGER,
+                pubDate      TEXT,
+                title        TEXT,
+                description  TEXT,
+                link         TEXT,
+                originallink TEXT,
+                content      TEXT,
+                PRIMARY KEY (archive, news_id)
+            );
+            CREATE TABLE IF NOT EXISTS article_keywords (
+                archive        TEXT NOT NULL,
+                search_keyword TEXT NOT NULL,
+                news_id        TEXT NOT NULL,
+                collected_at   TEXT,
+                extra          TEXT,
+                PRIMARY KEY (archive, search_keyword, news_id)
+            );
+            CREATE INDEX IF NOT EXISTS idx_articles_news_id ON articles(news_id);
+            CREATE INDEX IF NOT EXISTS idx_articles_pub_ts ON articles(archive, pub_ts);
+            CREATE INDEX IF NOT EXISTS idx_article_keywords_keyword ON article_keywords(archive, search_keyword, news_id);
+            CREATE INDEX IF NOT EXISTS idx_article_keywords_news_id ON article_keywords(archive, news_id);
+            """
+        )
+        self._conn.commit()
+
+    # ---------------------------------------------------------
+    # 쓰기
+    # ---------------------------------------------------------
+    def append(self, archive: str, df: pd.DataFrame, keyword: Optional[str] = None):
+        """
+        기사 추가. keyword가 없으면 각 행의 search_keyword 컬럼을 키워드로 쓴다.
+        이미 있는 (archive, news_id) 기사 본문은 유지하고 키워드 매핑만 추가한다.
+        """
+        if df.empty:
+            return
+        with self._lock:
+            self._insert(archive, df, keyword)
+            self._conn.commit()
+
+    def replace_archive(self, archive: str, df: pd.DataFrame):
+        """archive 전체를 df로 교체 (canonical_archive처럼 매번 새로 만드는 결과물용, 한 트랜잭션)"""
+        with self._lock:
+            self._conn.execute("DELETE FROM article_keywords WHERE archive = ?", (archive,))
+            self._conn.execute("DELETE FROM articles WHERE archive = ?", (archive,))
+            if not df.empty:
+                self._insert(archive, df, None)
+            self._conn.commit()
+
+    def _insert(self, archive: str, df: pd.DataFrame, keyword: Optional[str]):
+        # 같은 pubDate끼리는 나중에 넣은 행(rowid 큰 쪽)이 먼저 조회되므로, df 앞쪽 행이 먼저 나오도록 역순으로 넣는다.
+        df = df.iloc[::-1].reset_index(drop=True)
+        pub_ts = pubdate_sort_key(df["pubDate"].astype(str)) if "pubDate" in df.columns else pd.Series(pd.NaT, index=df.index)
+        pub_ts = [None if pd.isna(t) else int(t.timestamp()) for t in pub_ts]
+
+        extra_cols = [c for c in df.columns if c not in ARTICLE_COLUMNS and c not in KEYWORD_COLUMNS]
+        records = df.to_dict("records")
+
+        article_rows, keyword_rows = [], []
+        for rec, ts in zip(records, pub_ts):
+            news_id = str(rec["news_id"])
+            article_rows.append((archive, news_id, ts, *[_text(rec.get(c)) for c in ARTICLE_COLUMNS[1:]]))
+            kw = keyword if keyword is not None else (_clean(rec.get("search_keyword")) or "")
+            extra = {c: _clean(rec.get(c)) for c in extra_cols}
+            keyword_rows.append((
+                archive, str(kw), news_id, _text(rec.get("collected_at")),
+                json.dumps(extra, ensure_ascii=False, default=str) if extra else None,
+            ))
+
+        placeholders = ",".join("?" * (len(ARTICLE_COLUMNS) + 2))
+        self._conn.executemany(
+            f"INSERT OR IGNORE INTO articles (archive, news_id, pub_ts, {', '.join(ARTICLE_COLUMNS[1:])}) "
+            f"VALUES ({placeholders})",
+            article_rows,
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO article_keywords (archive, search_keyword, news_id, collected_at, extra) "
+            "VALUES (?, ?, ?, ?, ?)",
+            keyword_rows,
+        )
+
+    # ---------------------------------------------------------
+    # 읽기
+    # ---------------------------------------------------------
+    def query(
+        self,
+        archive: str,
+        keyword: Optional[str] = None,
+        since=None,
+        until=None,
+        columns: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+    ) -> pd.DataFrame:
+        """
+        pubDate 내림차순 조회 (같은 시각이면 나중에 추가된 기사 먼저, pubDate 파싱 실패 기사는 마지막)
+        - keyword: 해당 키워드 매핑 기사만
+        - since / until: pubDate 구간 (since <= pubDate <= until, tz 없는 값은 KST로 간주)
+        """
+        select, names, wanted = self._select_columns(columns)
+
+        where, params = ["a.archive = ?", "k.archive = ?"], [archive, archive]
+        if keyword is not None:
+            where.append("k.search_keyword = ?")
+            params.append(keyword)
+        if since is not None:
+            where.append("a.pub_ts >= ?")
+            params.append(_to_epoch(since))
+        if until is not None:
+            where.append("a.pub_ts <= ?")
+            params.append(_to_epoch(until))
+
+        sql = (
+            f"SELECT {', '.join(select)} FROM article_keywords k "
+            f"JOIN articles a ON a.archive = k.archive AND a.news_id = k.news_id "
+            f"WHERE {' AND '.join(where)} "
+            f"ORDER BY a.pub_ts IS NULL, a.pub_ts DESC, k.rowid DESC"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return self._to_frame(rows, names, wanted)
+
+    def fetch(self, archive: str, news_ids: List[str], columns: Optional[List[str]] = None,
+              chunksize: int = 500) -> pd.DataFrame:
+        """
+        news_id로 기사 행 조회 (articles 테이블 컬럼만, 입력 순서 보장 안 함, 없는 news_id는 빠짐)
+        시간창 이동처럼 '새로 들어온 기사'만 읽을 때 쓴다.
+        """
+        names = [c for c in ARTICLE_COLUMNS if columns is None or c in columns]
+        if "news_id" not in names:
+            names = ["news_id"] + names
+        rows = []
+        news_ids = [str(i) for i in news_ids]
+        for start in range(0, len(news_ids), chunksize):
+            chunk = news_ids[start:start + chunksize]
+            sql = (
+                f"SELECT {', '.join(names)} FROM articles "
+                f"WHERE archive = ? AND news_id IN ({','.join('?' * len(chunk))})"
+            )
+            with self._lock:
+                rows.extend(self._conn.execute(sql, [archive, *chunk]).fetchall())
+        return pd.DataFrame(rows, columns=names)
+
+    def iter_chunks(self, archive: str, keyword: Optional[str] = None, columns: Optional[List[str]] = None,
+                    chunksize: int = 50000):
+        """archive(키워드) 전체를 chunksize건씩 추가 순서대로 (rowid 기준 페이지, 정렬 없음)"""
+        select, names, wanted = self._select_columns(columns)
+        where, params = ["k.archive = ?"], [archive]
+        if keyword is not None:
+            where.append("k.search_keyword = ?")
+            params.append(keyword)
+        sql = (
+            f"SELECT k.rowid, {', '.join(select)} FROM article_keywords k "
+            f"JOIN articles a ON a.archive = k.archive AND a.news_id = k.news_id "
+            f"WHERE {' AND '.join(where)} AND k.rowid > ? ORDER BY k.rowid LIMIT ?"
+        )
+
+        last_rowid = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(sql, params + [last_rowid, int(chunksize)]).fetchall()
+            if not rows:
+                return
+            last_rowid = rows[-1][0]
+            yield self._to_frame([row[1:] for row in rows], names, wanted)
+
+    @staticmethod
+    def _select_columns(columns: Optional[List[str]]):
+        """조회 컬럼 → (SELECT 항목, 결과 컬럼명, 요청 컬럼). articles/article_keywords 밖의 컬럼은 extra JSON에서 꺼낸다."""
+        wanted = list(columns) if columns is not None else None
+        article_cols = [c for c in ARTICLE_COLUMNS if wanted is None or c in wanted]
+        keyword_cols = [c for c in KEYWORD_COLUMNS if wanted is None or c in wanted]
+        need_extra = wanted is None or any(c not in ARTICLE_COLUMNS and c not in KEYWORD_COLUMNS for c in wanted)
+
+        select = [f"a.{c}" for c in article_cols] + [f"k.{c}" for c in keyword_cols]
+        if need_extra:
+            select.append("k.extra")
+        return select, article_cols + keyword_cols + (["extra"] if need_extra else []), wanted
+
+    @staticmethod
+    def _to_frame(rows, names: List[str], wanted: Optional[List[str]]) -> pd.DataFrame:
+        df = pd.DataFrame(rows, columns=names)
+        if "extra" in names:
+            extras = pd.DataFrame([json.loads(x) if x else {} for x in df.pop("extra")], index=df.index)
+            df = pd.concat([df, extras], axis=1)
+        if wanted is not None:
+            df = df[[c for c in wanted if c in df.columns]]
+        return df
+
+    def count(self, archive: str, keyword: Optional[str] = None) -> int:
+        sql, params = "SELECT COUNT(*) FROM article_keywords WHERE archive = ?", [archive]
+        if keyword is not None:
+            sql += " AND search_keyword = ?"
+            params.append(keyword)
+        with self._lock:
+            return self._conn.execute(sql, params).fetchone()[0]
+
+    def version(self, archive: str, keyword: Optional[str] = None) -> str:
+        """저장 상태 식별값 (매핑 건수 + 마지막 rowid)"""
+        sql, params = "SELECT COUNT(*), MAX(rowid) FROM article_keywords WHERE archive = ?", [archive]
+        if keyword is not None:
+            sql += " AND search_keyword = ?"
+            params.append(keyword)
+        with self._lock:
+            count, last_rowid = self._conn.execute(sql, params).fetchone()
+        return f"sqlite:{count}:{last_rowid}"
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class SqliteArchive:
+    """NewsRepository용 키워드 아카이브 뷰 (archive_backends의 CsvArchive / ParquetArchive와 같은 인터페이스)"""
+
+    def __init__(self, store: ArticleStore, archive: str, keyword: str, csv_path: Optional[str] = None, reorder=None):
+        self.store = store
+        self.archive = archive
+        self.keyword = keyword
+        self.csv_path = csv_path
+        self.reorder = reorder
+
+        # 처음 사용할 때 같은 이름의 기존 CSV가 있으면 한 번 가져온다.
+        if csv_path and os.path.exists(csv_path) and not self.exists():
+            print(f"[Archive] 기존 CSV를 SQLite로 가져옵니다: {csv_path}")
+            self.append(pd.read_csv(csv_path))
+
+    def exists(self) -> bool:
+        return self.store.count(self.archive, self.keyword) > 0
+
+    def version(self) -> str:
+        return self.store.version(self.archive, self.keyword)
+
+    def read(self, columns: Optional[List[str]] = None, limit: Optional[int] = None) -> pd.DataFrame:
+        return self.store.query(self.archive, keyword=self.keyword, columns=columns, limit=limit)
+
+    def iter_chunks(self, chunksize: int, columns: Optional[List[str]] = None):
+        return self.store.iter_chunks(self.archive, keyword=self.keyword, columns=columns, chunksize=chunksize)
+
+    def append(self, df_new: pd.DataFrame):
+        self.store.append(self.archive, df_new, keyword=self.keyword)
+
+    def export_csv(self, path: Optional[str] = None):
+        path = path or self.csv_path
+        if path and self.exists():
+            df = self.read()
+            if self.reorder:
+                df = self.reorder(df)
+            _save_csv(df, path)
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+def get_article_store(path: str) -> ArticleStore:
+    """경로별 프로세스 공유 ArticleStore (연결 1개를 락으로 직렬화)"""
+    key = os.path.abspath(path)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = ArticleStore(path)
+        return _stores[key]
+
+
+def load_canonical_archive(backend: str, csv_path: str, store_path: str, since=None, until=None,
+                           columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    스크립트용 canonical 기사 로드
+    - sqlite: 저장소에서 pubDate 구간(since ~ until)만 인덱스로 조회
+    - 그 외: canonical_archive.csv를 읽어 같은 조건으로 거른다.
+      구간이 있으면 CSV_WINDOW_CHUNK_ROWS건씩 읽어 구간 안 행만 남긴다. (메모리는 구간 크기에 비례)
+      columns에 pubDate가 없어도 구간 판정에는 pubDate를 읽는다.
+    """
+    if backend == "sqlite":
+        return get_article_store(store_path).query(ARCHIVE_CANONICAL, since=since, until=until, columns=columns)
+
+    usecols = None if columns is None else (lambda c: c in columns or c == "pubDate")
+    if since is None and until is None:
+        df = pd.read_csv(csv_path, usecols=usecols)
+    else:
+        since_utc = None if since is None else pd.Timestamp(_to_epoch(since), unit="s", tz="UTC")
+        until_utc = None if until is None else pd.Timestamp(_to_epoch(until), unit="s", tz="UTC")
+        parts = []
+        for chunk in pd.read_csv(csv_path, usecols=usecols, chunksize=CSV_WINDOW_CHUNK_ROWS):
+            if "pubDate" not in chunk.columns:
+                parts.append(chunk)
+                continue
+            pub = pubdate_sort_key(chunk["pubDate"])
+            mask = pd.Series(True, index=chunk.index)
+            if since_utc is not None:
+                mask &= pub >= since_utc
+            if until_utc is not None:
+                mask &= pub <= until_utc
+            parts.append(chunk[mask])
+        if parts:
+            df = pd.concat(parts, ignore_index=True)
+        else:
+            df = pd.read_csv(csv_path, usecols=usecols, nrows=0)
+    if columns is not None:
+        df = df[[c for c in df.columns if c in columns]]
+    return df
@@ -1,8 +1,8 @@
 # base_client.py
 # A base API client class for making HTTP requests and parsing XML responses.
 
-import requests
 from bs4 import BeautifulSoup
+from api.http_session import get_shared_session
 
 class BaseAPIClient:
     def __init__(self, api_name, api_key, base_url, url_delimiter):
@@ -31,6 +31,6 @@ class BaseAPIClient:
         return url
     
     def get_xml(self, url, **kwargs):
-        r = requests.get(url, params=kwargs, timeout=10)
+        r = get_shared_session().get(url, params=kwargs, timeout=10)
         r.raise_for_status()
         return BeautifulSoup(r.text, "xml")
\ No newline at end of file
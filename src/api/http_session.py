@@ -0,0 +1,187 @@
+# http_session.py
+# 모든 외부 HTTP 호출(네이버 API, 기사 본문, XML API)이 공유하는 연결 풀 세션
+# 실행(로컬 스텁 서버로 연결 재사용 확인): python -m api.http_session
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from config import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_MAX_RETRIES,
+    HTTP_BACKOFF_FACTOR,
+    HTTP_TIMEOUT,
+)
+
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class HTTPSessionStats:
+    """연결 재사용 여부를 확인하기 위한 카운터 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0           # 세션으로 보낸 요청 수 (재시도 제외)
+        self.checkouts = 0          # 풀에서 연결을 꺼낸 횟수 (재시도 포함)
+        self.new_connections = 0    # 새로 연 TCP/TLS 연결 수
+        self.retries = 0            # 429/5xx/연결 오류로 재시도한 횟수
+
+    def incr(self, name: str):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    @property
+    def reused_connections(self) -> int:
+        return self.checkouts - self.new_connections
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "checkouts": self.checkouts,
+                "new_connections": self.new_connections,
+                "reused_connections": self.checkouts - self.new_connections,
+                "retries": self.retries,
+            }
+
+
+def _counting_pool_class(base, stats: HTTPSessionStats):
+    """urllib3 커넥션 풀을 감싸 연결 생성/사용 횟수를 센다."""
+
+    class CountingPool(base):
+        def _get_conn(self, timeout=None):
+            stats.incr("checkouts")
+            return super()._get_conn(timeout=timeout)
+
+        def _new_conn(self):
+            stats.incr("new_connections")
+            return super()._new_conn()
+
+    CountingPool.__name__ = f"Counting{base.__name__}"
+    return CountingPool
+
+
+class CountingRetry(Retry):
+    """재시도가 일어날 때마다 stats.retries를 올린다."""
+
+    stats: Optional[HTTPSessionStats] = None
+
+    def increment(self, *args, **kwargs):
+        if self.stats is not None:
+            self.stats.incr("retries")
+        new_retry = super().increment(*args, **kwargs)
+        new_retry.stats = self.stats
+        return new_retry
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """
+    - 호스트별 keep-alive 연결 풀 (pool_maxsize개까지 동시 사용)
+    - 429/5xx 및 연결 오류 시 지수 backoff 재시도 (Retry-After 헤더 존중)
+    - timeout 미지정 요청에 기본 timeout 적용
+    """
+
+    def __init__(self, stats: HTTPSessionStats, timeout: float, pool_connections: int, pool_maxsize: int,
+                 max_retries: int, backoff_factor: float):
+        self.stats = stats
+        self.default_timeout = timeout
+
+        retry = CountingRetry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,  # 재시도 소진 시 마지막 응답을 그대로 반환 (호출 측이 status_code로 판단)
+        )
+        retry.stats = stats
+
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self.stats),
+            "https": _counting_pool_class(HTTPSConnectionPool, self.stats),
+        }
+
+    def send(self, request, timeout=None, **kwargs):
+        self.stats.incr("requests")
+        if timeout is None:
+            timeout = self.default_timeout
+        return super().send(request, timeout=timeout, **kwargs)
+
+
+def create_session(
+    timeout: float = HTTP_TIMEOUT,
+    pool_connections: int = HTTP_POOL_CONNECTIONS,
+    pool_maxsize: int = HTTP_POOL_MAXSIZE,
+    max_retries: int = HTTP_MAX_RETRIES,
+    backoff_factor: float = HTTP_BACKOFF_FACTOR,
+) -> requests.Session:
+    """풀링/재시도/기본 timeout이 적용된 새 세션. session.stats로 카운터를 확인할 수 있다."""
+    stats = HTTPSessionStats()
+    adapter = PooledHTTPAdapter(
+        stats,
+        timeout=timeout,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries,
+        backoff_factor=backoff_factor,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.stats = stats
+    return session
+
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+def get_shared_session() -> requests.Session:
+    """프로세스 전체가 공유하는 세션 (NaverNewsClient, SingleNewsScraper, BaseAPIClient)"""
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = create_session()
+        return _shared_session
+
+
+if __name__ == "__main__":
+    # 로컬 스텁 서버로 연결 재사용 / 재시도 동작 확인
+    from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+        hits = 0
+
+        def do_GET(self):
+            StubHandler.hits += 1
+            # /flaky 는 처음 한 번 503을 돌려준다.
+            status = 503 if self.path == "/flaky" and StubHandler.hits % 2 == 1 else 200
+            body = b"ok"
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    session = create_session(backoff_factor=0.01)
+    for _ in range(20):
+        session.get(f"{base}/ok")
+    session.get(f"{base}/flaky")
+
+    print(session.stats.snapshot())
+    server.shutdown()
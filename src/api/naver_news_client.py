@@ -1,7 +1,5 @@
 # naver_news_client.py
-import json
-import urllib.request
-import urllib.parse
+from api.http_session import get_shared_session
 from models.news_article_model import NewsArticleModel
 from utils.text_normalizer import normalize_html_text
 
@@ -13,45 +11,45 @@ class NaverNewsClient:
     - API → list[dict] 반환만 담당
     """
 
+    API_URL = "https://openapi.naver.com/v1/search/news.json"
+
     def __init__(self, client_id, client_secret):
         self.client_id = client_id
         self.client_secret = client_secret
+        # 페이지마다 연결을 새로 열지 않도록 공유 keep-alive 세션 사용
+        self.session = get_shared_session()
 
     def fetch_news(self, keyword, start=1, display=100):
-        encText = urllib.parse.quote(keyword)
-        url = (
-            f"https://openapi.naver.com/v1/search/news.json"
-            f"?query={encText}&display={display}&start={start}&sort=date"
-        )
-
-        request = urllib.request.Request(url)
-        request.add_header("X-Naver-Client-Id", self.client_id)
-        request.add_header("X-Naver-Client-Secret", self.client_secret)
+        params = {"query": keyword, "display": display, "start": start, "sort": "date"}
+        headers = {
+            "X-Naver-Client-Id": self.client_id,
+            "X-Naver-Client-Secret": self.client_secret,
+        }
 
         try:
-            with urllib.request.urlopen(request) as response:
-                if response.getcode() != 200:
-                    return []
+            response = self.session.get(self.API_URL, params=params, headers=headers)
+            if response.status_code != 200:
+                return []
 
-                data = json.loads(response.read().decode("utf-8"))
-                items = data.get("items", [])
+            data = response.json()
+            items = data.get("items", [])
 
-                # --- NewsArticleModel 적용 구간 ---
-                processed_items = []
-                for item in items:
-                    # 1. 모델 객체 생성 (이 시점에 news_id 자동 생성 및 검증 발생)
-                    article_obj = NewsArticleModel(
-                        search_keyword=keyword,
-                        title=normalize_html_text(item.get('title', '')),
-                        description=normalize_html_text(item.get('description', '')),
-                        link=item.get('link', ''),
-                        originallink=item.get('originallink', ''),
-                        pubDate=item.get('pubDate', '')
-                    )
-                    # 2. 다시 딕셔너리로 변환하여 리스트에 추가 (to_dict 활용)
-                    processed_items.append(article_obj.to_dict())
-                
-                return processed_items
+            # --- NewsArticleModel 적용 구간 ---
+            processed_items = []
+            for item in items:
+                # 1. 모델 객체 생성 (이 시점에 news_id 자동 생성 및 검증 발생)
+                article_obj = NewsArticleModel(
+                    search_keyword=keyword,
+                    title=normalize_html_text(item.get('title', '')),
+                    description=normalize_html_text(item.get('description', '')),
+                    link=item.get('link', ''),
+                    originallink=item.get('originallink', ''),
+                    pubDate=item.get('pubDate', '')
+                )
+                # 2. 다시 딕셔너리로 변환하여 리스트에 추가 (to_dict 활용)
+                processed_items.append(article_obj.to_dict())
+            
+            return processed_items
         except Exception as e:
             print(f"   [API Error] {e}")
             return []
@@ -0,0 +1,156 @@
+# news_id_index.py
+
+import hashlib
+import os
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+
+def news_ids_of(df: pd.DataFrame) -> pd.Series:
+    """news_id 컬럼, 없으면 NewsArticleModel과 같은 방식(link md5 앞 12자리)으로 계산"""
+    if "news_id" in df.columns:
+        return df["news_id"].astype(str)
+    return df["link"].astype(str).map(lambda link: hashlib.md5(link.encode()).hexdigest()[:12])
+
+
+def news_ids_to_uint64(news_ids: Iterable[str]) -> np.ndarray:
+    """12자리 16진수 news_id → uint64 (형식이 다른 값은 md5로 다시 해싱, 이미 변환된 uint64 배열은 그대로)"""
+    if isinstance(news_ids, np.ndarray) and news_ids.dtype == np.uint64:
+        return news_ids
+    out = []
+    for news_id in news_ids:
+        try:
+            out.append(int(news_id, 16))
+        except (TypeError, ValueError):
+            out.append(int(hashlib.md5(str(news_id).encode()).hexdigest()[:12], 16))
+    return np.asarray(out, dtype=np.uint64)
+
+
+class NewsIdIndex:
+    """
+    키워드 아카이브별 news_id 멤버십 인덱스 ("이미 저장된 기사인가?")
+
+    - 전체 이력의 news_id를 정렬된 uint64 배열로 보관하고 np.searchsorted로 한 번에 조회한다.
+    - bloom=True면 Bloom filter를 앞에 두어 처음 보는 기사(대부분)는 배열 탐색 없이 바로 걸러낸다.
+    - 파일(<archive>_ids.npz)은 임시 파일에 쓴 뒤 os.replace로 교체한다. (중간에 끊겨도 이전 상태 유지)
+    - version: 인덱스를 마지막으로 맞춘 아카이브 상태. 아카이브와 다르면 호출 측이 rebuild 한다.
+    """
+
+    BLOOM_BITS_PER_ITEM = 10    # 오탐률 약 1% (k=7)
+    BLOOM_HASHES = 7
+    BLOOM_MIN_BITS = 1 << 16
+    # 64비트 곱셈 해시 상수 (홀수)
+    _BLOOM_MULTIPLIERS = np.array([
+        0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0xD6E8FEB86659FD93,
+        0xFF51AFD7ED558CCD, 0xC4CEB9FE1A85EC53, 0x94D049BB133111EB,
+    ], dtype=np.uint64)
+
+    def __init__(self, path: str, bloom: bool = True):
+        self.path = path
+        self.use_bloom = bloom
+        self.ids = np.empty(0, dtype=np.uint64)
+        self.bloom = None
+        self.version = None
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                self.ids = data["ids"].astype(np.uint64, copy=False)
+                self.version = str(data["version"])
+                self.bloom = data["bloom"] if self.use_bloom and "bloom" in data.files else None
+        except Exception as e:
+            print(f"[NewsIdIndex] 인덱스 로드 실패, 재생성 필요: {self.path} ({e})")
+            self.ids = np.empty(0, dtype=np.uint64)
+            self.version = None
+            self.bloom = None
+
+        if self.use_bloom and self.bloom is None and len(self.ids):
+            self.bloom = self._build_bloom(self.ids)
+
+    # ---------------------------------------------------------
+    # Bloom filter
+    # ---------------------------------------------------------
+    def _bloom_positions(self, values: np.ndarray, n_bits: int) -> np.ndarray:
+        """(len(values), k) 비트 위치. news_id는 md5 일부라 이미 고르게 퍼져 있어 곱셈 해시로 충분하다."""
+        with np.errstate(over="ignore"):
+            mixed = values[:, None] * self._BLOOM_MULTIPLIERS[None, :self.BLOOM_HASHES]
+        return (mixed >> np.uint64(20)) % np.uint64(n_bits)
+
+    def _build_bloom(self, ids: np.ndarray) -> np.ndarray:
+        # 다음 몇 번의 추가를 감당하도록 현재 건수의 2배 기준으로 크기를 잡는다.
+        n_bits = max(self.BLOOM_MIN_BITS, 2 * len(ids) * self.BLOOM_BITS_PER_ITEM)
+        n_bits = (n_bits + 7) // 8 * 8
+        bits = np.zeros(n_bits, dtype=bool)
+        if len(ids):
+            bits[self._bloom_positions(ids, n_bits).ravel().astype(np.int64)] = True
+        return np.packbits(bits)
+
+    def _bloom_maybe_contains(self, values: np.ndarray) -> np.ndarray:
+        n_bits = len(self.bloom) * 8
+        positions = self._bloom_positions(values, n_bits).astype(np.int64)
+        bytes_ = self.bloom[positions >> 3]
+        hits = (bytes_ >> (7 - (positions & 7)).astype(np.uint8)) & 1
+        return hits.all(axis=1)
+
+    # ---------------------------------------------------------
+    # 조회 / 갱신
+    # ---------------------------------------------------------
+    def contains(self, news_ids: Iterable[str]) -> np.ndarray:
+        """news_id별 기존 등록 여부 (bool 배열, 입력 순서)"""
+        values = news_ids_to_uint64(news_ids)
+        found = np.zeros(len(values), dtype=bool)
+        if len(values) == 0 or len(self.ids) == 0:
+            return found
+
+        candidates = np.arange(len(values))
+        if self.bloom is not None:
+            candidates = candidates[self._bloom_maybe_contains(values)]
+
+        if len(candidates):
+            probe = values[candidates]
+            pos = np.searchsorted(self.ids, probe)
+            pos[pos == len(self.ids)] = 0
+            found[candidates] = self.ids[pos] == probe
+        return found
+
+    def add(self, news_ids: Iterable[str], version: str):
+        """news_id 추가 후 저장 (정렬 병합)"""
+        added = np.setdiff1d(news_ids_to_uint64(news_ids), self.ids)
+        merged = np.union1d(self.ids, added)
+        self._replace(merged, version, added=added)
+
+    def rebuild(self, news_ids: Iterable[str], version: str):
+        """아카이브 전체 news_id로 인덱스를 새로 만든다."""
+        self.bloom = None
+        self._replace(np.unique(news_ids_to_uint64(news_ids)), version)
+
+    def _replace(self, ids: np.ndarray, version: str, added: np.ndarray = None):
+        bloom = None
+        if self.use_bloom:
+            capacity = len(self.bloom) * 8 // self.BLOOM_BITS_PER_ITEM if self.bloom is not None else 0
+            if added is not None and self.bloom is not None and len(ids) <= capacity:
+                # 여유가 있으면 새 항목의 비트만 켠다.
+                bits = np.unpackbits(self.bloom)
+                if len(added):
+                    bits[self._bloom_positions(added, len(bits)).ravel().astype(np.int64)] = True
+                bloom = np.packbits(bits)
+            else:
+                bloom = self._build_bloom(ids)
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp.npz"
+        arrays = {"ids": ids, "version": np.array(version)}
+        if bloom is not None:
+            arrays["bloom"] = bloom
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, self.path)
+
+        self.ids, self.bloom, self.version = ids, bloom, version
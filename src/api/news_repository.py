@@ -2,6 +2,8 @@
 
 import os
 import pandas as pd
+from api.archive_backends import open_archive, sort_by_pubdate
+from api.news_id_index import NewsIdIndex, news_ids_of
 
 class NewsRepository:
     """
@@ -11,7 +13,8 @@ class NewsRepository:
     - 증분(Incremental) 체크 및 키워드별 경로 관리 담당
     """
 
-    def __init__(self, keyword: str, base_path: str = "archive"):
+    def __init__(self, keyword: str, base_path: str = "archive", backend: str = "csv", export_csv: bool = False,
+                 id_index_bloom: bool = True, store_path: str = None):
         self.keyword = keyword
         # 키워드별 전용 디렉토리 설정 (예: archive/우원식/)
         self.dir_path = os.path.join(base_path, keyword)
@@ -22,8 +25,16 @@ class NewsRepository:
         self.selected_archive_path = os.path.join(self.dir_path, "selected_archive.csv")
         self.selected_archive_copy_path = os.path.join(self.dir_path, "selected_archive_copy.csv")
 
-        # 중복 체크 시 비교할 최근 기사 수
-        self.lookback_limit = 2000
+        # 저장 방식 (api/archive_backends.py). parquet/sqlite면 export_csv=True일 때만 위 CSV를 함께 갱신한다.
+        # store_path: sqlite 저장소 파일 (기본: <base_path>/articles.sqlite)
+        self.backend = backend
+        self.export_csv = export_csv
+        self.raw_archive = open_archive(backend, self.raw_archive_path, store_path=store_path)
+        self.selected_archive = open_archive(backend, self.selected_archive_path, reorder=self._reorder_columns, store_path=store_path)
+
+        # 증분 체크용 news_id 인덱스 (전체 이력 기준, api/news_id_index.py)
+        self.raw_index = self._open_index(self.raw_archive, self.raw_archive_path, id_index_bloom)
+        self.selected_index = self._open_index(self.selected_archive, self.selected_archive_path, id_index_bloom)
 
     # ---------------------------------------------------------
     # 1. Raw Archive 관리 (원본 뉴스 누적)
@@ -38,19 +49,16 @@ class NewsRepository:
         df_fetched = pd.DataFrame(fetched_items)
         
         # 1. 기존 데이터가 없으면 바로 저장하고 반환 (코드 압축)
-        if not os.path.exists(self.raw_archive_path):
-            self._finalize_and_save(df_fetched, self.raw_archive_path)
+        if not self.raw_archive.exists():
+            self._append(self.raw_archive, df_fetched, self.raw_archive_path)
             return df_fetched
 
-        # 2. 기존 데이터가 있는 경우: 증분 체크 및 병합
-        df_old = pd.read_csv(self.raw_archive_path, usecols=["link"]).head(self.lookback_limit)
-        df_new_only = df_fetched[~df_fetched["link"].isin(df_old["link"])].copy()
+        # 2. 기존 데이터가 있는 경우: 전체 이력 news_id 인덱스로 증분 체크 후 신규분만 추가
+        seen = self.raw_index.contains(news_ids_of(df_fetched))
+        df_new_only = df_fetched[~seen].copy()
 
-        # 전체 로드 후 병합 및 정렬 (가장 안전한 방식)
         if not df_new_only.empty:
-            full_raw = pd.read_csv(self.raw_archive_path)
-            updated_raw = pd.concat([df_new_only, full_raw], ignore_index=True)
-            self._finalize_and_save(updated_raw, self.raw_archive_path)
+            self._append(self.raw_archive, df_new_only, self.raw_archive_path)
                         
         return df_new_only
 
@@ -60,36 +68,39 @@ class NewsRepository:
     def merge_final_incremental(self, df_final: pd.DataFrame) -> int:
         if df_final.empty: return 0
 
-        # 기존 데이터 로드 및 증분 필터링
-        if os.path.exists(self.selected_archive_path):
-            df_old = pd.read_csv(self.selected_archive_path)
-            incremental = df_final[~df_final["link"].isin(df_old.head(self.lookback_limit)["link"])].copy()
+        # 기존 데이터(전체 이력 news_id 인덱스)와 증분 필터링
+        if self.selected_archive.exists():
+            seen = self.selected_index.contains(news_ids_of(df_final))
+            incremental = df_final[~seen].copy()
             if incremental.empty: return 0
-            df_total = pd.concat([incremental, df_old], ignore_index=True)
         else:
-            df_total = df_final
             incremental = df_final
 
         # 공통 저장 로직 호출
-        self._finalize_and_save(df_total, self.selected_archive_path, reorder=True)
+        self._append(self.selected_archive, incremental, self.selected_archive_path)
 
-        # ✅ selected_archive_copy.csv 저장
-        self._save_copy_selected(df_total)
+        # ✅ selected_archive_copy.csv 저장 (CSV 출력물이므로 csv 방식이거나 CSV 내보내기를 켠 경우만)
+        if self.backend == "csv" or self.export_csv:
+            self._save_copy_selected()
 
         return len(incremental)
 
+    def load_selected(self) -> pd.DataFrame:
+        """selected_archive 전체 (pubDate 내림차순)"""
+        return self.selected_archive.read()
+
     # ---------------------------------------------------------
     # 3. 유틸리티 메서드
     # ---------------------------------------------------------
     def get_last_pubdate(self, target='raw'):
         """저장된 기사 중 가장 최신 날짜 반환 (raw 또는 final 선택 가능)"""
-        path = self.raw_archive_path if target == 'raw' else self.selected_archive_path
+        archive = self.raw_archive if target == 'raw' else self.selected_archive
         
-        if not os.path.exists(path):
+        if not archive.exists():
             return None
 
         try:
-            df = pd.read_csv(path, usecols=["pubDate"])
+            df = archive.read(columns=["pubDate"])
             if df.empty: return None
             
             pub_dates = pd.to_datetime(df["pubDate"], errors="coerce")
@@ -111,21 +122,29 @@ class NewsRepository:
          
         return df[existing_cols + remaining_cols]                    
     
-    def _finalize_and_save(self, df: pd.DataFrame, path: str, reorder: bool = False):
-        """정렬, (선택적) 순서 재배치 후 CSV 저장"""
-        df = self._sort(df)
-        if reorder:
-            df = self._reorder_columns(df)
-
-        #df.to_csv(path, index=False, encoding='utf-8-sig')를 아래로 대체        
-        from utils.dataframe_utils import raw_df_save        
-        raw_df_save(df, path)        
-
-    def _save_copy_selected(self, df: pd.DataFrame):
+    def _open_index(self, archive, csv_path: str, bloom: bool) -> NewsIdIndex:
+        """인덱스를 열고, 아카이브와 상태가 다르면(최초 사용, 기록 도중 중단, 수동 편집) 전체 이력으로 다시 만든다."""
+        index = NewsIdIndex(os.path.splitext(csv_path)[0] + "_ids.npz", bloom=bloom)
+        version = archive.version()
+        if index.version != version:
+            df_ids = archive.read(columns=["news_id", "link"])
+            index.rebuild(news_ids_of(df_ids) if not df_ids.empty else [], version)
+        return index
+
+    def _append(self, archive, df_new: pd.DataFrame, csv_path: str):
+        """신규 행 저장 (csv: 전체 병합/정렬 후 재작성, parquet: 파티션 추가) + 인덱스 갱신 + 선택적 CSV 내보내기"""
+        archive.append(df_new)
+        index = self.raw_index if archive is self.raw_archive else self.selected_index
+        index.add(news_ids_of(df_new), archive.version())
+        if self.export_csv:
+            archive.export_csv(csv_path)
+
+    def _save_copy_selected(self):
         """
         사람이 빠르게 훑기 위한 요약본
         """
         copy_cols = ["news_id", "pubDate", "title", "description"]
+        df = self.selected_archive.read(columns=copy_cols)
         existing = [c for c in copy_cols if c in df.columns]
 
         if not existing:
@@ -142,11 +161,4 @@ class NewsRepository:
 
 
     def _sort(self, df: pd.DataFrame) -> pd.DataFrame:
-        if df.empty:
-            return df
-        df = df.copy()
-        temp_dt = pd.to_datetime(df["pubDate"], errors="coerce")
-        df["_sort_pubDate"] = temp_dt
-        df = df.sort_values("_sort_pubDate", ascending=False, na_position="last")
-        return df.drop(columns=["_sort_pubDate"])
-    
\ No newline at end of file
+        return sort_by_pubdate(df)
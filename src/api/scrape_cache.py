@@ -0,0 +1,110 @@
+# scrape_cache.py
+
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Tuple
+
+
+class ScrapeCache:
+    """
+    기사 본문 스크래핑 결과 캐시 (news_id 기준, SQLite)
+
+    - news_id는 link의 md5 앞 12자리이므로 같은 기사 링크면 키워드가 달라도 같은 키가 된다.
+      → 여러 키워드에서 겹치는 기사는 한 번만 다운로드한다.
+    - 정규화가 끝난 본문(normalize_html_text 적용 후)을 저장한다.
+    - ttl_hours가 지난 항목은 조회되지 않으며 정리 시 삭제된다.
+    - max_entries를 넘으면 가장 오래 조회되지 않은 항목부터 삭제한다. (LRU)
+    - 빈 본문(수집 실패)은 저장하지 않는다. 다음 실행에서 다시 시도하기 위함.
+    """
+
+    def __init__(self, path: str, ttl_hours: float = 72, max_entries: int = 50000):
+        self.path = path
+        self.ttl_seconds = ttl_hours * 3600
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # 키워드 병렬 실행 시 여러 연결이 같은 파일을 쓰므로 WAL + busy timeout 사용
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS scrape_cache (
+                news_id     TEXT PRIMARY KEY,
+                content     TEXT NOT NULL,
+                fetched_at  REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_scrape_cache_last_access ON scrape_cache(last_access)")
+        self._conn.commit()
+
+    def get_many(self, news_ids: Iterable[str]) -> Dict[str, str]:
+        """TTL 이내 항목만 {news_id: content}로 반환하고 조회 시각을 갱신한다."""
+        ids = list(dict.fromkeys(str(x) for x in news_ids))
+        if not ids:
+            return {}
+
+        now = time.time()
+        min_fetched = now - self.ttl_seconds
+        found: Dict[str, str] = {}
+
+        with self._lock:
+            # SQLite 변수 개수 제한(기본 999)을 넘지 않도록 나눠서 조회
+            for start in range(0, len(ids), 500):
+                chunk = ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT news_id, content FROM scrape_cache "
+                    f"WHERE news_id IN ({placeholders}) AND fetched_at >= ?",
+                    (*chunk, min_fetched),
+                ).fetchall()
+                found.update(rows)
+
+            if found:
+                self._conn.executemany(
+                    "UPDATE scrape_cache SET last_access = ? WHERE news_id = ?",
+                    [(now, news_id) for news_id in found],
+                )
+                self._conn.commit()
+
+        return found
+
+    def put_many(self, items: List[Tuple[str, str]]):
+        """[(news_id, content)] 저장 후 TTL/용량 기준 정리"""
+        now = time.time()
+        rows = [(str(news_id), content, now, now) for news_id, content in items if content]
+        if not rows:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO scrape_cache (news_id, content, fetched_at, last_access) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+            self._evict(now)
+
+    def _evict(self, now: float):
+        self._conn.execute("DELETE FROM scrape_cache WHERE fetched_at < ?", (now - self.ttl_seconds,))
+
+        count = self._conn.execute("SELECT COUNT(*) FROM scrape_cache").fetchone()[0]
+        overflow = count - self.max_entries
+        if overflow > 0:
+            self._conn.execute(
+                "DELETE FROM scrape_cache WHERE news_id IN ("
+                "SELECT news_id FROM scrape_cache ORDER BY last_access ASC LIMIT ?)",
+                (overflow,),
+            )
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM scrape_cache").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
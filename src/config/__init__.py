@@ -77,9 +77,23 @@ GLOBAL_TITLE_THRESHOLD = 0.20
 GLOBAL_CONTENT_THRESHOLD = 0.19
 ######
 
+# GLOBAL 유사도 dedup 시간창 blocking (scripts/aggregator.py) — 기본 꺼짐 (None: 전체 기사끼리 비교)
+# 값 N을 주면 pubDate 기준 폭 N시간, N/2시간 간격으로 겹치는 시간창 안에서만 title/body를 비교하고,
+# 겹치는 구간을 통해 창 사이의 묶음을 union-find로 합친다.
+# 보장 범위: pubDate 차이가 N/2시간 이내인 쌍만 반드시 비교된다. (N/2 ~ N시간 쌍은 같은 창에 들 때만)
+#   그보다 멀리 떨어진 중복은 전체 비교와 달리 남을 수 있으므로, 실제 중복 기사 간 시간 차 분포를 확인하고
+#   그 상한의 2배 이상으로 설정한다. 예) 중복이 48시간 안에 모두 나온다면 96
+GLOBAL_BLOCK_WINDOW_HOURS = None
+
 PROBE_TITLE_THRESHOLD = 0.20
 PROBE_CONTENT_THRESHOLD = 0.20
 
+# ArticleSimilarityGrouper 그룹 번호 부여 방식
+# - "vectorized": 배열 기반 (운영용)
+# - "loop": 기존 Python 루프, 유사 쌍마다 출력 (검증/디버그용)
+# 두 방식의 title_id/body_id 결과는 동일해야 한다. (validators/check_similarity_assign_modes.py)
+SIMILARITY_ASSIGN_MODE = "vectorized"
+
 # SimHash 기반 near-duplicate 판별용 Hamming distance 임계값
 # - 이 값은 "의미 유사도"가 아니라 "거의 동일한 기사인지"를 판단하기 위한 기준이다.
 # - 값이 작을수록 매우 엄격하게 동일 기사만 제거한다.
@@ -98,22 +112,112 @@ PROBE_CONTENT_THRESHOLD = 0.20
 SIMHASH_TITLE_DISTANCE = 10
 SIMHASH_BODY_DISTANCE = 14
 
+# SimHash 지문 저장소(archive/<kw>/simhash_fingerprints.bin)에서 비교할 과거 기간(일)
+# 이 기간 안에 기록된 기사와 제목/본문이 모두 거의 같으면 STEP 6에서 제거된다.
+SIMHASH_HISTORY_DAYS = 3
+
 # [네이버 API 설정]
 NAVER_ID = os.getenv("NAVER_ID")
 NAVER_SECRET = os.getenv("NAVER_SECRET")
 
+# [HTTP 연결 설정] api/http_session.py 공유 세션
+# HTTP_POOL_MAXSIZE: 호스트별 동시 연결 수 상한 (SCRAPE_MAX_WORKERS × 병렬 키워드 수 이상 권장)
+# HTTP_MAX_RETRIES / HTTP_BACKOFF_FACTOR: 429/5xx/연결 오류 시 재시도 횟수와 backoff 간격(초, 지수 증가)
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 32
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_FACTOR = 0.5
+HTTP_TIMEOUT = 10
+
+# [본문 스크래핑 설정]
+# SCRAPE_MAX_WORKERS: 동시에 진행하는 본문 요청 수 (1이면 기존 순차 수집 + delay)
+# SCRAPE_MAX_RPS: 프로세스 전체에서 네이버로 보내는 초당 요청 수 상한
+SCRAPE_MAX_WORKERS = 8
+SCRAPE_MAX_RPS = 10
+
+# SCRAPE_HTML_ENGINE: 본문 추출 방식 ("lxml" 고속 / "bs4" 기존 BeautifulSoup 방식, 결과 텍스트 동일)
+# 비교/측정: python validators/check_html_extractor_parity.py
+SCRAPE_HTML_ENGINE = "lxml"
+
+# 본문 캐시 (news_id 기준, 키워드 간 중복 기사 재다운로드 방지)
+SCRAPE_CACHE_PATH = str(ARCHIVE_DIR / "scrape_cache.sqlite")
+SCRAPE_CACHE_TTL_HOURS = 72
+SCRAPE_CACHE_MAX_ENTRIES = 50000
+
 # [저장소 설정]
 # BASE_OUTPUT_PATH = "outputs" # 레거시
 
+# ARCHIVE_BACKEND: 키워드별 raw/selected 아카이브 저장 방식 (api/archive_backends.py)
+#   "csv"     : 매 실행 전체 CSV를 읽고 정렬해 다시 쓴다. (기존 방식)
+#   "parquet" : pubDate 날짜별 파티션 파일을 추가만 하고 manifest.json으로 관리 (처음 사용 시 기존 CSV를 가져옴)
+#   "sqlite"  : ARTICLE_STORE_PATH 하나에 모든 키워드/canonical 기사 저장 (news_id, pubDate, 키워드 인덱스, WAL)
+#               필터 탈락 로그(filtered_logs/)도 저장소에 쌓고, validators도 저장소의 canonical을 읽는다.
+# ARCHIVE_CSV_EXPORT: parquet 사용 시에도 raw_archive.csv / selected_archive.csv를 매 실행 함께 갱신할지 여부
+ARCHIVE_BACKEND = "parquet"
+ARCHIVE_CSV_EXPORT = False
+ARTICLE_STORE_PATH = str(ARCHIVE_DIR / "articles.sqlite")
+# NEWS_ID_INDEX_BLOOM: 증분 체크용 news_id 인덱스(<archive>_ids.npz) 앞에 Bloom filter를 둘지 여부
+NEWS_ID_INDEX_BLOOM = True
+
 # [수집에서 제외할 제목 단어]
 EXCLUDE_WORDS_STR = " 포토, 헤드라인, [사진], [영상], [화보], [그래픽], 톱뉴스, [오늘의 주요일정], [투데이 라인업], [프로필], [부고]"
 
 # 수집 주기
 AGGREGATE_PER_HOURS = 3
 
+# 전역 통합 증분 실행 (scripts/aggregator.py)
+# AGGREGATE_INCREMENTAL: True면 지난 실행(watermark) 이후 추가된 기사만 기존 canonical과 비교한다.
+#   상태 파일이 없거나 False면 기존처럼 전체 이력을 다시 계산한다.
+#   주의: 전체 계산과 결과(살아남는 기사)가 다를 수 있다. 기존 canonical이 신규 기사보다 항상 우선이고,
+#   TF-IDF도 윈도우 + 신규 기사로만 학습하기 때문이다. (같은 입력에서 canonical 수가 같아도 생존 기사가 달라짐)
+#   또 신규 canonical을 파일 끝에 이어 쓰므로 canonical_archive.csv는 pubDate 순으로 정렬되어 있지 않다.
+#   전체 계산과의 차이를 재기 전까지 기본은 False.
+# AGGREGATE_WINDOW_HOURS: 신규 기사와 비교할 기존 canonical의 pubDate 범위 (신규 기사 pubDate 앞뒤 N시간)
+AGGREGATE_INCREMENTAL = False
+AGGREGATE_WINDOW_HOURS = 72
+# AGGREGATE_STREAMING: 전체 계산을 메모리에 다 올리지 않고 청크 단위로 수행한다.
+#   키워드 아카이브를 AGGREGATE_CHUNK_ROWS건씩 읽어 pubDate 날짜별 임시 파일로 나눈 뒤,
+#   날짜 순서대로 증분 실행과 같은 규칙(윈도우 안의 먼저 확정된 canonical 우선)으로 처리해 결과를 이어 쓴다.
+#   False면 기존처럼 전체 이력을 한 번에 비교한다. (결과가 조금 다를 수 있음)
+AGGREGATE_STREAMING = False
+AGGREGATE_CHUNK_ROWS = 50000
+
+# 키워드 병렬 실행 (scripts/scheduler.py)
+# KEYWORD_MAX_WORKERS: 동시에 실행하는 키워드 파이프라인 수 (1이면 기존 순차 실행)
+# PIPELINE_CPU_SLOTS: SimHash/클러스터링(STEP 6~7)을 동시에 수행하는 키워드 수 상한
+#   → API 호출/본문 수집 구간은 겹쳐서 진행하고, CPU 구간만 이 수로 제한한다.
+KEYWORD_MAX_WORKERS = 4
+PIPELINE_CPU_SLOTS = 1
+
 # 파일 경로 지정
 OUTPUT_ROOT = str(ARCHIVE_DIR)
 CANONICAL_ARCHIVE_PATH = str(ARCHIVE_DIR / "aggregated" / "canonical_archive.csv")
+AGGREGATOR_STATE_PATH = str(ARCHIVE_DIR / "aggregated" / "aggregator_state.json")
+# 기사 임베딩 저장소 (embeddings/embedding_store.py, news_id × 모델 × 코퍼스 템플릿 버전별 float32 벡터)
+EMBEDDING_STORE_DIR = str(DATA_DIR / "embeddings")
+
+# [임베딩 서비스] embeddings/embedding_service.py — 모델을 메모리에 상주시켜 이슈 클러스터링/RAG/파이프라인이 공유
+# 실행: python -m src.embeddings.embedding_service
+# EMBEDDING_SERVICE_URL: 클라이언트(embeddings/embedding_client.py)가 먼저 요청할 주소
+#   서비스가 떠 있지 않으면 [WARN] 후 각 프로세스에서 모델을 직접 로드한다. None이면 서비스를 시도하지 않는다.
+# EMBEDDING_MAX_BATCH_SIZE / EMBEDDING_MAX_WAIT_MS: 동시에 들어온 요청을 모아 한 번에 인코딩할 최대 문장 수 / 최대 대기 시간
+# EMBEDDING_SERVICE_PRELOAD: 서비스 시작 시 미리 로드할 모델 (그 밖의 모델은 처음 요청될 때 로드)
+EMBEDDING_SERVICE_HOST = "127.0.0.1"
+EMBEDDING_SERVICE_PORT = 8765
+EMBEDDING_SERVICE_URL = f"http://{EMBEDDING_SERVICE_HOST}:{EMBEDDING_SERVICE_PORT}"
+EMBEDDING_SERVICE_TIMEOUT = 300
+EMBEDDING_MAX_BATCH_SIZE = 64
+EMBEDDING_MAX_WAIT_MS = 10
+EMBEDDING_SERVICE_PRELOAD = ["dragonkue/multilingual-e5-small-ko-v2"]
+# EMBEDDING_TOKEN_BUDGET: 한 번의 forward에 넣는 토큰 수 상한 (배치 건수 × 배치 안 최장 토큰 길이, 패딩 포함)
+#   토큰 길이순으로 묶어 짧은 기사는 한 배치에 많이, 긴 기사는 적게 넣는다. None이면 기존 batch_size 고정 방식
+# EMBEDDING_TOKEN_BATCH_MAX: 토큰 예산 방식에서 한 배치의 최대 건수
+# 비교/측정: python validators/check_embedding_batching.py
+#   기본은 꺼 둔다(None). 실제 모델(e5-small-ko-v2)로 위 점검을 돌려 처리량 이득과 벡터 일치(최소 cos ≥ 0.9999)를
+#   확인한 뒤에 켠다. CPU 1코어 스모크(e5-small 구조 무작위 가중치, 기사 2000건, 평균 56토큰)에서는
+#   4096: x1.14, 8192: x1.01, 16384: x0.89로 예산이 크면 오히려 느려졌다.
+EMBEDDING_TOKEN_BUDGET = None
+EMBEDDING_TOKEN_BATCH_MAX = 256
 
 IS_SAMPLE_RUN = False #실전모드
 #IS_SAMPLE_RUN = True #테스트모드
@@ -0,0 +1,147 @@
+# embedding_client.py
+# 임베딩 클라이언트 — 상주 임베딩 서비스(embedding_service.py)에 먼저 요청하고, 서비스가 없으면 프로세스 안에서 모델을 로드한다.
+
+import base64
+import threading
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import requests
+
+from .inference_backends import DEFAULT_BACKEND, load_sentence_transformer, validate_backend
+from .token_batching import encode_by_token_budget
+
+# 프로세스 안에서 로드한 모델 (서비스를 못 쓸 때만, (모델명, 백엔드)별 1회)
+_LOCAL_MODELS: Dict[tuple, object] = {}
+_LOCAL_LOCK = threading.Lock()
+
+
+def _local_model(model_name: str, backend: str = DEFAULT_BACKEND):
+    key = (model_name, backend)
+    with _LOCAL_LOCK:
+        if key not in _LOCAL_MODELS:
+            started = time.time()
+            _LOCAL_MODELS[key] = load_sentence_transformer(model_name, backend)
+            print(f"[EmbeddingClient] 로컬 모델 로드 완료: {model_name} [{backend}] ({time.time() - started:.1f}초)")
+        return _LOCAL_MODELS[key]
+
+
+def _release_local_model(model_name: str, backend: str = DEFAULT_BACKEND):
+    """서비스가 다시 살아나면 프로세스 안 모델을 내려놓는다. (다시 실패하면 그때 다시 로드)"""
+    with _LOCAL_LOCK:
+        if _LOCAL_MODELS.pop((model_name, backend), None) is not None:
+            print(f"[EmbeddingClient] 임베딩 서비스 복구, 로컬 모델 해제: {model_name} [{backend}]")
+
+
+class EmbeddingClient:
+    """
+    모델 하나에 대한 encode 창구
+
+    - service_url이 있으면 POST /encode로 보낸다. (요청당 REQUEST_TEXTS건씩 나눠 보내 타임아웃/메모리 부담을 줄임)
+    - 연결 실패/오류 응답이면 [WARN]을 찍고 로컬 모델로 인코딩한다. 서비스는 SERVICE_RETRY_SECONDS 뒤에 다시 시도하고,
+      연속 실패마다 대기를 두 배로 늘린다. (최대 SERVICE_RETRY_MAX_SECONDS)
+      서비스가 다시 응답하면 로컬 모델을 내려놓는다. (--live처럼 오래 도는 프로세스에서 서비스 재시작 대비)
+    - 반환값은 항상 (n, dim) float32. normalize=True면 L2 정규화된 벡터.
+    - token_budget이 있으면 로컬 인코딩을 토큰 예산 배치로 나눈다. (token_batching.py, batch_size는 무시)
+    - backend: 추론 방식 (inference_backends.py). 서비스에도 같은 백엔드로 요청한다.
+    """
+
+    REQUEST_TEXTS = 512
+    SERVICE_RETRY_SECONDS = 30
+    SERVICE_RETRY_MAX_SECONDS = 600
+
+    def __init__(
+        self,
+        model_name: str,
+        service_url: Optional[str] = None,
+        timeout: float = 300,
+        token_budget: Optional[int] = None,
+        max_batch_size: Optional[int] = None,
+        backend: str = DEFAULT_BACKEND,
+    ):
+        self.model_name = model_name
+        self.backend = validate_backend(backend)
+        self.service_url = service_url.rstrip("/") if service_url else None
+        self.timeout = timeout
+        self.token_budget = token_budget
+        self.max_batch_size = max_batch_size
+        self._session = requests.Session() if self.service_url else None
+        self._service_failures = 0
+        self._service_retry_at = 0.0   # time.monotonic() 기준, 이 시각 전에는 서비스를 건너뛴다.
+
+    def _encode_remote(self, texts: List[str], normalize: bool) -> np.ndarray:
+        parts = []
+        for start in range(0, len(texts), self.REQUEST_TEXTS):
+            chunk = texts[start:start + self.REQUEST_TEXTS]
+            res = self._session.post(
+                f"{self.service_url}/encode",
+                json={"model": self.model_name, "backend": self.backend, "texts": chunk, "normalize": normalize},
+                timeout=self.timeout,
+            )
+            if res.status_code != 200:
+                raise RuntimeError(f"HTTP {res.status_code}: {res.text[:200]}")
+            payload = res.json()
+            vectors = np.frombuffer(base64.b64decode(payload["data"]), dtype=np.float32)
+            parts.append(vectors.reshape(int(payload["n"]), int(payload["dim"])))
+        return np.concatenate(parts, axis=0)
+
+    def _encode_local(self, texts: List[str], normalize: bool, batch_size: int, show_progress_bar: bool) -> np.ndarray:
+        model = _local_model(self.model_name, self.backend)
+        if self.token_budget:
+            return encode_by_token_budget(
+                model, texts, self.token_budget, self.max_batch_size, normalize, show_progress_bar
+            )
+        vectors = model.encode(
+            texts,
+            batch_size=batch_size,
+            show_progress_bar=show_progress_bar,
+            normalize_embeddings=normalize,
+        )
+        return np.asarray(vectors, dtype=np.float32).reshape(len(texts), -1)
+
+    def encode(
+        self,
+        texts: List[str],
+        normalize: bool = True,
+        batch_size: int = 32,
+        show_progress_bar: bool = False,
+    ) -> np.ndarray:
+        texts = [str(t) for t in texts]
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        if self.service_url and time.monotonic() >= self._service_retry_at:
+            try:
+                vectors = self._encode_remote(texts, normalize)
+            except Exception as e:
+                self._service_failures += 1
+                wait = min(self.SERVICE_RETRY_SECONDS * 2 ** (self._service_failures - 1), self.SERVICE_RETRY_MAX_SECONDS)
+                self._service_retry_at = time.monotonic() + wait
+                print(f"[WARN] 임베딩 서비스 사용 불가, 로컬 모델로 진행합니다: {self.service_url} ({e}) "
+                      f"— {wait:.0f}초 뒤 다시 시도")
+            else:
+                if self._service_failures:
+                    self._service_failures = 0
+                    _release_local_model(self.model_name, self.backend)
+                return vectors
+
+        return self._encode_local(texts, normalize, batch_size, show_progress_bar)
+
+
+_CLIENTS: Dict[tuple, EmbeddingClient] = {}
+
+
+def get_embedding_client(
+    model_name: str,
+    service_url: Optional[str] = None,
+    timeout: float = 300,
+    token_budget: Optional[int] = None,
+    max_batch_size: Optional[int] = None,
+    backend: str = DEFAULT_BACKEND,
+) -> EmbeddingClient:
+    """(모델, 서비스 주소, 배치 방식, 백엔드)별로 하나씩 재사용하는 클라이언트"""
+    key = (model_name, service_url, token_budget, max_batch_size, backend)
+    if key not in _CLIENTS:
+        _CLIENTS[key] = EmbeddingClient(model_name, service_url, timeout, token_budget, max_batch_size, backend)
+    return _CLIENTS[key]
@@ -0,0 +1,340 @@
+# src/embeddings/embedding_service.py
+# 상주 임베딩 서비스 — SentenceTransformer 모델을 한 번만 로드해 두고 여러 작업(이슈 클러스터링, RAG, 파이프라인)이 HTTP로 공유한다.
+# 실행: python -m src.embeddings.embedding_service [--port 8765] [--model dragonkue/multilingual-e5-small-ko-v2]
+#
+# POST /encode   {"model": str, "backend": "torch"|"onnx"|"torch-int8", "texts": [str], "normalize": bool}
+#                → {"model", "n", "dim", "dtype": "float32", "data": base64(float32 row-major)}
+# GET  /metrics  배치 단위 지연/처리량 (JSON)
+# GET  /health   로드된 모델 목록
+
+import argparse
+import base64
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import (
+    EMBEDDING_SERVICE_HOST,
+    EMBEDDING_SERVICE_PORT,
+    EMBEDDING_SERVICE_PRELOAD,
+    EMBEDDING_MAX_BATCH_SIZE,
+    EMBEDDING_MAX_WAIT_MS,
+    EMBEDDING_TOKEN_BUDGET,
+)
+from .inference_backends import DEFAULT_BACKEND, EMBEDDING_BACKENDS, load_sentence_transformer, validate_backend
+from .token_batching import encode_by_token_budget
+
+
+class EmbeddingServiceMetrics:
+    """배치 단위 지연/처리량 카운터 (스레드 안전)"""
+
+    RECENT_BATCHES = 1000   # 백분위 계산에 쓰는 최근 배치 수
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        self.requests = 0           # /encode 요청 수
+        self.errors = 0             # 인코딩 실패 요청 수
+        self.batches = 0            # 모델 호출(배치) 수
+        self.texts = 0              # 인코딩한 문장 수
+        self.encode_seconds = 0.0   # 모델 호출에 쓴 시간 합계
+        self._batch_sizes = deque(maxlen=self.RECENT_BATCHES)
+        self._batch_seconds = deque(maxlen=self.RECENT_BATCHES)
+        self._queue_waits = deque(maxlen=self.RECENT_BATCHES)
+
+    def record_request(self, error: bool = False):
+        with self._lock:
+            self.requests += 1
+            self.errors += int(error)
+
+    def record_batch(self, n_texts: int, seconds: float, queue_wait: float):
+        with self._lock:
+            self.batches += 1
+            self.texts += n_texts
+            self.encode_seconds += seconds
+            self._batch_sizes.append(n_texts)
+            self._batch_seconds.append(seconds)
+            self._queue_waits.append(queue_wait)
+
+    @staticmethod
+    def _percentiles(values) -> dict:
+        if not values:
+            return {"p50": None, "p95": None, "max": None}
+        arr = np.asarray(values, dtype=np.float64)
+        return {
+            "p50": round(float(np.percentile(arr, 50)), 4),
+            "p95": round(float(np.percentile(arr, 95)), 4),
+            "max": round(float(arr.max()), 4),
+        }
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "uptime_seconds": round(time.time() - self.started_at, 1),
+                "requests": self.requests,
+                "errors": self.errors,
+                "batches": self.batches,
+                "texts": self.texts,
+                "avg_batch_size": round(self.texts / self.batches, 2) if self.batches else 0.0,
+                "texts_per_second": round(self.texts / self.encode_seconds, 2) if self.encode_seconds else 0.0,
+                "batch_seconds": self._percentiles(self._batch_seconds),
+                "batch_size": self._percentiles(self._batch_sizes),
+                "queue_wait_seconds": self._percentiles(self._queue_waits),
+            }
+
+
+class _EncodeJob:
+    def __init__(self, texts: List[str], normalize: bool):
+        self.texts = texts
+        self.normalize = normalize
+        self.enqueued_at = time.perf_counter()
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class DynamicBatcher:
+    """
+    동시에 들어온 encode 요청을 모아 한 번의 모델 호출로 처리한다.
+
+    - 첫 요청이 들어오면 최대 max_wait_ms 동안, 문장 수가 max_batch_size가 될 때까지 다음 요청을 더 기다린다.
+    - 요청 하나가 max_batch_size보다 크면 그 요청만으로 배치를 만든다. (모델 쪽에서 batch_size 단위로 나눔)
+    - 모델은 정규화 없이 호출하고, normalize=True인 요청만 결과를 L2 정규화한다.
+    - 모델 호출은 워커 스레드 하나에서만 한다. (torch 스레드 경합 방지)
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[List[str]], np.ndarray],
+        max_batch_size: int,
+        max_wait_ms: float,
+        metrics: EmbeddingServiceMetrics,
+    ):
+        self.encode_fn = encode_fn
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait = max(0.0, float(max_wait_ms)) / 1000.0
+        self.metrics = metrics
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, texts: List[str], normalize: bool = True) -> np.ndarray:
+        """요청 스레드에서 호출. 배치 처리가 끝날 때까지 기다렸다가 (n, dim) float32를 돌려준다."""
+        job = _EncodeJob(texts, normalize)
+        self._queue.put(job)
+        job.done.wait()
+        if job.error is not None:
+            raise job.error
+        return job.result
+
+    def _collect(self) -> List[_EncodeJob]:
+        jobs = [self._queue.get()]
+        n_texts = len(jobs[0].texts)
+        deadline = time.perf_counter() + self.max_wait
+        while n_texts < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                job = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            jobs.append(job)
+            n_texts += len(job.texts)
+        return jobs
+
+    def _run(self):
+        while True:
+            jobs = self._collect()
+            texts = [t for job in jobs for t in job.texts]
+            started = time.perf_counter()
+            queue_wait = started - min(job.enqueued_at for job in jobs)
+            try:
+                vectors = np.asarray(self.encode_fn(texts), dtype=np.float32).reshape(len(texts), -1)
+            except Exception as e:
+                print(f"[WARN] 임베딩 배치 실패 ({len(texts)}건): {e}")
+                for job in jobs:
+                    job.error = e
+                    job.done.set()
+                continue
+            self.metrics.record_batch(len(texts), time.perf_counter() - started, queue_wait)
+
+            offset = 0
+            for job in jobs:
+                part = vectors[offset:offset + len(job.texts)]
+                offset += len(job.texts)
+                if job.normalize:
+                    norms = np.linalg.norm(part, axis=1, keepdims=True)
+                    part = part / np.maximum(norms, 1e-12)
+                job.result = part
+                job.done.set()
+
+
+class EmbeddingService:
+    """(모델, 백엔드)별 DynamicBatcher 묶음. 처음 요청된 조합은 그때 로드해서 계속 띄워 둔다."""
+
+    def __init__(
+        self,
+        max_batch_size: int,
+        max_wait_ms: float,
+        load_model: Callable = None,
+        token_budget: Optional[int] = None,
+    ):
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.token_budget = token_budget
+        self.load_model = load_model or self._load_sentence_transformer
+        self.metrics = EmbeddingServiceMetrics()
+        self._batchers: Dict[tuple, DynamicBatcher] = {}
+        self._lock = threading.Lock()
+
+    def _load_sentence_transformer(self, model_name: str, backend: str) -> Callable[[List[str]], np.ndarray]:
+        model = load_sentence_transformer(model_name, backend)
+        batch_size = self.max_batch_size
+        token_budget = self.token_budget
+
+        def encode(texts: List[str]) -> np.ndarray:
+            if token_budget:
+                # 모인 요청 안에서 다시 토큰 예산 배치로 나눈다. (긴 기사 요청이 섞여도 패딩이 커지지 않게)
+                return encode_by_token_budget(model, texts, token_budget, normalize=False)
+            return model.encode(
+                texts,
+                batch_size=batch_size,
+                show_progress_bar=False,
+                normalize_embeddings=False,
+            )
+
+        return encode
+
+    def batcher(self, model_name: str, backend: str = DEFAULT_BACKEND) -> DynamicBatcher:
+        key = (model_name, validate_backend(backend))
+        with self._lock:
+            if key not in self._batchers:
+                started = time.time()
+                print(f"[EmbeddingService] 모델 로드: {model_name} [{key[1]}]")
+                encode_fn = self.load_model(*key)
+                print(f"[EmbeddingService] 모델 로드 완료: {model_name} [{key[1]}] ({time.time() - started:.1f}초)")
+                self._batchers[key] = DynamicBatcher(
+                    encode_fn, self.max_batch_size, self.max_wait_ms, self.metrics
+                )
+            return self._batchers[key]
+
+    @property
+    def models(self) -> List[str]:
+        with self._lock:
+            return [f"{model_name} [{backend}]" for model_name, backend in sorted(self._batchers)]
+
+    def encode(self, model_name: str, texts: List[str], normalize: bool = True, backend: str = DEFAULT_BACKEND) -> np.ndarray:
+        try:
+            vectors = self.batcher(model_name, backend).submit(texts, normalize)
+        except Exception:
+            self.metrics.record_request(error=True)
+            raise
+        self.metrics.record_request()
+        return vectors
+
+
+def _make_handler(service: EmbeddingService):
+
+    class EmbeddingRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send_json(self, status: int, payload: dict):
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/metrics":
+                self._send_json(200, service.metrics.snapshot())
+            elif self.path == "/health":
+                self._send_json(200, {"status": "ok", "models": service.models})
+            else:
+                self._send_json(404, {"error": f"unknown path: {self.path}"})
+
+        def do_POST(self):
+            if self.path != "/encode":
+                self._send_json(404, {"error": f"unknown path: {self.path}"})
+                return
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                request = json.loads(self.rfile.read(length).decode("utf-8"))
+                model_name = str(request["model"])
+                backend = validate_backend(request.get("backend", DEFAULT_BACKEND))
+                texts = [str(t) for t in request["texts"]]
+                normalize = bool(request.get("normalize", True))
+            except Exception as e:
+                self._send_json(400, {"error": f"잘못된 요청: {e}"})
+                return
+
+            try:
+                vectors = service.encode(model_name, texts, normalize, backend) if texts else np.empty((0, 0), np.float32)
+            except Exception as e:
+                self._send_json(500, {"error": f"인코딩 실패: {e}"})
+                return
+
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+            self._send_json(200, {
+                "model": model_name,
+                "backend": backend,
+                "n": int(vectors.shape[0]),
+                "dim": int(vectors.shape[1]) if vectors.ndim == 2 else 0,
+                "dtype": "float32",
+                "data": base64.b64encode(vectors.tobytes()).decode("ascii"),
+            })
+
+        def log_message(self, format, *args):
+            # 요청마다 찍히는 접근 로그는 생략 (지표는 /metrics로 확인)
+            pass
+
+    return EmbeddingRequestHandler
+
+
+def create_server(service: EmbeddingService, host: str, port: int) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), _make_handler(service))
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="상주 임베딩 서비스")
+    parser.add_argument("--host", default=EMBEDDING_SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=EMBEDDING_SERVICE_PORT)
+    parser.add_argument("--model", action="append", help="시작할 때 미리 로드할 모델 (여러 번 지정 가능)")
+    parser.add_argument("--max-batch-size", type=int, default=EMBEDDING_MAX_BATCH_SIZE)
+    parser.add_argument("--max-wait-ms", type=float, default=EMBEDDING_MAX_WAIT_MS)
+    parser.add_argument("--token-budget", type=int, default=EMBEDDING_TOKEN_BUDGET)
+    parser.add_argument("--backend", default=DEFAULT_BACKEND, choices=EMBEDDING_BACKENDS, help="미리 로드할 모델의 추론 방식")
+    args = parser.parse_args()
+
+    service = EmbeddingService(args.max_batch_size, args.max_wait_ms, token_budget=args.token_budget)
+    for model_name in args.model or EMBEDDING_SERVICE_PRELOAD:
+        service.batcher(model_name, args.backend)
+
+    server = create_server(service, args.host, args.port)
+    print(f"[EmbeddingService] http://{args.host}:{args.port} "
+          f"(max_batch_size={args.max_batch_size}, max_wait_ms={args.max_wait_ms})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("[EmbeddingService] 종료")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
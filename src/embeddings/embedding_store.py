@@ -0,0 +1,229 @@
+# embedding_store.py
+# 기사 임베딩 영구 저장소 — (news_id, 모델, 코퍼스 템플릿 버전) 기준으로 한 번 계산한 벡터를 재사용한다.
+
+import json
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from src.api.news_id_index import news_ids_to_uint64
+from src.embeddings.inference_backends import DEFAULT_BACKEND, validate_backend
+
+
+@contextmanager
+def _file_lock(path: str):
+    """프로세스 간 배타 락 (POSIX: fcntl.flock, Windows: msvcrt.locking)"""
+    with open(path, "a+b") as f:
+        try:
+            import fcntl
+        except ImportError:
+            import msvcrt
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            return
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def _slug(value: str) -> str:
+    """모델명/템플릿 버전 → 폴더명 ("dragonkue/multilingual-e5-small-ko-v2" → "dragonkue__multilingual-e5-small-ko-v2")"""
+    return re.sub(r"[^0-9A-Za-z@._-]+", "_", str(value).replace("/", "__"))
+
+
+class EmbeddingStore:
+    """
+    기사 임베딩 저장소
+
+    <root>/<모델명>[@<백엔드>]/<템플릿 버전>/
+      vectors.f32  : float32 벡터를 추가된 순서대로 이어 붙인 파일 (np.memmap으로 필요한 행만 읽음)
+      index.npz    : 정렬된 news_id(uint64) → vectors.f32 행 번호
+      meta.json    : 모델명, 템플릿 버전, 백엔드, 차원 (확인용)
+
+    - 키는 (news_id, 모델, 템플릿 버전, 추론 백엔드)이다. 모델이나 build_corpus 문장 구성, 백엔드(onnx/int8)가
+      바뀌면 폴더가 달라져 섞이지 않는다. (기본 "torch"는 백엔드 표시 없이 모델명 폴더를 그대로 씀)
+    - add는 벡터를 파일 끝에 붙이고 fsync한 뒤 index.npz를 임시 파일 → os.replace로 교체한다.
+    - 여러 프로세스/스레드가 같은 저장소에 써도 된다. (--live 갱신과 정기 실행, 스윕, validators가 겹치는 경우)
+      add는 <폴더>/.lock 파일 락(+ 경로별 스레드 락) 안에서 index.npz를 다시 읽고, vectors 파일의 실제 행 수 뒤에 이어 쓴다.
+      중간에 끊겨 index에 없는 꼬리 행이 남으면 그대로 두고(참조되지 않음) 그 뒤에 쓴다. 행 중간에서 잘린 바이트만 버린다.
+    """
+
+    VECTORS_FILE = "vectors.f32"
+    INDEX_FILE = "index.npz"
+    META_FILE = "meta.json"
+    LOCK_FILE = ".lock"
+
+    # 같은 저장소를 한 프로세스 안의 여러 인스턴스가 쓸 때 (flock은 같은 프로세스의 다른 fd끼리도 배타지만 스레드 순서도 보장)
+    _locks: Dict[str, threading.Lock] = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, root: str, model_name: str, template_version: str, backend: str = DEFAULT_BACKEND):
+        self.model_name = model_name
+        self.template_version = template_version
+        self.backend = validate_backend(backend)
+        model_key = model_name if self.backend == DEFAULT_BACKEND else f"{model_name}@{self.backend}"
+        self.dir_path = os.path.join(str(root), _slug(model_key), _slug(template_version))
+        self.vectors_path = os.path.join(self.dir_path, self.VECTORS_FILE)
+        self.index_path = os.path.join(self.dir_path, self.INDEX_FILE)
+        self.lock_path = os.path.join(self.dir_path, self.LOCK_FILE)
+        with self._locks_guard:
+            self._lock = self._locks.setdefault(os.path.abspath(self.dir_path), threading.Lock())
+        self.ids = np.empty(0, dtype=np.uint64)
+        self.rows = np.empty(0, dtype=np.int64)
+        self.dim = None
+        self._vectors = None
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _load(self):
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with np.load(self.index_path, allow_pickle=False) as data:
+                ids = data["ids"].astype(np.uint64, copy=False)
+                rows = data["rows"].astype(np.int64, copy=False)
+                dim = int(data["dim"])
+            # index가 가리키는 행이 파일에 모두 있어야 한다.
+            if len(rows) and os.path.getsize(self.vectors_path) < (int(rows.max()) + 1) * dim * 4:
+                raise ValueError("vectors 파일이 index보다 짧습니다")
+        except Exception as e:
+            print(f"[EmbeddingStore] 저장소 로드 실패, 처음부터 다시 쌓습니다: {self.dir_path} ({e})")
+            return
+        self.ids, self.rows, self.dim = ids, rows, dim
+
+    def _file_rows(self, dim: int) -> int:
+        """vectors 파일에 온전히 들어 있는 행 수"""
+        if not os.path.exists(self.vectors_path):
+            return 0
+        return os.path.getsize(self.vectors_path) // (dim * 4)
+
+    def _memmap(self) -> np.ndarray:
+        """저장된 전체 벡터 (읽기 전용 memmap, 행 수 = 파일의 행 수, index가 가리키지 않는 꼬리 행 포함 가능)"""
+        if self._vectors is None and len(self.ids):
+            self._vectors = np.memmap(
+                self.vectors_path, dtype=np.float32, mode="r", shape=(self._file_rows(self.dim), self.dim)
+            )
+        return self._vectors
+
+    # ---------------------------------------------------------
+    # 조회 / 추가
+    # ---------------------------------------------------------
+    def lookup(self, news_ids: Sequence[str]) -> np.ndarray:
+        """news_id별 vectors 행 번호 (없으면 -1, 입력 순서)"""
+        values = news_ids_to_uint64(news_ids)
+        rows = np.full(len(values), -1, dtype=np.int64)
+        if len(values) == 0 or len(self.ids) == 0:
+            return rows
+        pos = np.searchsorted(self.ids, values)
+        pos[pos == len(self.ids)] = 0
+        found = self.ids[pos] == values
+        rows[found] = self.rows[pos[found]]
+        return rows
+
+    def get(self, news_ids: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (벡터 (n, dim) float32, 저장 여부 bool 배열)
+        저장되지 않은 기사의 행은 0으로 채운다. 저장소가 비어 있으면 dim을 몰라 (n, 0) 배열을 돌려준다.
+        """
+        rows = self.lookup(news_ids)
+        found = rows >= 0
+        vectors = np.zeros((len(rows), self.dim or 0), dtype=np.float32)
+        if found.any():
+            vectors[found] = self._memmap()[rows[found]]
+        return vectors, found
+
+    def add(self, news_ids: Sequence[str], vectors: np.ndarray):
+        """새 news_id의 벡터를 추가한다. (이미 있거나 입력 안에서 중복된 news_id는 처음 것만, 기존 값 유지)"""
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        values = news_ids_to_uint64(news_ids)
+        if vectors.ndim != 2 or len(vectors) != len(values):
+            raise ValueError(f"news_id {len(values)}개와 벡터 shape {vectors.shape}가 맞지 않습니다")
+        if len(values) == 0:
+            return
+        os.makedirs(self.dir_path, exist_ok=True)
+        with self._lock, _file_lock(self.lock_path):
+            # 다른 프로세스가 그 사이에 추가했을 수 있으므로 락 안에서 index를 다시 읽는다.
+            self._load()
+            self._vectors = None
+            if self.dim is not None and vectors.shape[1] != self.dim:
+                raise ValueError(f"임베딩 차원 불일치 (저장소: {self.dim}, 입력: {vectors.shape[1]})")
+
+            _, first = np.unique(values, return_index=True)
+            first = np.sort(first)
+            new = first[self.lookup(values[first]) < 0]
+            if len(new) == 0:
+                return
+
+            dim = vectors.shape[1]
+            count = self._file_rows(dim)
+            mode = "r+b" if os.path.exists(self.vectors_path) else "wb"
+            with open(self.vectors_path, mode) as f:
+                # 행 중간에서 끊긴 바이트만 버리고, 온전한 행(참조되지 않는 꼬리 행 포함) 뒤에 이어 쓴다.
+                f.truncate(count * dim * 4)
+                f.seek(count * dim * 4)
+                f.write(vectors[new].tobytes())
+                f.flush()
+                os.fsync(f.fileno())
+
+            ids = np.concatenate([self.ids, values[new]])
+            rows = np.concatenate([self.rows, np.arange(count, count + len(new), dtype=np.int64)])
+            order = np.argsort(ids, kind="stable")
+            self._replace(ids[order], rows[order], dim)
+
+    def _replace(self, ids: np.ndarray, rows: np.ndarray, dim: int):
+        tmp_path = self.index_path + ".tmp.npz"
+        np.savez(tmp_path, ids=ids, rows=rows, dim=np.array(dim))
+        os.replace(tmp_path, self.index_path)
+
+        if self.dim is None:
+            meta = {
+                "model_name": self.model_name,
+                "template_version": self.template_version,
+                "backend": self.backend,
+                "dim": dim,
+            }
+            with open(os.path.join(self.dir_path, self.META_FILE), "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2)
+
+        self.ids, self.rows, self.dim = ids, rows, dim
+        self._vectors = None
+
+    def get_or_encode(
+        self,
+        news_ids: Sequence[str],
+        texts: List[str],
+        encode: Callable[[List[str]], np.ndarray],
+    ) -> Tuple[np.ndarray, int]:
+        """
+        저장된 벡터는 그대로 읽고, 처음 보는 기사만 encode(texts)로 계산해 저장한다.
+        반환: (입력 순서의 벡터 (n, dim) float32, 새로 계산한 기사 수)
+        """
+        if len(news_ids) != len(texts):
+            raise ValueError(f"news_id {len(news_ids)}개와 텍스트 {len(texts)}개가 맞지 않습니다")
+
+        vectors, found = self.get(news_ids)
+        missing = np.flatnonzero(~found)
+        if len(missing) == 0:
+            return vectors, 0
+
+        encoded = np.asarray(encode([texts[i] for i in missing]), dtype=np.float32)
+        self.add([news_ids[i] for i in missing], encoded)
+
+        if vectors.shape[1] != encoded.shape[1]:
+            # 저장소가 비어 있던 경우 (전부 새 기사, dim을 이번에 알게 됨)
+            vectors = np.zeros((len(news_ids), encoded.shape[1]), dtype=np.float32)
+        vectors[missing] = encoded
+        return vectors, len(missing)
@@ -0,0 +1,82 @@
+# inference_backends.py
+# 임베딩 모델 추론 방식 선택 — CPU 서버에서 SentenceTransformer forward 비용을 줄이기 위한 대안 백엔드
+#
+#   "torch"      : 기본 (fp32 PyTorch)
+#   "onnx"       : ONNX Runtime (sentence-transformers backend="onnx", optimum/onnxruntime 필요. ONNX 파일이 없으면 처음 로드 시 변환)
+#   "torch-int8" : PyTorch Linear 레이어 동적 int8 양자화 (추가 의존성 없음, CPU 전용)
+#
+# 백엔드마다 벡터가 조금씩 달라서 임베딩 저장소 키에 백엔드가 들어간다. (embedding_store.py)
+# 바꾸기 전 확인: python validators/check_embedding_backend_parity.py
+#
+# torch 외 백엔드는 VERIFIED_BACKENDS에 (모델, 백엔드) 패리티 기록이 있고 그 값이 기준을 넘을 때만 로드한다.
+# 기록은 위 점검이 [OK]일 때 출력하는 줄을 그대로 옮겨 적는다. (실제 모델, 실제 canonical 창으로 돌린 결과만)
+
+EMBEDDING_BACKENDS = ("torch", "onnx", "torch-int8")
+DEFAULT_BACKEND = "torch"
+
+# 패리티 기준 (fp32 torch 대비)
+PARITY_MIN_COSINE = 0.98   # 기사별 최소 코사인 유사도
+PARITY_MIN_ARI = 0.90      # 같은 HDBSCAN 설정 결과의 adjusted Rand index
+
+# (모델, 백엔드) → 기록된 패리티 결과. 아직 확인된 조합이 없어 기본 torch만 쓸 수 있다.
+VERIFIED_BACKENDS = {
+    # ("dragonkue/multilingual-e5-small-ko-v2", "onnx"): {"min_cos": 0.0, "ari": 0.0, "n": 0, "checked": "YYYY-MM-DD"},
+}
+
+
+def validate_backend(backend: str) -> str:
+    backend = (backend or DEFAULT_BACKEND).lower()
+    if backend not in EMBEDDING_BACKENDS:
+        raise ValueError(f"지원하지 않는 임베딩 백엔드: {backend} (가능: {', '.join(EMBEDDING_BACKENDS)})")
+    return backend
+
+
+def require_parity(model_name: str, backend: str):
+    """torch 외 백엔드는 기준을 넘은 패리티 기록이 있어야 한다. 없으면 ValueError"""
+    backend = validate_backend(backend)
+    if backend == DEFAULT_BACKEND:
+        return
+    record = VERIFIED_BACKENDS.get((model_name, backend))
+    if record is None:
+        raise ValueError(
+            f"{model_name} [{backend}] 패리티 기록이 없습니다. "
+            f"python validators/check_embedding_backend_parity.py --backend {backend} 결과를 "
+            f"inference_backends.VERIFIED_BACKENDS에 적은 뒤 사용하세요."
+        )
+    if record["min_cos"] < PARITY_MIN_COSINE or record["ari"] < PARITY_MIN_ARI:
+        raise ValueError(
+            f"{model_name} [{backend}] 패리티 기록이 기준 미달입니다: {record} "
+            f"(min cos ≥ {PARITY_MIN_COSINE}, ARI ≥ {PARITY_MIN_ARI})"
+        )
+
+
+def load_sentence_transformer(model_name: str, backend: str = DEFAULT_BACKEND, check_parity: bool = True):
+    """
+    백엔드에 맞게 SentenceTransformer를 로드한다. (encode/tokenizer 인터페이스는 동일)
+    필요한 패키지가 없으면 ImportError를 그대로 올린다.
+    → 다른 백엔드로 조용히 바꾸면 저장소에 다른 백엔드 벡터가 섞이기 때문
+    check_parity=False는 패리티 점검(validators/check_embedding_backend_parity.py)에서만 쓴다.
+    """
+    from sentence_transformers import SentenceTransformer
+
+    backend = validate_backend(backend)
+    if check_parity:
+        require_parity(model_name, backend)
+
+    if backend == "onnx":
+        try:
+            return SentenceTransformer(model_name, device="cpu", backend="onnx")
+        except ImportError as e:
+            raise ImportError(
+                f"onnx 백엔드에는 optimum[onnxruntime]이 필요합니다: pip install \"optimum[onnxruntime]\" ({e})"
+            ) from e
+
+    if backend == "torch-int8":
+        import torch
+
+        model = SentenceTransformer(model_name, device="cpu")
+        model.eval()
+        torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+        return model
+
+    return SentenceTransformer(model_name)
@@ -0,0 +1,78 @@
+# token_batching.py
+# 토큰 길이 기준 배치 구성 — 길이가 비슷한 문장끼리 묶고, 배치 크기를 건수가 아니라 토큰 예산(패딩 포함)으로 정한다.
+
+from typing import List, Optional
+
+import numpy as np
+
+
+def token_lengths(tokenizer, texts: List[str], max_seq_length: Optional[int] = None) -> np.ndarray:
+    """문장별 토큰 수 (special token 포함, max_seq_length에서 잘림 — 모델 입력 길이와 같음)"""
+    if not texts:
+        return np.empty(0, dtype=np.int64)
+    encoded = tokenizer(
+        list(texts),
+        add_special_tokens=True,
+        truncation=max_seq_length is not None,
+        max_length=max_seq_length,
+    )
+    return np.fromiter((len(ids) for ids in encoded["input_ids"]), dtype=np.int64, count=len(texts))
+
+
+def plan_token_batches(lengths: np.ndarray, token_budget: int, max_batch_size: Optional[int] = None) -> List[np.ndarray]:
+    """
+    토큰 길이 내림차순으로 정렬해 앞에서부터 배치를 채운다.
+    배치 비용 = 건수 × 배치 안 최장 길이(첫 문장) ≤ token_budget
+    (예산보다 긴 문장 하나는 단독 배치)
+    반환: 배치별 원래 위치 배열
+    """
+    lengths = np.asarray(lengths, dtype=np.int64)
+    order = np.argsort(-lengths, kind="stable")
+    batches = []
+    start = 0
+    while start < len(order):
+        longest = max(int(lengths[order[start]]), 1)
+        size = max(1, int(token_budget) // longest)
+        if max_batch_size:
+            size = min(size, int(max_batch_size))
+        batches.append(order[start:start + size])
+        start += size
+    return batches
+
+
+def encode_by_token_budget(
+    model,
+    texts: List[str],
+    token_budget: int,
+    max_batch_size: Optional[int] = None,
+    normalize: bool = True,
+    show_progress_bar: bool = False,
+) -> np.ndarray:
+    """
+    SentenceTransformer.encode를 토큰 예산 배치로 나눠 호출하고 원래 순서로 되돌린다.
+    (encode는 문자 길이로만 정렬하고 배치 건수가 고정이라, 짧은 문장 배치는 작고 긴 문장 배치는 패딩이 크다)
+    """
+    texts = [str(t) for t in texts]
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+
+    lengths = token_lengths(model.tokenizer, texts, getattr(model, "max_seq_length", None))
+    batches = plan_token_batches(lengths, token_budget, max_batch_size)
+
+    if show_progress_bar:
+        from tqdm import tqdm
+        batches = tqdm(batches, desc="Batches")
+
+    out = None
+    for idxs in batches:
+        vectors = model.encode(
+            [texts[i] for i in idxs],
+            batch_size=len(idxs),
+            show_progress_bar=False,
+            normalize_embeddings=normalize,
+        )
+        vectors = np.asarray(vectors, dtype=np.float32)
+        if out is None:
+            out = np.empty((len(texts), vectors.shape[1]), dtype=np.float32)
+        out[idxs] = vectors
+    return out
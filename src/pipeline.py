@@ -6,21 +6,40 @@ from api.naver_news_client import NaverNewsClient
 from api.news_repository import NewsRepository
 from processors.single_news_pre_post_filter import SingleNewsPrePostFilter
 from processors.single_news_scraper import SingleNewsScraper
+from api.scrape_cache import ScrapeCache
+from api.article_store import get_article_store
 from processors.single_news_clusterer import SingleNewsClusterer
 from config import (
     SINGLE_TITLE_THRESHOLD, 
     SINGLE_CONTENT_THRESHOLD, 
+    SIMILARITY_ASSIGN_MODE,
     NAVER_ID, 
     NAVER_SECRET, 
     EXCLUDE_WORDS_STR,
-    OUTPUT_ROOT
+    OUTPUT_ROOT,
+    SCRAPE_MAX_WORKERS,
+    SCRAPE_MAX_RPS,
+    SCRAPE_HTML_ENGINE,
+    SCRAPE_CACHE_PATH,
+    SCRAPE_CACHE_TTL_HOURS,
+    SCRAPE_CACHE_MAX_ENTRIES,
+    PIPELINE_CPU_SLOTS,
+    ARCHIVE_BACKEND,
+    ARCHIVE_CSV_EXPORT,
+    NEWS_ID_INDEX_BLOOM,
+    ARTICLE_STORE_PATH,
 )
 from utils.logger import PipelineLogger
-from config import SIMHASH_TITLE_DISTANCE, SIMHASH_BODY_DISTANCE
+from config import SIMHASH_TITLE_DISTANCE, SIMHASH_BODY_DISTANCE, SIMHASH_HISTORY_DAYS
 from processors.simhash_deduplicator import SimHashDeduplicator
+from processors.simhash_fingerprint_store import SimHashFingerprintStore
 from utils.simhash_log import save_simhash_removed
 from datetime import datetime
 import os
+import threading
+
+# 키워드 병렬 실행 시 CPU 구간(STEP 6~7)에 동시에 들어가는 키워드 수 제한 (프로세스 공유)
+_cpu_stage_slots = threading.BoundedSemaphore(max(1, PIPELINE_CPU_SLOTS))
 
 def run_news_pipeline(keyword: str, total_count: int, is_keyword_required: bool, log_dir: str = "logs"):
 
@@ -34,20 +53,42 @@ def run_news_pipeline(keyword: str, total_count: int, is_keyword_required: bool,
         "status": "initialized"
     }    
 
+    scrape_cache = None
     try:
         # 1. 초기화 및 API 호출
         client = NaverNewsClient(NAVER_ID, NAVER_SECRET)
-        repo = NewsRepository(keyword, base_path=OUTPUT_ROOT)
-        nf = SingleNewsPrePostFilter(keyword, is_keyword_required=is_keyword_required, exclude_words_str=EXCLUDE_WORDS_STR, base_path=OUTPUT_ROOT)
-        ns = SingleNewsScraper(delay=0.1)
+        repo = NewsRepository(
+            keyword,
+            base_path=OUTPUT_ROOT,
+            backend=ARCHIVE_BACKEND,
+            export_csv=ARCHIVE_CSV_EXPORT,
+            id_index_bloom=NEWS_ID_INDEX_BLOOM,
+            store_path=ARTICLE_STORE_PATH,
+        )
+        # sqlite 저장소면 필터 탈락 로그도 저장소에 쌓는다. (filtered_logs/*.csv 대신)
+        filter_log_store = get_article_store(ARTICLE_STORE_PATH) if ARCHIVE_BACKEND == "sqlite" else None
+        nf = SingleNewsPrePostFilter(
+            keyword, is_keyword_required=is_keyword_required, exclude_words_str=EXCLUDE_WORDS_STR,
+            base_path=OUTPUT_ROOT, store=filter_log_store,
+        )
+        scrape_cache = ScrapeCache(SCRAPE_CACHE_PATH, ttl_hours=SCRAPE_CACHE_TTL_HOURS, max_entries=SCRAPE_CACHE_MAX_ENTRIES)
+        ns = SingleNewsScraper(
+            delay=0.1,
+            max_workers=SCRAPE_MAX_WORKERS,
+            max_rps=SCRAPE_MAX_RPS,
+            cache=scrape_cache,
+            html_engine=SCRAPE_HTML_ENGINE,
+        )
 
         simhash_deduplicator = SimHashDeduplicator(
             title_distance=SIMHASH_TITLE_DISTANCE,
-            body_distance=SIMHASH_BODY_DISTANCE
-            
+            body_distance=SIMHASH_BODY_DISTANCE,
+            history_store=SimHashFingerprintStore.for_keyword(keyword, base_path=OUTPUT_ROOT),
+            history_days=SIMHASH_HISTORY_DAYS,
+            shared_store=SimHashFingerprintStore.global_store(base_path=OUTPUT_ROOT),
         )
 
-        cluster_tool = SingleNewsClusterer(title_threshold=SINGLE_TITLE_THRESHOLD, content_threshold=SINGLE_CONTENT_THRESHOLD)
+        cluster_tool = SingleNewsClusterer(title_threshold=SINGLE_TITLE_THRESHOLD, content_threshold=SINGLE_CONTENT_THRESHOLD, assign_mode=SIMILARITY_ASSIGN_MODE)
 
         raw_items = client.fetch_news_batch(keyword, total_count=total_count)
         df_new = repo.save_raw_and_get_new(raw_items)
@@ -75,12 +116,13 @@ def run_news_pipeline(keyword: str, total_count: int, is_keyword_required: bool,
         # STEP 5: 사후 필터링
         df_step5 = nf.apply_post_filter(df_step4)
         
-        # STEP 6: SimHash 전처리 (추가)        
-        df_step6, df_simhash_removed = simhash_deduplicator.deduplicate(df_step5)
-        save_simhash_removed(df_simhash_removed, keyword)
+        with _cpu_stage_slots:
+            # STEP 6: SimHash 전처리 (추가)        
+            df_step6, df_simhash_removed = simhash_deduplicator.deduplicate(df_step5)
+            save_simhash_removed(df_simhash_removed, keyword)
 
-        # STEP 7: 클러스터링
-        df_clustered, stats = cluster_tool.process(df_step6, keyword)
+            # STEP 7: 클러스터링
+            df_clustered, stats = cluster_tool.process(df_step6, keyword)
         # df_clustered : 클러스터링 및 대표 기사 선정이 적용된 실제 기사별 클러스터링/대표기사 결과 DataFrame
         # stats : 통계 정보 딕셔너리 (클러스터 개수, 대표 기사 개수 등 요약 통계)        
         
@@ -101,5 +143,9 @@ def run_news_pipeline(keyword: str, total_count: int, is_keyword_required: bool,
         logger.end_step(error=str(e))
         logger.save()
         print(f"!!! [{keyword}] 파이프라인 실행 중 오류 발생: {e}")
+    finally:
+        # 실행마다 여는 스크랩 캐시 연결은 여기서 닫는다. (키워드 병렬 실행 시 연결이 쌓이지 않게)
+        if scrape_cache is not None:
+            scrape_cache.close()
     
     return pipeline_stats
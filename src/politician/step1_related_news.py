@@ -3,6 +3,9 @@
 import os
 import pandas as pd
 
+from config import ARCHIVE_BACKEND, ARTICLE_STORE_PATH
+from api.article_store import load_canonical_archive
+
 # ===== 설정 =====
 SOURCE_PATH = "archive/aggregated/canonical_archive.csv"
 OUTPUT_DIR = "data/politician/ianju"
@@ -12,7 +15,7 @@ KEYWORD = "이언주"
 def main():
     print("STEP 1 | 이언주 기사 슬라이싱 시작")
 
-    df = pd.read_csv(SOURCE_PATH)
+    df = load_canonical_archive(ARCHIVE_BACKEND, SOURCE_PATH, ARTICLE_STORE_PATH)
 
     # 필수 컬럼 확인
     required_cols = {"news_id", "title", "content", "pubDate"}
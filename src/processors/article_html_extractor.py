@@ -0,0 +1,97 @@
+# processors/article_html_extractor.py
+# 네이버 기사 HTML → 본문 텍스트 추출기
+# - "bs4": 기존 BeautifulSoup(html.parser) 방식 (기준 구현)
+# - "lxml": libxml2 기반 고속 방식, bs4와 같은 텍스트를 만들도록 규칙을 맞춤
+# 두 방식의 결과 비교/속도 측정: python validators/check_html_extractor_parity.py
+
+from bs4 import BeautifulSoup
+from lxml import etree
+import lxml.html
+
+# 네이버 뉴스 주요 본문 셀렉터들 (앞에서부터 우선)
+ARTICLE_SELECTORS = [
+    ("article", "dic_area"),
+    ("div", "newsct_article"),
+    ("div", "articleBodyContents"),
+]
+
+# 노이즈(스크립트, 스타일 등) 제거 대상
+NOISE_TAGS = ("script", "style", "iframe", "span", "em")
+
+# bs4는 이 태그 안의 문자열을 NavigableString이 아닌 별도 타입(Script, RubyTextString 등)으로 만들고
+# get_text()에서 제외한다. lxml 추출기도 같은 문자열을 건너뛴다.
+_NON_TEXT_CONTAINERS = frozenset(("script", "style", "template", "rt", "rp"))
+
+_LXML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+_LXML_XPATHS = [
+    etree.XPath(f"//{tag}[@id='{element_id}']")
+    for tag, element_id in ARTICLE_SELECTORS
+]
+
+
+def extract_article_text_bs4(html: str) -> str:
+    soup = BeautifulSoup(html, 'html.parser')
+    targets = [soup.find(tag, id=element_id) for tag, element_id in ARTICLE_SELECTORS]
+
+    for target in targets:
+        if target:
+            for s in target(list(NOISE_TAGS)):
+                s.decompose()
+            return target.get_text(separator=' ', strip=True)
+    return ""
+
+
+def extract_article_text_lxml(html: str) -> str:
+    """
+    bs4 get_text(separator=' ', strip=True)와 같은 규칙으로 텍스트를 모은다.
+    - 본문 요소의 하위 텍스트 노드만 대상 (요소 자신의 tail은 제외)
+    - NOISE_TAGS 요소는 하위 텍스트째 버리되, 요소 뒤에 이어지는 텍스트(tail)는 남긴다. (decompose와 동일)
+    - 주석/처리 명령 자체의 텍스트는 버린다.
+    - 각 조각은 str.strip() 후 빈 문자열이면 버리고, 공백 하나로 잇는다.
+    """
+    if not html:
+        return ""
+
+    # libxml2는 줄바꿈(\r\n, \r)을 \n으로 바꾸지만 html.parser는 그대로 둔다. 문자 참조로 바꿔 \r을 보존한다.
+    if "\r" in html:
+        html = html.replace("\r", "&#13;")
+
+    root = lxml.html.document_fromstring(html.encode("utf-8"), parser=_LXML_PARSER)
+    for xpath in _LXML_XPATHS:
+        found = xpath(root)
+        if found:
+            parts = []
+            _collect_text(found[0], parts, skip=False)
+            return " ".join(parts)
+    return ""
+
+
+def _collect_text(node, parts, skip):
+    if not isinstance(node.tag, str):
+        # 주석 / 처리 명령: 자신의 텍스트는 버리고 tail은 부모가 처리
+        return
+
+    tag = node.tag.lower()
+    if tag in NOISE_TAGS:
+        return
+
+    skip = skip or tag in _NON_TEXT_CONTAINERS
+    if node.text and not skip:
+        _append_stripped(parts, node.text)
+
+    for child in node:
+        _collect_text(child, parts, skip)
+        if child.tail and not skip:
+            _append_stripped(parts, child.tail)
+
+
+def _append_stripped(parts, text):
+    stripped = text.strip()
+    if stripped:
+        parts.append(stripped)
+
+
+EXTRACTORS = {
+    "bs4": extract_article_text_bs4,
+    "lxml": extract_article_text_lxml,
+}
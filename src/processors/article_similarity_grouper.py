@@ -2,15 +2,34 @@
 
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
+from scipy import sparse
 import numpy as np
 
 class ArticleSimilarityGrouper:
-    def __init__(self, threshold, field_name=None, test_mode=False):
+    # 희소 유사도 계산 시 한 번에 곱하는 행(기사) 수
+    # 블록 하나의 결과는 최대 chunk_size × n 이므로 메모리 상한을 결정한다.
+    DEFAULT_CHUNK_SIZE = 1000
+
+    # 그룹 번호 부여 방식
+    # - "loop": 기존 Python 루프 (유사 쌍마다 출력, 검증/디버그용)
+    # - "vectorized": 배열 기반 동일 규칙 재현 (요약 1줄만 출력, 운영용)
+    ASSIGN_MODES = ("loop", "vectorized")
+
+    def __init__(self, threshold, field_name=None, test_mode=False, chunk_size=DEFAULT_CHUNK_SIZE, assign_mode="vectorized"):
+        assert assign_mode in self.ASSIGN_MODES
         self.threshold = threshold
         self.field_name = field_name
         self.test_mode = test_mode
+        self.chunk_size = chunk_size
+        self.assign_mode = assign_mode
 
-    def group(self, texts: list[str]) -> list[int]:
+    def group(self, texts: list[str], blocks=None) -> list[int]:
+        """
+        blocks: 후보 블록(행 번호 배열, 오름차순) 목록. 주어지면 같은 블록 안의 쌍만 유사도를 계산한다.
+        TF-IDF 학습과 그룹 번호 부여는 항상 texts 전체 기준이므로, 임계값 이상 쌍이 모두 어떤 블록 안에
+        있으면 결과는 blocks=None과 같다.
+        """
         if not texts:
             return []
 
@@ -19,6 +38,176 @@ class ArticleSimilarityGrouper:
             min_df=1
         )
         tfidf = vectorizer.fit_transform(texts)
+
+        # test_mode는 모든 비교 쌍의 점수를 출력해야 하므로 기존 dense 행렬을 그대로 사용한다.
+        # (인라인 테스트 데이터 규모에서만 사용)
+        if self.test_mode:
+            return self._group_dense(texts, tfidf)
+
+        if blocks is None:
+            adjacency = self._build_adjacency(tfidf)
+        else:
+            adjacency = self._build_blocked_adjacency(tfidf, blocks)
+        if self.assign_mode == "vectorized":
+            return self._assign_groups_vectorized(adjacency)
+        return self._assign_groups(texts, adjacency)
+
+    def iter_similar_pairs(self, tfidf, query_start=0):
+        """
+        CSR TF-IDF 행렬에서 threshold 이상인 (i < j) 쌍만 청크 단위로 생성한다.
+
+        - 행 블록 × 전체 행렬의 희소 곱으로 유사도를 계산하므로
+          n×n dense 행렬을 만들지 않는다.
+        - 각 청크는 (rows, cols, scores) 배열이며, rows는 전역 행 번호다.
+        - 정규화 방식은 cosine_similarity와 동일하므로 점수도 동일하다.
+        - query_start > 0 이면 query_start 이후 행(신규 기사)과 앞쪽 행(기존 기사)의 쌍만 계산한다.
+          (기존끼리, 신규끼리 쌍은 건너뜀 → 비교량 O(신규 × 기존). 이때 rows는 신규 쪽, cols < query_start)
+        """
+        tfidf = normalize(sparse.csr_matrix(tfidf))
+        tfidf_t = tfidf.T.tocsc()
+        if query_start > 0:
+            tfidf_t = tfidf_t[:, :query_start]
+        n = tfidf.shape[0]
+
+        for start in range(query_start, n, self.chunk_size):
+            end = min(start + self.chunk_size, n)
+            block = (tfidf[start:end] @ tfidf_t).tocoo()
+
+            rows = block.row.astype(np.int64) + start
+            cols = block.col.astype(np.int64)
+            scores = block.data
+
+            # 상삼각(i < j) + 임계값 이상만 남긴다. (query_start > 0이면 열이 모두 기존 행)
+            mask = ((cols > rows) | (query_start > 0)) & (scores >= self.threshold)
+            yield rows[mask], cols[mask], scores[mask]
+
+    def similar_pairs_against(self, texts: list[str], query_start: int):
+        """
+        texts[query_start:](신규)와 texts[:query_start](기존)의 유사 쌍 (rows: 신규, cols: 기존).
+        신규끼리 쌍은 계산하지 않는다. (호출 측이 신규만으로 따로 묶음)
+        TF-IDF는 texts 전체(기존 비교 대상 + 신규)로 학습한다.
+        """
+        empty = np.empty(0, dtype=np.int64)
+        if query_start <= 0 or query_start >= len(texts):
+            return empty, empty
+        tfidf = TfidfVectorizer(ngram_range=(1, 2), min_df=1).fit_transform(texts)
+
+        row_chunks, col_chunks = [empty], [empty]
+        for rows, cols, _ in self.iter_similar_pairs(tfidf, query_start=query_start):
+            row_chunks.append(rows)
+            col_chunks.append(cols)
+        return np.concatenate(row_chunks), np.concatenate(col_chunks)
+
+    def _build_adjacency(self, tfidf) -> sparse.csr_matrix:
+        """청크별 edge list를 모아 상삼각 인접 행렬(CSR)로 만든다. 메모리는 유사 쌍 수에 비례."""
+        n = tfidf.shape[0]
+        row_chunks, col_chunks, score_chunks = [], [], []
+
+        for rows, cols, scores in self.iter_similar_pairs(tfidf):
+            if len(rows) == 0:
+                continue
+            row_chunks.append(rows)
+            col_chunks.append(cols)
+            score_chunks.append(scores)
+
+        if not row_chunks:
+            return sparse.csr_matrix((n, n), dtype=np.float64)
+
+        return sparse.csr_matrix(
+            (np.concatenate(score_chunks), (np.concatenate(row_chunks), np.concatenate(col_chunks))),
+            shape=(n, n),
+        )
+
+    def _build_blocked_adjacency(self, tfidf, blocks) -> sparse.csr_matrix:
+        """블록별 유사 쌍을 전역 행 번호로 모아 상삼각 인접 행렬로 만든다. (겹치는 블록의 중복 쌍은 한 번만)"""
+        tfidf = sparse.csr_matrix(tfidf)
+        n = tfidf.shape[0]
+        code_chunks, score_chunks = [], []
+
+        for block in blocks:
+            block = np.asarray(block, dtype=np.int64)
+            if len(block) < 2:
+                continue
+            for rows, cols, scores in self.iter_similar_pairs(tfidf[block]):
+                if len(rows) == 0:
+                    continue
+                code_chunks.append(block[rows] * n + block[cols])
+                score_chunks.append(scores)
+
+        if not code_chunks:
+            return sparse.csr_matrix((n, n), dtype=np.float64)
+
+        codes, first = np.unique(np.concatenate(code_chunks), return_index=True)
+        scores = np.concatenate(score_chunks)[first]
+        return sparse.csr_matrix((scores, (codes // n, codes % n)), shape=(n, n))
+
+    def _assign_groups(self, texts: list[str], adjacency: sparse.csr_matrix) -> list[int]:
+        """
+        기존 dense 이중 루프와 동일한 규칙으로 그룹 번호를 부여한다.
+        - 아직 그룹이 없는 기사 i가 새 그룹의 seed가 된다.
+        - seed i와 유사한 뒤쪽 기사 j는 (이미 그룹이 있어도) i의 그룹으로 덮어쓴다.
+        threshold 미만 쌍은 결과에 영향을 주지 않으므로 인접 행렬의 이웃만 순회하면 된다.
+        """
+        group_ids = [-1] * len(texts)
+        current_group = 0
+        label = self.field_name or ""
+        indptr, indices, data = adjacency.indptr, adjacency.indices, adjacency.data
+
+        for i in range(len(texts)):
+            if group_ids[i] != -1:
+                continue
+
+            group_ids[i] = current_group
+
+            row_start, row_end = indptr[i], indptr[i + 1]
+            order = np.argsort(indices[row_start:row_end], kind="stable")
+            for k in order:
+                j = int(indices[row_start + k])
+                similarity_score = data[row_start + k]
+                print(f"!! 아래 2개 기사는 {label}이 유사합니다 {similarity_score:.4f}")
+                print(f" [{i}] {texts[i][:250]}")
+                print(f" [{j}] {texts[j][:250]}\n")
+                group_ids[j] = current_group
+
+            current_group += 1
+
+        return group_ids
+
+    def _assign_groups_vectorized(self, adjacency: sparse.csr_matrix) -> list[int]:
+        """
+        _assign_groups와 동일한 결과를 배열 연산으로 계산한다.
+
+        1) seed 판정: 기사 i는 앞선 seed 중 누구와도 유사하지 않을 때만 seed가 된다.
+           순서 의존성이 있으므로, 이웃이 있는 행만 순서대로 훑으며 claimed 배열을 갱신한다.
+        2) 라벨: seed는 등장 순서대로 번호를 받고,
+           seed가 아닌 기사는 자신과 유사한 seed 중 '가장 뒤의 seed' 번호를 받는다.
+           (루프 방식에서 나중 seed가 앞 seed의 배정을 덮어쓰는 규칙과 같다)
+        """
+        n = adjacency.shape[0]
+        indptr, indices = adjacency.indptr, adjacency.indices
+
+        claimed = np.zeros(n, dtype=bool)
+        for i in np.flatnonzero(np.diff(indptr)):
+            if claimed[i]:
+                continue
+            claimed[indices[indptr[i]:indptr[i + 1]]] = True
+        is_seed = ~claimed
+
+        seed_rank = np.cumsum(is_seed) - 1
+
+        rows = np.repeat(np.arange(n), np.diff(indptr))
+        from_seed = is_seed[rows]
+        last_seed = np.full(n, -1, dtype=np.int64)
+        np.maximum.at(last_seed, indices[from_seed], rows[from_seed])
+
+        group_ids = np.where(is_seed, seed_rank, seed_rank[np.maximum(last_seed, 0)])
+
+        label = self.field_name or ""
+        print(f"[{label}] 유사 쌍 {adjacency.nnz}건 → 그룹 {int(is_seed.sum())}개 (기사 {n}건)")
+
+        return group_ids.tolist()
+
+    def _group_dense(self, texts: list[str], tfidf) -> list[int]:
         sim_matrix = cosine_similarity(tfidf)
 
         group_ids = [-1] * len(texts)
@@ -30,7 +219,7 @@ class ArticleSimilarityGrouper:
 
             group_ids[i] = current_group
 
-            label = self.field_name or ""            
+            label = self.field_name or ""
             for j in range(i + 1, len(texts)):
 
                 # 모든 비교 쌍에 대해 점수를 출력하고 싶다면 이 위치에 작성
@@ -39,7 +228,7 @@ class ArticleSimilarityGrouper:
                 if self.test_mode:
                     print(f"[{label} 유사도 {similarity_score:.4f}] {i}번 <-> {j}번")
                     print(f" [{i}] {texts[i][:150]}")
-                    print(f" [{j}] {texts[j][:150]}")               
+                    print(f" [{j}] {texts[j][:150]}")
 
                 if similarity_score >= self.threshold:
                     print(f"!! 아래 2개 기사는 {label}이 유사합니다 {similarity_score:.4f}")
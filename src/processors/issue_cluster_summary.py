@@ -0,0 +1,82 @@
+# processors/issue_cluster_summary.py
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+def _normalize_rows(x: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float32)
+    return x / np.maximum(np.linalg.norm(x, axis=1, keepdims=True), 1e-12)
+
+
+@dataclass
+class ClusterSummary:
+    labels: np.ndarray            # 군집 번호 (오름차순, 노이즈 -1 제외)
+    sizes: np.ndarray             # 군집별 기사 수
+    centers: np.ndarray           # 군집별 평균 임베딩 (n_clusters, dim) — centers.json에 저장하는 값
+    representatives: np.ndarray   # 군집별 중심과 가까운 기사 행 번호 (n_clusters, top_k), 기사가 top_k보다 적으면 -1로 채움
+
+
+def top_k_by_group(scores: np.ndarray, group: np.ndarray, n_groups: int, top_k: int) -> np.ndarray:
+    """
+    그룹별 점수 상위 top_k 행 번호 (n_groups, top_k), 내림차순, 모자라면 -1
+    group은 0..n_groups-1 (음수 행은 무시). 그룹마다 반복하지 않고 (그룹, -점수) lexsort 한 번 → 그룹 앞 top_k개.
+    메모리는 행 수에 비례한다. (같은 점수는 행 번호 순)
+    """
+    out = np.full((n_groups, top_k), -1, dtype=np.int64)
+    rows = np.flatnonzero(group >= 0)
+    if n_groups == 0 or top_k <= 0 or len(rows) == 0:
+        return out
+
+    order = rows[np.lexsort((-scores[rows], group[rows]))]
+    sizes = np.bincount(group[order], minlength=n_groups)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    rank = np.arange(len(order)) - starts[group[order]]     # 그룹 안 순번 (점수 내림차순)
+
+    top = rank < top_k
+    out[group[order][top], rank[top]] = order[top]
+    return out
+
+
+def summarize_clusters(embeddings: np.ndarray, cluster_ids: np.ndarray, top_k: int = 5) -> ClusterSummary:
+    """
+    군집 후처리를 한 번에: 군집 중심, 크기, 대표 기사
+    - 중심: 군집 번호로 정렬한 뒤 np.add.reduceat 한 번으로 군집별 합 → 평균 (군집마다 np.where 하지 않음)
+    - 유사도: 정규화 벡터와 정규화 중심의 행별 내적 (= 코사인, 전체 행렬을 한 번만 훑음)
+    - 대표 기사: 군집별 유사도 상위 top_k (top_k_by_group)
+    """
+    x = np.asarray(embeddings, dtype=np.float32)
+    cluster_ids = np.asarray(cluster_ids)
+    labels, group = np.unique(cluster_ids, return_inverse=True)
+    group = group.reshape(-1)
+    noise = labels < 0
+    if noise.any():
+        # 노이즈(-1)는 항상 맨 앞(0번) 그룹
+        labels = labels[~noise]
+        group = group - 1
+    n_groups = len(labels)
+
+    if n_groups == 0:
+        return ClusterSummary(
+            labels=labels, sizes=np.zeros(0, dtype=np.int64),
+            centers=np.zeros((0, x.shape[1]), dtype=np.float32),
+            representatives=np.full((0, top_k), -1, dtype=np.int64),
+        )
+
+    valid = np.flatnonzero(group >= 0)
+    order = valid[np.argsort(group[valid], kind="stable")]
+    sizes = np.bincount(group[order], minlength=n_groups)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    centers = np.add.reduceat(x[order], starts, axis=0) / sizes[:, None]
+
+    sims = np.full(len(x), -np.inf, dtype=np.float32)
+    unit_centers = _normalize_rows(centers)
+    sims[valid] = np.einsum("ij,ij->i", _normalize_rows(x[valid]), unit_centers[group[valid]])
+
+    return ClusterSummary(
+        labels=labels,
+        sizes=sizes,
+        centers=centers.astype(np.float32),
+        representatives=top_k_by_group(sims, group, n_groups, top_k),
+    )
@@ -0,0 +1,126 @@
+# processors/issue_cluster_sweep.py
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from multiprocessing import shared_memory
+from typing import Iterable, List, Optional
+
+import numpy as np
+import pandas as pd
+from sklearn.cluster import HDBSCAN
+from sklearn.metrics import silhouette_score
+
+from src.processors.issue_graph_clusterer import IssueGraphClusterer
+
+# 결과 표 컬럼 (clustering_experiments.csv)
+SWEEP_COLUMNS = [
+    "sweep_id", "base_date", "hours", "n_articles", "engine", "min_cluster_size", "min_samples",
+    "n_clusters", "n_noise", "noise_ratio", "silhouette", "seconds", "model", "template", "backend",
+]
+
+# 작업 프로세스가 붙는 공유 메모리 (프로세스마다 한 번 attach)
+_shared = {}
+
+
+def _attach(name: str, shape, dtype: str):
+    shm = shared_memory.SharedMemory(name=name)
+    _shared["shm"] = shm   # 참조를 유지해야 버퍼가 닫히지 않는다.
+    _shared["embeddings"] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _evaluate(task: dict) -> dict:
+    """공유 임베딩의 앞 n_articles행(시간창)을 한 설정으로 군집화하고 점수를 계산한다."""
+    x = _shared["embeddings"][:task["n_articles"]]
+    started = time.perf_counter()
+    if task["engine"] == "knn_graph":
+        clusterer = IssueGraphClusterer(task["min_cluster_size"], task["min_samples"], n_neighbors=task["n_neighbors"])
+    else:
+        clusterer = HDBSCAN(
+            min_cluster_size=task["min_cluster_size"],
+            min_samples=task["min_samples"],
+            metric="cosine",
+            copy=True,   # 공유 버퍼는 읽기 전용으로 다룬다.
+        )
+    labels = clusterer.fit_predict(x)
+    seconds = time.perf_counter() - started
+
+    valid = labels != -1
+    n_clusters = len(set(labels[valid]))
+    silhouette = np.nan
+    if valid.sum() >= 2 and n_clusters >= 2:
+        silhouette = float(silhouette_score(x[valid], labels[valid], metric="cosine"))
+
+    n_noise = int((~valid).sum())
+    return {
+        **{k: task[k] for k in ("hours", "n_articles", "engine", "min_cluster_size", "min_samples")},
+        "n_clusters": n_clusters,
+        "n_noise": n_noise,
+        "noise_ratio": round(n_noise / max(len(labels), 1) * 100, 2),
+        "silhouette": silhouette,
+        "seconds": round(seconds, 3),
+    }
+
+
+def sweep_tasks(
+    window_sizes: dict,
+    min_cluster_sizes: Iterable[int],
+    min_samples: Iterable[int],
+    engines: Iterable[str] = ("hdbscan",),
+    n_neighbors: int = 30,
+) -> List[dict]:
+    """(시간창, 엔진, MIN_CLUSTER_SIZE, MIN_SAMPLES) 격자. window_sizes: {hours: 창 안 기사 수}"""
+    tasks = []
+    for hours, engine, size, samples in product(sorted(window_sizes), engines, min_cluster_sizes, min_samples):
+        n = window_sizes[hours]
+        if n < max(size, samples, 2):
+            print(f"[WARN] {hours}시간 창 기사 {n}건 < 파라미터({size},{samples}), 건너뜁니다.")
+            continue
+        tasks.append({
+            "hours": hours, "n_articles": n, "engine": engine,
+            "min_cluster_size": int(size), "min_samples": int(samples), "n_neighbors": n_neighbors,
+        })
+    return tasks
+
+
+def run_sweep(embeddings: np.ndarray, tasks: List[dict], max_workers: Optional[int] = None) -> pd.DataFrame:
+    """
+    임베딩 한 벌로 여러 클러스터링 설정을 병렬 평가한다.
+
+    - embeddings는 pubDate 내림차순이어야 한다. 각 시간창은 앞 n_articles행이다. (창이 넓을수록 행이 늘어남)
+    - 임베딩 행렬은 shared_memory에 한 번 복사하고, 작업 프로세스는 이름으로 붙어 복사 없이 읽는다.
+    - 작업은 비용이 큰 것(기사 수가 많은 창)부터 넣는다. 결과는 tasks 순서로 돌려준다.
+    """
+    if not tasks:
+        return pd.DataFrame(columns=SWEEP_COLUMNS[2:])
+    x = np.ascontiguousarray(embeddings, dtype=np.float32)
+    max_workers = max_workers or min(len(tasks), os.cpu_count() or 1)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(x.nbytes, 1))
+    try:
+        np.ndarray(x.shape, dtype=x.dtype, buffer=shm.buf)[:] = x
+        order = sorted(range(len(tasks)), key=lambda i: -tasks[i]["n_articles"])
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_attach,
+            initargs=(shm.name, x.shape, x.dtype.str),
+        ) as executor:
+            futures = {i: executor.submit(_evaluate, tasks[i]) for i in order}
+            rows = []
+            for i in range(len(tasks)):
+                try:
+                    rows.append(futures[i].result())
+                except Exception as e:
+                    print(f"[WARN] 설정 평가 실패 {tasks[i]}: {e}")
+    finally:
+        shm.close()
+        shm.unlink()
+    return pd.DataFrame(rows)
+
+
+def append_results(path, df: pd.DataFrame):
+    """결과 표(CSV)에 행을 이어 쓴다. 파일이 없으면 헤더부터 (SWEEP_COLUMNS 순서, 없는 컬럼은 빈 값)"""
+    os.makedirs(os.path.dirname(str(path)) or ".", exist_ok=True)
+    write_header = not os.path.exists(str(path))
+    df.reindex(columns=SWEEP_COLUMNS).to_csv(path, mode="a", header=write_header, index=False)
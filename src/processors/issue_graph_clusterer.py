@@ -0,0 +1,150 @@
+# processors/issue_graph_clusterer.py
+
+from typing import Tuple
+
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+from sklearn.cluster import HDBSCAN
+
+# 코사인 거리 0(완전히 같은 벡터)도 sparse 행렬에서 '간선 없음'으로 사라지지 않게 하는 최소 거리
+_MIN_DISTANCE = 1e-9
+
+
+def _normalize(embeddings: np.ndarray) -> np.ndarray:
+    x = np.ascontiguousarray(embeddings, dtype=np.float32)
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    return x / np.maximum(norms, 1e-12)
+
+
+def exact_knn(x: np.ndarray, k: int, block_size: int = 2048) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    정규화된 벡터의 정확한 k-NN (자기 자신 제외, 코사인 거리 오름차순)
+    block_size행씩 내적 → argpartition, 전체 n×n 거리 행렬은 만들지 않는다.
+    """
+    n = len(x)
+    k = min(k, n - 1)
+    indices = np.empty((n, k), dtype=np.int64)
+    distances = np.empty((n, k), dtype=np.float32)
+    for start in range(0, n, block_size):
+        stop = min(start + block_size, n)
+        sims = x[start:stop] @ x.T
+        sims[np.arange(stop - start), np.arange(start, stop)] = -np.inf   # 자기 자신 제외
+        part = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        part_sims = np.take_along_axis(sims, part, axis=1)
+        order = np.argsort(-part_sims, axis=1, kind="stable")
+        indices[start:stop] = np.take_along_axis(part, order, axis=1)
+        distances[start:stop] = 1.0 - np.take_along_axis(part_sims, order, axis=1)
+    return indices, np.maximum(distances, 0.0)
+
+
+def hnsw_knn(x: np.ndarray, k: int, ef: int = None, m: int = 16) -> Tuple[np.ndarray, np.ndarray]:
+    """hnswlib 근사 k-NN (자기 자신 제외, 코사인 거리 오름차순). hnswlib이 없으면 ImportError"""
+    import hnswlib
+
+    n, dim = x.shape
+    k = min(k, n - 1)
+    ef = max(ef or 2 * k, k + 1)
+    index = hnswlib.Index(space="cosine", dim=dim)
+    index.init_index(max_elements=n, ef_construction=max(200, ef), M=m, random_seed=42)
+    index.add_items(x, np.arange(n))
+    index.set_ef(ef + 1)
+    labels, dists = index.knn_query(x, k=k + 1)
+
+    # 자기 자신을 빼고 k개만 남긴다. (중복 벡터면 자기 자신이 첫 자리가 아닐 수 있음)
+    labels = labels.astype(np.int64)
+    not_self = labels != np.arange(n)[:, None]
+    keep = np.cumsum(not_self, axis=1) <= k
+    mask = not_self & keep
+    indices = labels[mask].reshape(n, k)
+    distances = dists[mask].reshape(n, k).astype(np.float32)
+    return indices, np.maximum(distances, 0.0)
+
+
+def build_knn_graph(embeddings: np.ndarray, n_neighbors: int, method: str = "auto") -> sparse.csr_matrix:
+    """
+    k-NN 코사인 거리 그래프 (대칭 CSR, 자기 자신 간선 없음)
+
+    - method: "hnsw"(hnswlib 근사) / "exact"(블록 단위 정확 탐색) / "auto"(hnswlib이 있으면 hnsw)
+      hnswlib은 requirements.txt에 없는 선택 의존성이다. 기본 설치에서 "auto"는 "exact"가 되며,
+      이때도 내적은 n²번 계산한다. (n×n 행렬을 메모리에 두지 않을 뿐. 근사 탐색은 pip install hnswlib 후에만)
+    - i→j, j→i 중 하나만 k-NN이어도 간선을 둔다. (HDBSCAN precomputed는 대칭 행렬을 요구)
+    - 연결 요소가 여러 개면 요소 대표 기사끼리 실제 거리로 이어 하나로 만든다.
+      (dense HDBSCAN도 가장 가까운 요소끼리 결국 한 트리로 합치므로, 최상위 병합 높이만 조금 달라진다)
+    """
+    x = _normalize(embeddings)
+    n = len(x)
+
+    if method == "auto":
+        try:
+            import hnswlib  # noqa: F401
+            method = "hnsw"
+        except ImportError:
+            method = "exact"
+    if method == "hnsw":
+        indices, distances = hnsw_knn(x, n_neighbors)
+    elif method == "exact":
+        indices, distances = exact_knn(x, n_neighbors)
+    else:
+        raise ValueError(f"지원하지 않는 k-NN 방식: {method} (hnsw / exact / auto)")
+
+    rows = np.repeat(np.arange(n), indices.shape[1])
+    data = np.maximum(distances.ravel().astype(np.float64), _MIN_DISTANCE)
+    graph = sparse.csr_matrix((data, (rows, indices.ravel())), shape=(n, n))
+    graph = graph.maximum(graph.T).tocsr()
+
+    n_components, component = csgraph.connected_components(graph, directed=False)
+    if n_components > 1:
+        heads = np.array([np.flatnonzero(component == c)[0] for c in range(n_components)])
+        head_dist = np.maximum(1.0 - x[heads] @ x[heads].T, _MIN_DISTANCE).astype(np.float64)
+        a, b = np.triu_indices(n_components, k=1)
+        bridge = sparse.csr_matrix(
+            (np.concatenate([head_dist[a, b], head_dist[a, b]]),
+             (np.concatenate([heads[a], heads[b]]), np.concatenate([heads[b], heads[a]]))),
+            shape=(n, n),
+        )
+        graph = graph.maximum(bridge).tocsr()
+
+    graph.sort_indices()
+    return graph
+
+
+class IssueGraphClusterer:
+    """
+    k-NN 그래프 기반 HDBSCAN (이슈 클러스터링용)
+
+    - HDBSCAN(metric="cosine")은 n×n 코사인 거리 행렬을 만들어 시간창이 넓어지면 병목이 된다.
+    - 여기서는 정규화 벡터로 k-NN 그래프를 먼저 만들고, 그 sparse 거리 행렬을 HDBSCAN(metric="precomputed")에 넘긴다.
+      → k-NN 간선 위에서 mutual reachability 거리 → 최소 신장 트리 → 응축 트리/군집 선택
+    - 결과는 dense HDBSCAN과 같다고 보장되지 않는다. k-NN 밖 간선이 빠지고, 같은 거리 간선의 처리 순서(tie)가 달라
+      응축 트리가 조금씩 달라진다. (n_neighbors = n-2의 거의 완전한 그래프에서도 ARI 0.978~0.996, 1이 아님)
+      차이는 validators/check_issue_cluster_engine_parity.py로 확인한다.
+    - min_samples 보정: dense 계산은 거리 행에 자기 자신(0)이 들어 있어 core distance가 (min_samples-1)번째 이웃인데,
+      sparse 행에는 자기 자신이 없으므로 HDBSCAN에는 min_samples-1을 넘긴다. (같은 core distance)
+    - n_neighbors가 클수록 dense 결과에 가까워진다. min_samples 이상이어야 한다.
+    - k-NN 탐색은 build_knn_graph 참고 (기본 설치에서는 정확 탐색, hnswlib이 있으면 근사 탐색)
+    - 기사 수가 n_neighbors+1 이하이거나 min_samples < 2면 기존 dense HDBSCAN으로 계산한다.
+    """
+
+    def __init__(self, min_cluster_size: int, min_samples: int, n_neighbors: int = 30, knn_method: str = "auto"):
+        self.min_cluster_size = min_cluster_size
+        self.min_samples = min_samples
+        self.n_neighbors = max(n_neighbors, min_samples)
+        self.knn_method = knn_method
+
+    def fit_predict(self, embeddings: np.ndarray) -> np.ndarray:
+        n = len(embeddings)
+        if n <= self.n_neighbors + 1 or self.min_samples < 2:
+            return HDBSCAN(
+                min_cluster_size=self.min_cluster_size,
+                min_samples=self.min_samples,
+                metric="cosine",
+            ).fit_predict(embeddings)
+
+        graph = build_knn_graph(embeddings, self.n_neighbors, self.knn_method)
+        return HDBSCAN(
+            min_cluster_size=self.min_cluster_size,
+            min_samples=self.min_samples - 1,
+            metric="precomputed",
+            copy=False,
+        ).fit_predict(graph)
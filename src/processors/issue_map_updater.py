@@ -0,0 +1,157 @@
+# processors/issue_map_updater.py
+
+import json
+import os
+from typing import Callable, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+ISSUE_STATE_FILE = "state.json"
+ISSUE_CENTERS_FILE = "centers.json"
+ISSUE_META_FILE = "meta.json"
+ISSUE_ARTICLE_MAP_FILE = "article_map.csv"
+
+
+def _normalize_rows(x: np.ndarray) -> np.ndarray:
+    x = np.asarray(x, dtype=np.float32)
+    return x / np.maximum(np.linalg.norm(x, axis=1, keepdims=True), 1e-12)
+
+
+def load_issue_state(current_dir) -> Optional[dict]:
+    """
+    직전 실행의 이슈 지도 (current 폴더)
+    반환: {"state", "centers"(id → 벡터), "labels"(id → 라벨), "article_map"(news_id → id)} / 없거나 깨졌으면 None
+    """
+    paths = {name: os.path.join(str(current_dir), name)
+             for name in (ISSUE_STATE_FILE, ISSUE_CENTERS_FILE, ISSUE_META_FILE, ISSUE_ARTICLE_MAP_FILE)}
+    if not all(os.path.exists(p) for p in paths.values()):
+        return None
+    try:
+        with open(paths[ISSUE_STATE_FILE], "r", encoding="utf-8") as f:
+            state = json.load(f)
+        with open(paths[ISSUE_CENTERS_FILE], "r", encoding="utf-8") as f:
+            centers = {int(c["issue_cluster_id"]): np.asarray(c["issue_center_embedding"], dtype=np.float32)
+                       for c in json.load(f)}
+        with open(paths[ISSUE_META_FILE], "r", encoding="utf-8") as f:
+            labels = {int(m["issue_cluster_id"]): m.get("issue_label", "") for m in json.load(f)}
+        df_map = pd.read_csv(paths[ISSUE_ARTICLE_MAP_FILE], dtype={"news_id": str})
+        article_map = dict(zip(df_map["news_id"], df_map["issue_cluster_id"].astype(int)))
+    except Exception as e:
+        print(f"[WARN] 이전 이슈 지도 로드 실패, 전체 재계산합니다: {current_dir} ({e})")
+        return None
+    return {"state": state, "centers": centers, "labels": labels, "article_map": article_map}
+
+
+def save_issue_state(current_dir, state: dict, article_ids, cluster_ids):
+    """state.json과 article_map.csv를 current 폴더에 저장 (centers.json/meta.json은 호출 측이 저장)"""
+    os.makedirs(str(current_dir), exist_ok=True)
+    pd.DataFrame({"news_id": article_ids, "issue_cluster_id": cluster_ids}).to_csv(
+        os.path.join(str(current_dir), ISSUE_ARTICLE_MAP_FILE), index=False
+    )
+    tmp_path = os.path.join(str(current_dir), ISSUE_STATE_FILE + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, os.path.join(str(current_dir), ISSUE_STATE_FILE))
+
+
+def match_previous_ids(
+    labels: np.ndarray,
+    article_ids,
+    previous_map: Dict[str, int],
+    next_issue_id: int,
+) -> Tuple[np.ndarray, int]:
+    """
+    전체 재계산 결과의 군집 번호를 이전 issue_cluster_id로 바꾼다.
+    - 새 군집 기사 중 과반이 이전의 같은 이슈에 속해 있었으면 그 id를 이어 쓴다. (겹치는 기사 수가 큰 순서, id당 1회)
+    - 나머지 군집은 next_issue_id부터 새 id를 받는다. 노이즈(-1)는 그대로
+    반환: (issue_cluster_id 배열, 다음 새 id)
+    """
+    labels = np.asarray(labels)
+    out = np.full(len(labels), -1, dtype=np.int64)
+    previous = np.array([previous_map.get(a, -1) for a in article_ids], dtype=np.int64)
+
+    candidates = []
+    for label in np.unique(labels[labels >= 0]):
+        members = labels == label
+        prev_ids, counts = np.unique(previous[members & (previous >= 0)], return_counts=True)
+        for prev_id, count in zip(prev_ids, counts):
+            if count * 2 > members.sum():
+                candidates.append((int(count), int(label), int(prev_id)))
+
+    mapping, used = {}, set()
+    for _, label, prev_id in sorted(candidates, reverse=True):
+        if label not in mapping and prev_id not in used:
+            mapping[label] = prev_id
+            used.add(prev_id)
+
+    for label in np.unique(labels[labels >= 0]):
+        if int(label) not in mapping:
+            mapping[int(label)] = next_issue_id
+            next_issue_id += 1
+        out[labels == label] = mapping[int(label)]
+    return out, next_issue_id
+
+
+def update_issue_assignments(
+    embeddings: np.ndarray,
+    article_ids,
+    previous: dict,
+    next_issue_id: int,
+    min_cluster_size: int,
+    min_similarity: float,
+    recluster: Callable[[np.ndarray], np.ndarray],
+    min_residue: Optional[int] = None,
+) -> Tuple[np.ndarray, int, dict]:
+    """
+    증분 이슈 지도 갱신
+
+    1. 이전에 이슈가 있던 기사는 그 이슈를 유지한다. 단, 시간창 안에 남은 기사가 min_cluster_size 미만인 이슈는 만료
+    2. 처음 보는 기사는 살아 있는 이슈 중심(centers.json)과의 코사인 유사도가 min_similarity 이상이면 가장 가까운 이슈에 붙인다.
+    3. 나머지(미배정 신규 + 이전 노이즈 + 만료 이슈 기사)만 recluster로 다시 군집화하고, 새 군집은 새 id를 받는다.
+       (나머지가 min_residue건 미만이면 군집화하지 않고 노이즈로 둔다. 기본값 max(min_cluster_size, 2))
+    반환: (issue_cluster_id 배열, 다음 새 id, 통계)
+    """
+    x = _normalize_rows(embeddings)
+    n = len(x)
+    previous_map = previous["article_map"]
+    prev_ids = np.array([previous_map.get(a, -2) for a in article_ids], dtype=np.int64)   # -2: 처음 보는 기사
+    is_new = prev_ids == -2
+
+    ids, counts = np.unique(prev_ids[prev_ids >= 0], return_counts=True)
+    alive = [int(i) for i, c in zip(ids, counts) if c >= min_cluster_size and int(i) in previous["centers"]]
+    expired = [int(i) for i, c in zip(ids, counts) if int(i) not in alive]
+
+    out = np.full(n, -1, dtype=np.int64)
+    keep = np.isin(prev_ids, alive)
+    out[keep] = prev_ids[keep]
+
+    n_attached = 0
+    if alive and is_new.any():
+        centers = _normalize_rows(np.stack([previous["centers"][i] for i in alive]))
+        new_idx = np.flatnonzero(is_new)
+        sims = x[new_idx] @ centers.T
+        best = sims.argmax(axis=1)
+        ok = sims[np.arange(len(new_idx)), best] >= min_similarity
+        out[new_idx[ok]] = np.asarray(alive, dtype=np.int64)[best[ok]]
+        n_attached = int(ok.sum())
+
+    residue = np.flatnonzero(out == -1)
+    n_new_clusters = 0
+    if len(residue) >= (min_residue or max(min_cluster_size, 2)):
+        sub_labels = np.asarray(recluster(x[residue]))
+        for label in np.unique(sub_labels[sub_labels >= 0]):
+            out[residue[sub_labels == label]] = next_issue_id
+            next_issue_id += 1
+            n_new_clusters += 1
+
+    stats = {
+        "kept": int(keep.sum()),
+        "new_articles": int(is_new.sum()),
+        "attached": n_attached,
+        "alive_issues": len(alive),
+        "expired_issues": len(expired),
+        "residue": int(len(residue)),
+        "new_issues": n_new_clusters,
+    }
+    return out, next_issue_id, stats
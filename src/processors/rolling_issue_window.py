@@ -0,0 +1,288 @@
+# processors/rolling_issue_window.py
+
+import csv
+import os
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.api.archive_backends import pubdate_sort_key
+from src.api.article_store import get_article_store, ARCHIVE_CANONICAL
+
+# 이슈 클러스터링에 필요한 canonical 컬럼 (build_corpus: title/content, 결과: news_id/pubDate)
+WINDOW_COLUMNS = ["news_id", "pubDate", "title", "content"]
+
+
+def _to_utc(value) -> pd.Timestamp:
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize("Asia/Seoul")
+    return ts.tz_convert("UTC")
+
+
+def _iter_csv_records(f, start: int, end: int):
+    """
+    바이너리 파일 f의 [start, end) 구간을 CSV 레코드로 읽는다. → (레코드 시작 오프셋, 필드 목록, 레코드 끝 오프셋)
+    따옴표 안 줄바꿈은 한 레코드로 묶는다. 줄바꿈으로 끝나지 않은 마지막 레코드(다른 프로세스가 쓰는 중)는 돌려주지 않는다.
+    """
+    f.seek(start)
+    pos = [start]
+
+    def lines():
+        while pos[0] < end:
+            line = f.readline(end - pos[0])
+            if not line.endswith(b"\n"):
+                return
+            pos[0] += len(line)
+            yield line.decode("utf-8")
+
+    reader = csv.reader(lines(), strict=True)
+    while True:
+        record_start = pos[0]
+        try:
+            fields = next(reader)
+        except (StopIteration, csv.Error):
+            return
+        yield record_start, fields, pos[0]
+
+
+class ArticleTimeIndex:
+    """
+    canonical 기사 pubDate 시간 인덱스 (시간창 조회용)
+
+    - sqlite: 저장소의 (archive, pub_ts) 인덱스로 구간의 news_id/pubDate만 조회하고, 기사 행은 필요한 news_id만 읽는다.
+    - csv/parquet: canonical_archive.csv에서 news_id, pubDate(UTC epoch ns), 행의 바이트 오프셋만 메모리에 둔다.
+      canonical은 증분 통합이 끝에 이어 쓰므로, 파일이 바뀌면 지난번에 읽은 오프셋 뒤(이어 쓴 부분)만 파싱한다.
+      기사 행(title/content)은 rows()에서 요청한 news_id만 오프셋으로 찾아 읽는다.
+      파일이 줄었거나 다른 파일로 교체됐거나 읽은 구간 끝이 달라졌으면(전체 계산으로 다시 쓴 경우) 처음부터 다시 읽는다.
+    """
+
+    # 읽은 구간 끝이 그대로인지 확인할 때 비교하는 바이트 수
+    SIGNATURE_BYTES = 64
+
+    def __init__(self, backend: str, csv_path: str, store_path: str, columns: Optional[List[str]] = None):
+        self.backend = backend
+        self.csv_path = csv_path
+        self.store_path = store_path
+        self.columns = list(columns or WINDOW_COLUMNS)
+        self._version = None
+        self._reset_csv()
+
+    def _reset_csv(self):
+        self._header = None       # csv 헤더 컬럼
+        self._offset = 0          # 여기까지 파싱함 (바이트)
+        self._inode = None
+        self._signature = b""     # _offset 직전 SIGNATURE_BYTES 바이트
+        self._ids = np.empty(0, dtype=object)       # 파일 순서 news_id
+        self._pubs = np.empty(0, dtype=np.int64)    # 파일 순서 pubDate (UTC epoch ns)
+        self._offsets = np.empty(0, dtype=np.int64) # 파일 순서 행 시작 오프셋
+        self._keys = None         # 정렬된 pubDate
+        self._sorted_ids = None   # _keys 순서 news_id
+        self._lookup = None       # news_id → 행 시작 오프셋
+
+    def version(self) -> str:
+        if self.backend == "sqlite":
+            return get_article_store(self.store_path).version(ARCHIVE_CANONICAL)
+        if not os.path.exists(self.csv_path):
+            return ""
+        stat = os.stat(self.csv_path)
+        return f"csv:{stat.st_size}:{stat.st_mtime_ns}"
+
+    def refresh(self) -> bool:
+        """canonical이 바뀌었으면 인덱스를 갱신한다. (바뀌었으면 True)"""
+        version = self.version()
+        if version == self._version:
+            return False
+        self._version = version
+        if self.backend != "sqlite":
+            self._load_csv()
+        return True
+
+    def _appended_only(self, stat) -> bool:
+        """지난번에 읽은 부분이 그대로이고 뒤에만 붙었는지"""
+        if self._header is None or stat.st_ino != self._inode or stat.st_size < self._offset:
+            return False
+        start = max(self._offset - self.SIGNATURE_BYTES, 0)
+        with open(self.csv_path, "rb") as f:
+            f.seek(start)
+            return f.read(self._offset - start) == self._signature
+
+    def _load_csv(self):
+        if not os.path.exists(self.csv_path):
+            self._reset_csv()
+            self._build_views()
+            return
+        stat = os.stat(self.csv_path)
+        if not self._appended_only(stat):
+            self._reset_csv()
+            self._inode = stat.st_ino
+
+        ids, pubs, offsets = [], [], []
+        with open(self.csv_path, "rb") as f:
+            records = _iter_csv_records(f, self._offset, stat.st_size)
+            if self._header is None:
+                first = next(records, None)
+                if first is None:
+                    self._build_views()
+                    return
+                _, fields, self._offset = first
+                self._header = [c.lstrip("\ufeff") for c in fields]
+            if "news_id" not in self._header or "pubDate" not in self._header:
+                print(f"[WARN] {self.csv_path}에 news_id/pubDate 컬럼이 없습니다.")
+                self._build_views()
+                return
+            id_col, pub_col = self._header.index("news_id"), self._header.index("pubDate")
+
+            for record_start, fields, record_end in records:
+                self._offset = record_end
+                if len(fields) != len(self._header):
+                    continue
+                ids.append(fields[id_col])
+                pubs.append(fields[pub_col])
+                offsets.append(record_start)
+
+            sig_start = max(self._offset - self.SIGNATURE_BYTES, 0)
+            f.seek(sig_start)
+            self._signature = f.read(self._offset - sig_start)
+
+        if ids:
+            keys = pubdate_sort_key(pd.Series(pubs, dtype="string"))
+            valid = keys.notna().to_numpy()
+            keys = keys[valid].to_numpy(dtype="datetime64[ns]").astype(np.int64)
+            self._ids = np.concatenate([self._ids, np.asarray(ids, dtype=object)[valid]])
+            self._pubs = np.concatenate([self._pubs, keys])
+            self._offsets = np.concatenate([self._offsets, np.asarray(offsets, dtype=np.int64)[valid]])
+        self._build_views()
+
+    def _build_views(self):
+        """파일 순서 배열 → 같은 news_id는 나중 행만 남기고 pubDate 오름차순 정렬"""
+        keep = ~pd.Index(self._ids).duplicated(keep="last")
+        if not keep.all():
+            self._ids, self._pubs, self._offsets = self._ids[keep], self._pubs[keep], self._offsets[keep]
+        order = np.argsort(self._pubs, kind="stable")
+        self._keys = self._pubs[order]
+        self._sorted_ids = self._ids[order]
+        self._lookup = pd.Series(self._offsets, index=pd.Index(self._ids))
+
+    def window(self, since, until) -> pd.DataFrame:
+        """since <= pubDate <= until 기사의 news_id, pub (UTC) — pubDate 내림차순"""
+        since_utc, until_utc = _to_utc(since), _to_utc(until)
+        if self.backend == "sqlite":
+            df = get_article_store(self.store_path).query(
+                ARCHIVE_CANONICAL, since=since, until=until, columns=["news_id", "pubDate"]
+            )
+            df = df.drop_duplicates("news_id")
+            pub = pubdate_sort_key(df["pubDate"].astype(str))
+            # pub_ts는 초 단위라 경계의 1초 안쪽 기사가 섞일 수 있다.
+            mask = (pub >= since_utc) & (pub <= until_utc)
+            return pd.DataFrame({"news_id": df["news_id"].astype(str)[mask].to_numpy(),
+                                 "pub": pub[mask].to_numpy()})
+
+        if self._keys is None:
+            self.refresh()
+        lo = np.searchsorted(self._keys, since_utc.value, side="left")
+        hi = np.searchsorted(self._keys, until_utc.value, side="right")
+        return pd.DataFrame({
+            "news_id": self._sorted_ids[lo:hi][::-1].astype(str),
+            "pub": pd.to_datetime(self._keys[lo:hi][::-1], utc=True),
+        })
+
+    def rows(self, news_ids: List[str]) -> pd.DataFrame:
+        """news_id의 기사 행 (self.columns, 입력 순서, 없는 news_id는 빠짐)"""
+        if not news_ids:
+            return pd.DataFrame(columns=self.columns)
+        if self.backend == "sqlite":
+            df = get_article_store(self.store_path).fetch(ARCHIVE_CANONICAL, news_ids, self.columns)
+            df = df.drop_duplicates("news_id").set_index("news_id", drop=False)
+            found = [i for i in news_ids if i in df.index]
+            return df.loc[found, [c for c in self.columns if c in df.columns]].reset_index(drop=True)
+
+        if self._lookup is None:
+            self.refresh()
+        positions = self._lookup.index.get_indexer(news_ids)
+        wanted = [(i, int(self._lookup.iat[p])) for i, p in zip(news_ids, positions) if p >= 0]
+        columns = [c for c in self.columns if c in (self._header or [])]
+        records, skipped = [], 0
+        with open(self.csv_path, "rb") as f:
+            for news_id, offset in wanted:
+                record = next(_iter_csv_records(f, offset, self._offset), None)
+                # 읽은 뒤 파일이 다시 써졌으면 오프셋이 어긋난다. (다음 tick에 다시 읽음)
+                if record is None or len(record[1]) != len(self._header) or record[1][self._header.index("news_id")] != news_id:
+                    skipped += 1
+                    continue
+                row = dict(zip(self._header, record[1]))
+                records.append([row[c] for c in columns])
+        if skipped:
+            print(f"[WARN] canonical 파일이 바뀌어 기사 {skipped}건을 읽지 못했습니다. 다음 갱신에 다시 읽습니다.")
+        df = pd.DataFrame(records, columns=columns)
+        # read_csv와 같이 빈 값은 NaN
+        return df.replace("", np.nan).reset_index(drop=True)
+
+
+@dataclass
+class WindowTick:
+    base_timestamp: pd.Timestamp
+    cutoff: pd.Timestamp
+    df: pd.DataFrame            # 창 안 기사 (pubDate 내림차순)
+    embeddings: np.ndarray      # df와 같은 순서
+    entering: pd.DataFrame      # 직전 tick 이후 창에 들어온 기사
+    leaving: List[str]          # 직전 tick 이후 창에서 나간 news_id (시간 경과 또는 canonical에서 제외)
+
+
+class RollingIssueWindow:
+    """
+    이슈 클러스터링용 이동 시간창 (최근 hours시간)
+
+    - tick(기준시)마다 시간 인덱스에서 창 안의 news_id만 조회해 직전 창과 비교한다.
+      들어온 기사만 행을 읽고 embed(DataFrame → 벡터)로 임베딩하며, 나간 기사는 버린다.
+    - 창의 기사와 임베딩은 메모리에 유지하므로, tick 비용은 이력 전체가 아니라 창 크기와 들어온 기사 수에 비례한다.
+    - embed는 EmbeddingStore를 거치므로 이미 저장된 기사는 인코딩하지 않는다. (general_issue_clusters.embed_window_articles)
+    - pubDate가 창 안인 기사가 나중에 수집되어도(늦게 들어온 기사) 다음 tick에 들어온 기사로 잡힌다.
+    """
+
+    def __init__(self, index: ArticleTimeIndex, hours: float, embed: Callable[[pd.DataFrame], np.ndarray]):
+        self.index = index
+        self.hours = hours
+        self.embed = embed
+        self.df = pd.DataFrame(columns=index.columns)
+        self.embeddings = None
+
+    def tick(self, base_timestamp) -> WindowTick:
+        base_timestamp = pd.Timestamp(base_timestamp)
+        cutoff = base_timestamp - pd.Timedelta(hours=self.hours)
+        self.index.refresh()
+        current = self.index.window(cutoff, base_timestamp)
+        current_ids = current["news_id"].tolist()
+
+        held = set(self.df["news_id"])
+        current_set = set(current_ids)
+        leaving = [i for i in self.df["news_id"] if i not in current_set]
+        entering = self.index.rows([i for i in current_ids if i not in held])
+
+        keep = self.df["news_id"].isin(current_set).to_numpy()
+        kept_df = self.df[keep]
+        kept_emb = self.embeddings[keep] if self.embeddings is not None else None
+
+        new_emb = None
+        if len(entering):
+            new_emb = np.asarray(self.embed(entering), dtype=np.float32)
+        parts = [e for e in (kept_emb, new_emb) if e is not None and len(e)]
+        combined = pd.concat([kept_df, entering], ignore_index=True)
+        embeddings = np.concatenate(parts) if parts else None
+
+        # 시간 인덱스 순서(pubDate 내림차순)로 정렬 (행을 못 읽은 news_id는 빠짐)
+        position = pd.Series(np.arange(len(combined)), index=combined["news_id"].to_numpy())
+        order = position.reindex(current_ids).dropna().astype(int).to_numpy()
+        self.df = combined.iloc[order].reset_index(drop=True)
+        self.embeddings = embeddings[order] if embeddings is not None else None
+
+        return WindowTick(
+            base_timestamp=base_timestamp,
+            cutoff=cutoff,
+            df=self.df,
+            embeddings=self.embeddings,
+            entering=entering,
+            leaving=leaving,
+        )
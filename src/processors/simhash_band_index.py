@@ -0,0 +1,113 @@
+# processors/simhash_band_index.py
+
+from itertools import combinations
+from math import comb
+from typing import List, Tuple
+
+import numpy as np
+
+# 0~255 각 바이트 값의 1비트 개수 (np.bitwise_count가 없는 NumPy 1.x 대비)
+_POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount64(values: np.ndarray) -> np.ndarray:
+    """uint64 배열의 원소별 1비트 개수"""
+    values = np.ascontiguousarray(values, dtype=np.uint64)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values).astype(np.int64)
+    as_bytes = values.view(np.uint8).reshape(-1, 8)
+    return _POPCOUNT_TABLE[as_bytes].sum(axis=1, dtype=np.int64)
+
+
+def hamming_distances(x, block: np.ndarray) -> np.ndarray:
+    """
+    SimHash 지문 x(또는 block과 같은 길이의 배열)와 block 사이의 Hamming distance.
+    XOR 후 popcount 한 번으로 한 행 대 여러 행을 동시에 계산한다.
+    """
+    return popcount64(np.bitwise_xor(np.asarray(x, dtype=np.uint64), np.asarray(block, dtype=np.uint64)))
+
+
+class SimHashBandIndex:
+    """
+    SimHash 지문용 블록(band) 색인 (Manku et al. 방식의 permutation index)
+
+    원리
+    - f비트 지문을 m개 블록으로 나눈다.
+    - 두 지문의 Hamming distance가 k 이하라면, 다른 비트는 최대 k개 블록에만 걸쳐 있으므로
+      최소 r = m - k 개의 블록은 완전히 같다. (비둘기집 원리)
+    - 따라서 'r개 블록 조합'을 키로 하는 버킷을 만들면,
+      거리 k 이하인 쌍은 반드시 어떤 버킷 하나를 공유한다. (누락 없음)
+    - 버킷을 공유한 쌍은 '후보'일 뿐이므로 실제 거리 검증은 호출 측에서 한다.
+
+    r(matched_blocks)을 키우면 키 비트 수가 늘어 후보가 줄지만, 테이블 수 C(m, r)가 늘어난다.
+    """
+
+    def __init__(self, distance: int, matched_blocks: int = 2, f: int = 64):
+        if distance < 0:
+            raise ValueError("distance는 0 이상이어야 합니다.")
+        self.distance = distance
+        self.matched_blocks = matched_blocks
+        self.f = f
+        self.num_blocks = distance + matched_blocks
+        if self.num_blocks > f:
+            raise ValueError(f"블록 수({self.num_blocks})가 지문 비트 수({f})보다 큽니다.")
+
+        # f비트를 최대한 균등한 폭의 블록으로 분할 (앞 블록이 1비트씩 더 넓다)
+        base, extra = divmod(f, self.num_blocks)
+        self._blocks: List[Tuple[int, int]] = []  # (shift, width)
+        shift = 0
+        for b in range(self.num_blocks):
+            width = base + (1 if b < extra else 0)
+            self._blocks.append((shift, width))
+            shift += width
+
+        self._tables = list(combinations(range(self.num_blocks), matched_blocks))
+
+    @property
+    def num_tables(self) -> int:
+        return len(self._tables)
+
+    def estimated_collision_rate(self) -> float:
+        """지문이 균일 분포라고 가정했을 때, 무관한 두 지문이 후보가 될 대략적인 확률"""
+        key_bits = self.f * self.matched_blocks / self.num_blocks
+        return min(1.0, comb(self.num_blocks, self.matched_blocks) / (2 ** key_bits))
+
+    def candidate_pairs(self, values) -> np.ndarray:
+        """
+        uint64 지문 배열에서 거리 k 이하일 수 있는 (i, j), i < j 후보 쌍을 반환한다.
+        반환: shape (p, 2) int64 배열, (i, j) 사전순 정렬, 중복 없음
+        """
+        values = np.asarray(values, dtype=np.uint64)
+        n = len(values)
+        if n < 2:
+            return np.empty((0, 2), dtype=np.int64)
+
+        parts = [
+            (values >> np.uint64(shift)) & np.uint64((1 << width) - 1)
+            for shift, width in self._blocks
+        ]
+
+        pair_codes = []
+        for table in self._tables:
+            # r개 블록을 이어 붙여 하나의 버킷 키로 만든다. (최대 f비트)
+            key = np.zeros(n, dtype=np.uint64)
+            for b in table:
+                key = (key << np.uint64(self._blocks[b][1])) | parts[b]
+
+            order = np.argsort(key, kind="stable")
+            sorted_key = key[order]
+            boundaries = np.flatnonzero(sorted_key[1:] != sorted_key[:-1]) + 1
+            starts = np.concatenate(([0], boundaries))
+            ends = np.concatenate((boundaries, [n]))
+
+            for start, end in zip(starts[ends - starts >= 2], ends[ends - starts >= 2]):
+                # stable 정렬이므로 버킷 멤버는 행 순서대로 나열되어 있다.
+                members = order[start:end]
+                upper_i, upper_j = np.triu_indices(len(members), k=1)
+                pair_codes.append(members[upper_i].astype(np.int64) * n + members[upper_j])
+
+        if not pair_codes:
+            return np.empty((0, 2), dtype=np.int64)
+
+        codes = np.unique(np.concatenate(pair_codes))
+        return np.stack((codes // n, codes % n), axis=1)
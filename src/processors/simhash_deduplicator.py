@@ -1,6 +1,10 @@
 import simhash
+import numpy as np
 import pandas as pd
-from typing import List, Tuple
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+from processors.simhash_band_index import SimHashBandIndex, hamming_distances
+from processors.simhash_fingerprint_store import SimHashFingerprintStore
 
 
 class SimHashDeduplicator:
@@ -14,7 +18,18 @@ class SimHashDeduplicator:
     - 이슈 유사도 판단이나 클러스터링은 수행하지 않음
     """
 
-    def __init__(self, body_distance: int, title_distance: int):
+    # 과거 지문과 비교할 때 한 번에 비교하는 신규 기사 수 (chunk × 과거 지문 수 만큼 메모리 사용)
+    HISTORY_CHUNK_SIZE = 256
+
+    def __init__(
+        self,
+        body_distance: int,
+        title_distance: int,
+        use_index: bool = True,
+        history_store: Optional[SimHashFingerprintStore] = None,
+        history_days: float = 3,
+        shared_store: Optional[SimHashFingerprintStore] = None,
+    ):
         """
         Parameters
         ----------
@@ -25,9 +40,25 @@ class SimHashDeduplicator:
         title_distance : int
             제목 SimHash 간 Hamming distance 임계값.
             이 값 이하일 경우 제목이 거의 동일한 것으로 판단한다.
+
+        use_index : bool
+            True면 블록 색인(SimHashBandIndex)으로 후보 쌍만 찾아 검증한다.
+            False면 한 행 대 뒤쪽 전체 행을 XOR + popcount로 한 번에 비교한다. (결과는 동일)
+
+        history_store : SimHashFingerprintStore, optional
+            지정하면 최근 history_days일 동안 기록된 지문과도 비교해
+            과거 기사의 near-duplicate를 제거하고, 살아남은 기사의 지문을 기록한다.
+            (보통 키워드별 저장소)
+
+        shared_store : SimHashFingerprintStore, optional
+            살아남은 기사의 지문을 기록만 하는 저장소. 비교에는 쓰지 않는다. (전역 저장소)
         """
         self.body_distance = body_distance
         self.title_distance = title_distance
+        self.use_index = use_index
+        self.history_store = history_store
+        self.history_days = history_days
+        self.shared_store = shared_store
 
     def _build_simhash(self, text: str) -> simhash.Simhash:
         """
@@ -37,6 +68,17 @@ class SimHashDeduplicator:
             text = ""
         return simhash.Simhash(text)
 
+    def _build_fingerprints(self, texts: pd.Series) -> np.ndarray:
+        """
+        텍스트 Series → 64비트 SimHash 지문 배열 (uint64, 연속 메모리)
+        Simhash 객체는 지문 계산에만 쓰고 보관하지 않는다.
+        """
+        return np.fromiter(
+            (self._build_simhash(t).value for t in texts.fillna("")),
+            dtype=np.uint64,
+            count=len(texts),
+        )
+
     def deduplicate(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.DataFrame]:
         if df.empty:
             return df, df
@@ -48,9 +90,9 @@ class SimHashDeduplicator:
             print("[SimHash] 'title' 또는 'content' 컬럼이 없어 중복 제거를 건너뜁니다.")
             return df, pd.DataFrame()
 
-        # SimHash 계산
-        df["_body_simhash"] = df["content"].fillna("").apply(self._build_simhash)
-        df["_title_simhash"] = df["title"].fillna("").apply(self._build_simhash)
+        # SimHash 계산 (uint64 지문)
+        df["_body_simhash"] = self._build_fingerprints(df["content"])
+        df["_title_simhash"] = self._build_fingerprints(df["title"])
 
         # 시간순 정렬 (먼저 수집된 기사를 유지)
         if "collected_at" in df.columns:
@@ -63,51 +105,145 @@ class SimHashDeduplicator:
 
         rows = df.to_dict("records")
 
+        # 정렬된 순서 그대로의 연속 지문 배열
+        body_fp = np.ascontiguousarray(df["_body_simhash"].to_numpy(dtype=np.uint64))
+        title_fp = np.ascontiguousarray(df["_title_simhash"].to_numpy(dtype=np.uint64))
+
+        # 과거 실행에서 이미 기록된 기사와 거의 동일한 기사 (위치 → 과거 news_id)
+        history_matches = self._match_history(df, title_fp, body_fp)
+
+        # i < j 이면서 제목/본문이 모두 가까운 쌍 (i 기준 목록)
+        near_pairs = self._find_near_pairs(title_fp, body_fp)
+
         for i, row_i in enumerate(rows):
-            if i in dropped_indices:
+            if i in dropped_indices or i in history_matches:
                 continue
 
             keep_indices.append(i)
 
-            for j in range(i + 1, len(rows)):
-                if j in dropped_indices:
+            for j, body_dist, title_dist in near_pairs.get(i, []):
+                if j in dropped_indices or j in history_matches:
                     continue
 
-                # 본문 + 제목 모두 비교
-                body_dist = row_i["_body_simhash"].distance(rows[j]["_body_simhash"])
-                title_dist = row_i["_title_simhash"].distance(rows[j]["_title_simhash"])
-
-                body_similar = body_dist <= self.body_distance
-                title_similar = title_dist <= self.title_distance
-
                 # AND 조건: 둘 다 거의 동일한 경우만 제거
-                if body_similar and title_similar:
-
-                    print(
-                        f"\n[SimHash 중복 발견]"
-                        f"\n - 본문 거리: {body_dist} (≤ {self.body_distance})"
-                        f"\n - 제목 거리: {title_dist} (≤ {self.title_distance})"
-                    )
-                    print(f" > 기준 기사: {row_i['title']}")
-                    print(f"   본문: {row_i['content'][:100]}...")
-                    print(f" > 삭제 대상: {rows[j]['title']}")
-                    print(f"   본문: {rows[j]['content'][:100]}...")
-                    print("-" * 60)
-
-                    dropped_indices.add(j)
+                print(
+                    f"\n[SimHash 중복 발견]"
+                    f"\n - 본문 거리: {body_dist} (≤ {self.body_distance})"
+                    f"\n - 제목 거리: {title_dist} (≤ {self.title_distance})"
+                )
+                print(f" > 기준 기사: {row_i['title']}")
+                print(f"   본문: {row_i['content'][:100]}...")
+                print(f" > 삭제 대상: {rows[j]['title']}")
+                print(f"   본문: {rows[j]['content'][:100]}...")
+                print("-" * 60)
+
+                dropped_indices.add(j)
 
         kept_df = df.iloc[keep_indices].copy()
         removed_df = df.iloc[list(dropped_indices)].copy()
+        removed_df["removed_by"] = "simhash"
+
+        if history_matches:
+            history_positions = sorted(history_matches)
+            history_removed_df = df.iloc[history_positions].copy()
+            history_removed_df["removed_by"] = "simhash_history"
+            history_removed_df["history_match"] = [history_matches[i] for i in history_positions]
+            removed_df = pd.concat([history_removed_df, removed_df])
+
+        # 살아남은 기사의 지문 기록 (다음 실행의 비교 대상)
+        self._record_fingerprints(kept_df)
 
         # 내부 컬럼 제거
         kept_df.drop(columns=["_body_simhash", "_title_simhash"], inplace=True, errors="ignore")
         removed_df.drop(columns=["_body_simhash", "_title_simhash"], inplace=True, errors="ignore")
 
-        removed_df["removed_by"] = "simhash"
-
         print(
             f"[SimHash] near-duplicate 인풋 {len(df)}건 → "
-            f"아웃풋 {len(kept_df)}건 (삭제 {len(removed_df)}건)"
+            f"아웃풋 {len(kept_df)}건 (삭제 {len(removed_df)}건, 과거 기사 중복 {len(history_matches)}건)"
         )
 
         return kept_df, removed_df
+
+    def _match_history(self, df: pd.DataFrame, title_fp: np.ndarray, body_fp: np.ndarray) -> Dict[int, str]:
+        """
+        history_store의 최근 지문과 제목/본문이 모두 가까운 신규 기사를 찾는다.
+        같은 news_id(같은 link)는 자기 자신이므로 제외한다.
+        반환: {정렬된 df에서의 위치: 일치한 과거 news_id}
+        """
+        if self.history_store is None or "news_id" not in df.columns:
+            return {}
+
+        hist_ids, hist_title, hist_body = self.history_store.recent(self.history_days)
+        if len(hist_ids) == 0:
+            return {}
+
+        news_ids = df["news_id"].astype(str).to_numpy()
+        matches: Dict[int, str] = {}
+
+        for start in range(0, len(df), self.HISTORY_CHUNK_SIZE):
+            end = min(start + self.HISTORY_CHUNK_SIZE, len(df))
+            # (chunk, history) 거리 행렬을 브로드캐스팅 XOR + popcount로 한 번에 계산
+            title_dist = hamming_distances(title_fp[start:end, None], hist_title[None, :]).reshape(end - start, -1)
+            body_dist = hamming_distances(body_fp[start:end, None], hist_body[None, :]).reshape(end - start, -1)
+            near = (title_dist <= self.title_distance) & (body_dist <= self.body_distance)
+            near &= news_ids[start:end, None] != hist_ids[None, :]
+
+            for local_i in np.flatnonzero(near.any(axis=1)):
+                matches[start + int(local_i)] = hist_ids[np.argmax(near[local_i])]
+
+        return matches
+
+    def _record_fingerprints(self, kept_df: pd.DataFrame):
+        if kept_df.empty or "news_id" not in kept_df.columns:
+            return
+
+        for store in (self.history_store, self.shared_store):
+            if store is None:
+                continue
+            store.append(
+                kept_df["news_id"].astype(str).tolist(),
+                kept_df["_title_simhash"].to_numpy(dtype=np.uint64),
+                kept_df["_body_simhash"].to_numpy(dtype=np.uint64),
+            )
+
+    def _find_near_pairs(self, title_fp: np.ndarray, body_fp: np.ndarray) -> Dict[int, List[Tuple[int, int, int]]]:
+        """
+        제목과 본문이 모두 임계값 이내인 (i, j), i < j 쌍을 찾는다.
+        반환: {i: [(j, body_dist, title_dist), ...]} (j 오름차순)
+        """
+        near_pairs = defaultdict(list)
+
+        if self.use_index:
+            candidates = self._candidate_pairs(title_fp, body_fp)
+            pair_i, pair_j = candidates[:, 0], candidates[:, 1]
+
+            # 후보 쌍 전체를 한 번에 검증 (본문 + 제목 모두 비교)
+            body_dist = hamming_distances(body_fp[pair_i], body_fp[pair_j])
+            title_dist = hamming_distances(title_fp[pair_i], title_fp[pair_j])
+            mask = (body_dist <= self.body_distance) & (title_dist <= self.title_distance)
+
+            for i, j, bd, td in zip(pair_i[mask], pair_j[mask], body_dist[mask], title_dist[mask]):
+                near_pairs[int(i)].append((int(j), int(bd), int(td)))
+            return near_pairs
+
+        # 색인 미사용: 한 행 대 뒤쪽 블록 전체를 배열 연산으로 비교
+        n = len(title_fp)
+        for i in range(n - 1):
+            body_dist = hamming_distances(body_fp[i], body_fp[i + 1:])
+            title_dist = hamming_distances(title_fp[i], title_fp[i + 1:])
+            hits = np.flatnonzero((body_dist <= self.body_distance) & (title_dist <= self.title_distance))
+            for k in hits:
+                near_pairs[i].append((i + 1 + int(k), int(body_dist[k]), int(title_dist[k])))
+        return near_pairs
+
+    def _candidate_pairs(self, title_fp: np.ndarray, body_fp: np.ndarray) -> np.ndarray:
+        """
+        AND 조건이므로 제목/본문 중 한쪽 색인만으로도 누락 없이 후보를 찾을 수 있다.
+        무관한 쌍이 후보로 섞일 확률이 더 낮은 쪽(보통 임계값이 작은 제목)으로 색인한다.
+        """
+        title_index = SimHashBandIndex(self.title_distance)
+        body_index = SimHashBandIndex(self.body_distance)
+
+        if title_index.estimated_collision_rate() <= body_index.estimated_collision_rate():
+            return title_index.candidate_pairs(title_fp)
+        return body_index.candidate_pairs(body_fp)
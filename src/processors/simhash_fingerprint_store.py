@@ -0,0 +1,108 @@
+# processors/simhash_fingerprint_store.py
+
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+class SimHashFingerprintStore:
+    """
+    SimHash 지문 영구 저장소 (고정 길이 레코드 바이너리 파일)
+
+    레코드 (36 bytes)
+    - news_id    : 12바이트 ASCII (NewsArticleModel의 md5 앞 12자리)
+    - title_hash : uint64 제목 SimHash
+    - body_hash  : uint64 본문 SimHash
+    - recorded_at: int64 기록 시각 (epoch 초)
+
+    - 파일은 append-only이며, 시작 시 np.memmap으로 읽기 전용 매핑한다.
+    - 과거 CSV를 다시 읽거나 텍스트를 다시 해싱하지 않고 최근 N일 지문을 바로 얻는 것이 목적이다.
+    - 중간에 끊긴 마지막 레코드(파일 크기가 레코드 배수가 아닌 경우)는 무시한다.
+    """
+
+    RECORD_DTYPE = np.dtype([
+        ("news_id", "S12"),
+        ("title_hash", "<u8"),
+        ("body_hash", "<u8"),
+        ("recorded_at", "<i8"),
+    ])
+    FILE_NAME = "simhash_fingerprints.bin"
+
+    # 같은 파일을 여러 스레드(병렬 키워드 실행)가 공유할 때 append를 직렬화하기 위한 경로별 락
+    _locks: Dict[str, threading.Lock] = {}
+    _locks_guard = threading.Lock()
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._locks_guard:
+            self._lock = self._locks.setdefault(os.path.abspath(path), threading.Lock())
+        self._records = self._map()
+
+    @classmethod
+    def for_keyword(cls, keyword: str, base_path: str = "archive") -> "SimHashFingerprintStore":
+        """키워드별 저장소: archive/<keyword>/simhash_fingerprints.bin"""
+        return cls(os.path.join(base_path, keyword, cls.FILE_NAME))
+
+    @classmethod
+    def global_store(cls, base_path: str = "archive") -> "SimHashFingerprintStore":
+        """전역 저장소: archive/simhash_fingerprints.bin"""
+        return cls(os.path.join(base_path, cls.FILE_NAME))
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def _map(self) -> np.ndarray:
+        if not os.path.exists(self.path):
+            return np.empty(0, dtype=self.RECORD_DTYPE)
+
+        count = os.path.getsize(self.path) // self.RECORD_DTYPE.itemsize
+        if count == 0:
+            return np.empty(0, dtype=self.RECORD_DTYPE)
+        return np.memmap(self.path, dtype=self.RECORD_DTYPE, mode="r", shape=(count,))
+
+    def recent(self, days: float, now: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        최근 days일 동안 기록된 지문
+        반환: (news_ids[str], title_hash[uint64], body_hash[uint64])
+        """
+        now = time.time() if now is None else now
+        records = self._records
+        if len(records) == 0:
+            empty = np.empty(0, dtype=np.uint64)
+            return np.empty(0, dtype=object), empty, empty
+
+        mask = records["recorded_at"] >= int(now - days * 86400)
+        picked = records[mask]
+        news_ids = np.char.decode(picked["news_id"], "ascii").astype(object)
+        return (
+            news_ids,
+            np.ascontiguousarray(picked["title_hash"]),
+            np.ascontiguousarray(picked["body_hash"]),
+        )
+
+    def append(self, news_ids, title_hashes, body_hashes, recorded_at: Optional[float] = None):
+        """지문 레코드를 파일 끝에 추가하고 매핑을 갱신한다."""
+        n = len(news_ids)
+        if n == 0:
+            return
+
+        batch = np.empty(n, dtype=self.RECORD_DTYPE)
+        batch["news_id"] = [str(x).encode("ascii", "ignore")[:12] for x in news_ids]
+        batch["title_hash"] = np.asarray(title_hashes, dtype=np.uint64)
+        batch["body_hash"] = np.asarray(body_hashes, dtype=np.uint64)
+        batch["recorded_at"] = int(time.time() if recorded_at is None else recorded_at)
+
+        with self._lock:
+            # 이전 실행이 레코드 중간에서 끊겼다면 잘린 꼬리를 버리고 이어 쓴다.
+            if os.path.exists(self.path):
+                size = os.path.getsize(self.path)
+                valid = size - size % self.RECORD_DTYPE.itemsize
+                if valid != size:
+                    os.truncate(self.path, valid)
+            with open(self.path, "ab") as f:
+                f.write(batch.tobytes())
+            self._records = self._map()
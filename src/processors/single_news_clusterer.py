@@ -24,10 +24,11 @@ class SingleNewsClusterer:
     - 전역 이슈 해석
     """
 
-    def __init__(self, title_threshold: float, content_threshold: float, test_mode = False):
+    def __init__(self, title_threshold: float, content_threshold: float, test_mode = False, assign_mode: str = "vectorized"):
         self.title_threshold = title_threshold
         self.content_threshold = content_threshold
         self.test_mode = test_mode
+        self.assign_mode = assign_mode  # ArticleSimilarityGrouper 그룹 번호 부여 방식 ("loop" / "vectorized")
 
     def process(self, df: pd.DataFrame, keyword: str):
         if df.empty:
@@ -35,7 +36,7 @@ class SingleNewsClusterer:
             return df, {"fetched": 0, "similar_groups": 0, "canonical_count": 0}
 
         # 1. 제목 기반 그룹핑 (T-번호)
-        title_grouper = ArticleSimilarityGrouper(threshold=self.title_threshold, field_name="기사제목", test_mode=self.test_mode)
+        title_grouper = ArticleSimilarityGrouper(threshold=self.title_threshold, field_name="기사제목", test_mode=self.test_mode, assign_mode=self.assign_mode)
         normalized_titles = [
             NewsTextNormalizer.normalize_title(t)
             for t in df["title"].fillna("").tolist()
@@ -48,7 +49,7 @@ class SingleNewsClusterer:
         target_col = "content" if "content" in df.columns else "body"
         bodies = df[target_col].fillna("").tolist() if target_col in df.columns else []
 
-        body_grouper = ArticleSimilarityGrouper(threshold=self.content_threshold, field_name="기사본문", test_mode=self.test_mode)
+        body_grouper = ArticleSimilarityGrouper(threshold=self.content_threshold, field_name="기사본문", test_mode=self.test_mode, assign_mode=self.assign_mode)
         body_indices = body_grouper.group(bodies)
         # 결과: 각 기사에 B-번호가 붙음 / 같은 B-번호 = 본문 유사
 
@@ -4,6 +4,8 @@ import os, re
 import pandas as pd
 from datetime import datetime
 
+from api.article_store import filter_log_archive
+
 
 class SingleNewsPrePostFilter:
     
@@ -11,6 +13,7 @@ class SingleNewsPrePostFilter:
     뉴스 필터링 전문 객체
     - Step 3 (수집 직후 필터링)와 Step 5 (본문 수집 후 필터링) 로직 담당
     - 필터링되어 탈락한 기사들을 별도 로그 파일로 저장
+      (store(ArticleStore)가 주어지면 파일 대신 저장소의 filtered_logs/<로그 이름> archive에 키워드별로 저장)
     """
     
     def __init__(
@@ -18,13 +21,16 @@ class SingleNewsPrePostFilter:
         keyword: str, 
         is_keyword_required: bool = False, 
         exclude_words_str: str = None, 
-        base_path: str = "archive"
+        base_path: str = "archive",
+        store=None,
         ):
 
         self.keyword = keyword
         self.is_keyword_required = is_keyword_required # 타입 주입
+        self.store = store
         self.log_path = os.path.join(base_path, keyword, "filtered_logs")
-        os.makedirs(self.log_path, exist_ok=True)
+        if store is None:
+            os.makedirs(self.log_path, exist_ok=True)
 
         # 1. 외부에서 주입된 콤마 구분 문자열을 정규표현식 패턴으로 변환
         if exclude_words_str:
@@ -37,6 +43,11 @@ class SingleNewsPrePostFilter:
 
     def _save_log(self, df: pd.DataFrame, filename: str):
         """탈락한 기사들을 하나의 파일에 누적 저장"""    
+        if not df.empty and self.store is not None:
+            # sqlite 저장소: (archive, news_id) 기준 한 번만 저장, 키워드 매핑 추가
+            self.store.append(filter_log_archive(filename), df, keyword=self.keyword)
+            return
+
         if not df.empty:
             path = os.path.join(self.log_path, filename)
             
@@ -1,59 +1,171 @@
-import requests
+import hashlib
+import threading
 import time
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
+import numpy as np
 import pandas as pd
 from utils.text_normalizer import normalize_html_text
+from api.http_session import get_shared_session
+from processors.article_html_extractor import EXTRACTORS
+
+
+class RequestRateLimiter:
+    """
+    초당 요청 수(RPS) 상한을 지키기 위한 간격 기반 limiter (스레드 안전)
+    - 요청 시작 시각을 1/max_rps 간격으로 예약한다.
+    - 같은 프로세스의 모든 스크래퍼가 하나의 인스턴스를 공유하면 전역 예산이 된다.
+    """
+
+    def __init__(self, max_rps: float):
+        self.interval = 1.0 / max_rps if max_rps and max_rps > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if self.interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+# 프로세스 전체 RPS 예산 (키워드 병렬 실행 시에도 네이버에 가는 총 요청 속도를 제한)
+_shared_limiters = {}
+_shared_limiters_lock = threading.Lock()
+
+def get_shared_rate_limiter(max_rps: float) -> RequestRateLimiter:
+    with _shared_limiters_lock:
+        if max_rps not in _shared_limiters:
+            _shared_limiters[max_rps] = RequestRateLimiter(max_rps)
+        return _shared_limiters[max_rps]
+
 
 class SingleNewsScraper:
     """
     네이버 뉴스 본문 크롤링 전문 객체
     - Step 4 로직 담당
+    - max_workers > 1 이면 스레드 풀로 동시에 수집한다. (결과 순서는 DataFrame 행 순서 유지)
+    - 실패한 기사는 빈 문자열로 남기고 계속 진행한다. (Fail-safe)
+    - cache(ScrapeCache)가 있으면 news_id로 먼저 조회하고, 없는 기사만 요청한다.
+    - html_engine: 본문 추출 방식 ("lxml" / "bs4", processors/article_html_extractor.py)
     """
-    def __init__(self, timeout: int = 7, delay: float = 0.1):
+    def __init__(self, timeout: int = 7, delay: float = 0.1, max_workers: int = 1, max_rps: float = None, cache=None,
+                 html_engine: str = "bs4"):
+        if html_engine not in EXTRACTORS:
+            raise ValueError(f"html_engine은 {tuple(EXTRACTORS)} 중 하나여야 합니다: {html_engine}")
         self.timeout = timeout
+        self.html_engine = html_engine
+        self.extract_text = EXTRACTORS[html_engine]
+        self.cache = cache
         self.delay = delay
+        self.max_workers = max(1, int(max_workers))
+        self.rate_limiter = get_shared_rate_limiter(max_rps) if max_rps else None
         self.headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
 
+        # keep-alive 연결 재사용 (프로세스 공유 풀, 크기는 config.HTTP_POOL_MAXSIZE)
+        self.session = get_shared_session()
+
+        # 마지막 fetch_contents의 요청별 지연 시간(초), 행 순서와 동일
+        self.latencies = []
+
     def fetch_contents(self, df: pd.DataFrame) -> pd.DataFrame:
         if df.empty: return df
-        
+
         #print(f"[Scraper] 총 {len(df)}건의 기사 본문 수집 시작...")
-        contents = []
-        
-        for _, row in tqdm(df.iterrows(), total=len(df), desc="Scraping News"):
-            content = self._scrape_article(row['link'])
+        links = df['link'].tolist()
+        news_ids = self._news_ids(df)
 
-            
-            content = normalize_html_text(content)   # ← &quot 및 태크 제거
+        # 1. 캐시 조회 (다른 키워드에서 이미 수집한 기사는 요청하지 않음)
+        cached = self.cache.get_many(news_ids) if self.cache is not None else {}
+        contents = [cached.get(news_id, "") for news_id in news_ids]
+        todo = [i for i, news_id in enumerate(news_ids) if news_id not in cached]
 
-            contents.append(content)
-            time.sleep(self.delay)
+        if self.cache is not None:
+            print(f"[Scraper] 캐시 적중 {len(news_ids) - len(todo)}건 / 요청 대상 {len(todo)}건")
+
+        # 2. 캐시에 없는 기사만 수집
+        todo_links = [links[i] for i in todo]
+        if self.max_workers == 1:
+            fetched, latencies = self._fetch_sequential(todo_links)
+        else:
+            fetched, latencies = self._fetch_concurrent(todo_links)
 
+        for i, content in zip(todo, fetched):
+            contents[i] = content
+
+        if self.cache is not None:
+            self.cache.put_many([(news_ids[i], content) for i, content in zip(todo, fetched)])
+
+        self.latencies = latencies
+        self._print_latency_summary(latencies)
 
-            
         df['content'] = contents
         return df
 
+    def _news_ids(self, df: pd.DataFrame) -> list:
+        """캐시 키: news_id 컬럼, 없으면 NewsArticleModel과 같은 방식(link md5 앞 12자리)으로 계산"""
+        if 'news_id' in df.columns:
+            return df['news_id'].astype(str).tolist()
+        return [hashlib.md5(str(link).encode()).hexdigest()[:12] for link in df['link'].tolist()]
+
+    def _fetch_sequential(self, links):
+        contents, latencies = [], []
+
+        for link in tqdm(links, total=len(links), desc="Scraping News"):
+            content, elapsed = self._fetch_one(link)
+            contents.append(content)
+            latencies.append(elapsed)
+            time.sleep(self.delay)
+
+        return contents, latencies
+
+    def _fetch_concurrent(self, links):
+        contents = [""] * len(links)
+        latencies = [0.0] * len(links)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self._fetch_one, link): i for i, link in enumerate(links)}
+            for future in tqdm(as_completed(futures), total=len(futures), desc=f"Scraping News (x{self.max_workers})"):
+                i = futures[future]
+                contents[i], latencies[i] = future.result()
+
+        return contents, latencies
+
+    def _fetch_one(self, url: str):
+        """본문 1건 수집 → (정규화된 본문, 소요 시간(초))"""
+        if self.rate_limiter:
+            self.rate_limiter.wait()
+
+        started = time.perf_counter()
+        content = self._scrape_article(url)
+        elapsed = time.perf_counter() - started
+
+        content = normalize_html_text(content)   # ← &quot 및 태크 제거
+        return content, elapsed
+
+    def _print_latency_summary(self, latencies):
+        if not latencies:
+            return
+        arr = np.asarray(latencies) * 1000
+        conn = self.session.stats.snapshot()
+        print(
+            f"[Scraper] 요청 {len(arr)}건 지연(ms) → "
+            f"평균 {arr.mean():.0f} | p50 {np.percentile(arr, 50):.0f} | "
+            f"p95 {np.percentile(arr, 95):.0f} | 최대 {arr.max():.0f} "
+            f"(누적 연결 신규 {conn['new_connections']} / 재사용 {conn['reused_connections']})"
+        )
+
     def _scrape_article(self, url: str) -> str:
         try:
-            resp = requests.get(url, headers=self.headers, timeout=self.timeout)
+            resp = self.session.get(url, headers=self.headers, timeout=self.timeout)
             if resp.status_code != 200: return ""
-            
-            soup = BeautifulSoup(resp.text, 'html.parser')
-            # 네이버 뉴스 주요 본문 셀렉터들
-            targets = [
-                soup.find('article', id='dic_area'),
-                soup.find('div', id='newsct_article'),
-                soup.find('div', id='articleBodyContents')
-            ]
-            
-            for target in targets:
-                if target:
-                    # 노이즈(스크립트, 스타일 등) 제거
-                    for s in target(['script', 'style', 'iframe', 'span', 'em']):
-                        s.decompose()
-                    return target.get_text(separator=' ', strip=True)
+
+            # 본문 셀렉터 탐색 + 노이즈(스크립트, 스타일 등) 제거 후 텍스트 추출
+            return self.extract_text(resp.text)
         except:
             pass
-        return ""
\ No newline at end of file
+        return ""
@@ -18,16 +18,38 @@ scripts/aggregator.py
 출력
 - canonical_archive.csv
   → 전역 기준으로 중복 제거된 최종 기사 집합
+
+증분 실행 (AGGREGATE_INCREMENTAL)
+- aggregator_state.json(watermark) + aggregated_ids.npz(처리한 news_id)로 지난 실행 이후 추가된 기사만 고른다.
+- 신규 기사는 pubDate 앞뒤 AGGREGATE_WINDOW_HOURS 안의 기존 canonical과 신규 기사끼리만 비교한다.
+  (비교량 O(신규 × 윈도우), 기존 canonical과 유사하면 기존 기사가 남는다)
+- 기존 canonical은 그 윈도우만 읽는다. 신규 canonical과 제거 기사는 각 파일 끝에 이어 쓴다. (전체를 다시 쓰지 않음)
+- 상태 파일이 없으면 전체 계산 후 상태를 만든다.
+- 기존 canonical 우선 규칙과 윈도우 기준 TF-IDF 때문에 전체 계산과 생존 기사가 다를 수 있다. (기본 꺼짐)
+
+스트리밍 전체 계산 (AGGREGATE_STREAMING)
+- 키워드 아카이브를 AGGREGATE_CHUNK_ROWS건씩 읽으며 news_id 중복을 누적 인덱스로 제거하고,
+  pubDate(KST) 날짜별 임시 파일로 나눈다.
+- 날짜 순서대로 증분 실행과 같은 규칙(윈도우 안의 먼저 확정된 canonical 우선)으로 처리하고 결과를 이어 쓴다.
+- 메모리는 청크 + news_id 인덱스 + 하루치/윈도우 기사 수에 비례한다. (전체 이력 크기와 무관)
 """
 
 import os
 import sys
+import json
 import time
+import shutil
+import tempfile
+from datetime import datetime
+import numpy as np
 import pandas as pd
 from src.utils.dataframe_utils import canonical_df_save
 from src.processors.article_similarity_grouper import ArticleSimilarityGrouper
 from src.processors.canonical_news_policy import CanonicalNewsPolicy
 from src.utils.text_normalizer import NewsTextNormalizer
+from src.api.archive_backends import open_archive, pubdate_sort_key
+from src.api.article_store import get_article_store, load_canonical_archive, ARCHIVE_CANONICAL
+from src.api.news_id_index import NewsIdIndex, news_ids_of, news_ids_to_uint64
 
 # 프로젝트 루트 경로 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -39,20 +61,37 @@ from config import (
     OUTPUT_ROOT,
     GLOBAL_TITLE_THRESHOLD,
     GLOBAL_CONTENT_THRESHOLD,
+    GLOBAL_BLOCK_WINDOW_HOURS,
+    SIMILARITY_ASSIGN_MODE,
+    ARCHIVE_BACKEND,
+    ARTICLE_STORE_PATH,
+    AGGREGATE_INCREMENTAL,
+    AGGREGATE_WINDOW_HOURS,
+    AGGREGATOR_STATE_PATH,
+    AGGREGATE_STREAMING,
+    AGGREGATE_CHUNK_ROWS,
+    CANONICAL_COLUMNS,
 )
 
+# 증분 실행 시 watermark보다 이만큼 앞의 collected_at부터 후보로 본다.
+# (키워드 병렬 실행 중 늦게 저장된 기사 대비. 실제 처리 여부는 news_id 인덱스로 판정)
+WATERMARK_MARGIN = pd.Timedelta(hours=24)
+COLLECTED_AT_FORMAT = "%Y-%m-%d %H:%M:%S"
+
 def _load_keyword_archives(logger):
-    """키워드별 selected_archive.csv 파일 로드"""
+    """키워드별 selected_archive 로드 (ARCHIVE_BACKEND 기준: csv 파일 / parquet 파티션 / sqlite 저장소)"""
     logger.start_step("파일 로드", step_number=1)
     all_dfs = []
 
     for kw, _, _ in SEARCH_KEYWORDS: # kw, is_strict, fetch_count
-        path = os.path.join(OUTPUT_ROOT, kw, "selected_archive.csv")
-        if not os.path.exists(path):
+        archive = open_archive(
+            ARCHIVE_BACKEND, os.path.join(OUTPUT_ROOT, kw, "selected_archive.csv"), store_path=ARTICLE_STORE_PATH
+        )
+        if not archive.exists():
             continue
 
         try:
-            df = pd.read_csv(path)
+            df = archive.read()
             if not df.empty:
                 all_dfs.append(df)
         except Exception as e:
@@ -70,8 +109,7 @@ def _merge_archives(all_dfs, logger):
     df_total = pd.concat(all_dfs, ignore_index=True)
     logger.add_metric("total_articles", len(df_total))
     logger.end_step(result_count=len(df_total))
-    # 제외 기사 추적을 위해 원본 복사본 반환
-    return df_total, df_total.copy()
+    return df_total
 
 def _deduplicate_global(df_total, logger):
     """
@@ -123,15 +161,54 @@ def _deduplicate_global(df_total, logger):
     logger.end_step(result_count=len(df_after_similarity))
     return df_after_similarity
 
+def _iter_time_blocks(pub_dates: pd.Series, window_hours):
+    """
+    pubDate 기준으로 겹치는 시간창(폭 window_hours, 간격 window_hours/2)의 행 번호 배열을 순서대로 생성한다.
+    - 각 배열은 원래 행 순서(pubDate 내림차순)를 유지한다. (그룹 seed 순서가 전체 계산과 같도록)
+    - pubDate가 window_hours/2 이내인 두 기사는 항상 같은 창에 들어간다.
+    - pubDate 파싱 실패 기사는 마지막에 별도 창 하나로 묶는다.
+    """
+    n = len(pub_dates)
+    if not window_hours:
+        yield np.arange(n)
+        return
+
+    ts = pd.to_datetime(pub_dates.reset_index(drop=True), errors="coerce", utc=True)
+    valid = np.flatnonzero(ts.notna().to_numpy())
+    if len(valid):
+        seconds = ((ts.iloc[valid] - pd.Timestamp(0, tz="UTC")) // pd.Timedelta(seconds=1)).to_numpy(dtype=np.int64)
+        order = np.argsort(seconds, kind="stable")
+        sorted_seconds = seconds[order]
+
+        width = int(window_hours * 3600)
+        step = max(width // 2, 1)
+        start = sorted_seconds[0]
+        while True:
+            lo = np.searchsorted(sorted_seconds, start, side="left")
+            hi = np.searchsorted(sorted_seconds, start + width, side="left")
+            if hi > lo:
+                yield np.sort(valid[order[lo:hi]])
+            if start + width > sorted_seconds[-1]:
+                break
+            start += step
+
+    invalid = np.flatnonzero(ts.isna().to_numpy())
+    if len(invalid):
+        yield invalid
+
 def _deduplicate_global_similarity(
     df: pd.DataFrame,
     title_threshold: float,
     content_threshold: float,
+    window_hours=GLOBAL_BLOCK_WINDOW_HOURS,
 ):
     """
     GLOBAL similarity-based deduplication
     - OR + chaining
     - connected component 당 1개만 생존
+    - window_hours: pubDate 시간창 blocking (_iter_time_blocks). 유사 쌍은 겹치는 창 안에서만 계산하고
+      그룹 번호는 전체 기사 순서로 부여한다. 비용은 기사 수에 선형이지만, 결과가 전체 비교와 같다고 보장되는 것은
+      pubDate 차이 window_hours/2 이내의 쌍뿐이다. (그보다 떨어진 중복은 남을 수 있음, None이면 전체 비교)
     """
 
     if df.empty:
@@ -143,8 +220,8 @@ def _deduplicate_global_similarity(
     bodies = df["content"].fillna("").tolist()
 
     # 1) title / body 각각 OR+chaining 그룹
-    title_grouper = ArticleSimilarityGrouper(title_threshold, field_name="GLOBAL_TITLE")
-    body_grouper = ArticleSimilarityGrouper(content_threshold, field_name="GLOBAL_BODY")
+    title_grouper = ArticleSimilarityGrouper(title_threshold, field_name="GLOBAL_TITLE", assign_mode=SIMILARITY_ASSIGN_MODE)
+    body_grouper = ArticleSimilarityGrouper(content_threshold, field_name="GLOBAL_BODY", assign_mode=SIMILARITY_ASSIGN_MODE)
 
     # 제목에서 부호 제거 전처리
     titles = [
@@ -152,8 +229,13 @@ def _deduplicate_global_similarity(
     for t in df["title"].fillna("").tolist()
     ]
 
-    title_groups = title_grouper.group(titles)
-    body_groups = body_grouper.group(bodies)
+    blocks = None
+    if window_hours:
+        blocks = list(_iter_time_blocks(df["pubDate"], window_hours))
+        print(f"[GLOBAL] 시간창 blocking: {window_hours}시간 창 {len(blocks)}개 (기사 {len(df)}건)")
+
+    title_groups = title_grouper.group(titles, blocks=blocks)
+    body_groups = body_grouper.group(bodies, blocks=blocks)
 
     # 2) OR 조건으로 union-find
     n = len(df)
@@ -226,25 +308,30 @@ def _deduplicate_global_similarity(
 
     return kept_df, dropped_df
 
+def _reorder_columns(columns):
+    """news_id, pubDate, collected_at을 앞으로"""
+    base = ["news_id", "pubDate", "collected_at"]
+    cols = list(columns)
+    rest = [c for c in cols if c not in base]
+    return [c for c in base if c in cols] + rest
+
 def _save_canonical_results(df_global_canonical, logger):
     """최종 결과 저장"""
     from utils.logger import verify_file_before_write
 
     logger.start_step("메타데이터 생성", step_number=4)
 
-    def reorder(df):
-        base = ["news_id", "pubDate", "collected_at"]
-        cols = list(df.columns)
-        rest = [c for c in cols if c not in base]
-        return df[[c for c in base if c in cols] + rest]
-
-    df_global_canonical = reorder(df_global_canonical)
+    df_global_canonical = df_global_canonical[_reorder_columns(df_global_canonical.columns)]
 
     # 1) canonical_archive.csv
     verify_file_before_write(CANONICAL_ARCHIVE_PATH)
     os.makedirs(os.path.dirname(CANONICAL_ARCHIVE_PATH), exist_ok=True)
     canonical_df_save(df_global_canonical, CANONICAL_ARCHIVE_PATH)
 
+    # sqlite 저장소면 canonical도 함께 교체 (이슈 클러스터링 등이 시간 구간으로 조회)
+    if ARCHIVE_BACKEND == "sqlite":
+        get_article_store(ARTICLE_STORE_PATH).replace_archive(ARCHIVE_CANONICAL, df_global_canonical)
+
     # 2) canonical_archive_copy.csv (신규)
     copy_cols = ["news_id", "pubDate", "title", "description"]
     copy_df = df_global_canonical[
@@ -260,6 +347,424 @@ def _save_canonical_results(df_global_canonical, logger):
     logger.end_step(result_count=len(df_global_canonical))
     return df_global_canonical
 
+# ---------------------------------------------------------
+# 증분 실행 상태
+# ---------------------------------------------------------
+def _processed_index():
+    """지금까지 전역 통합에서 처리한 news_id (canonical + 제거된 기사)"""
+    return NewsIdIndex(os.path.join(os.path.dirname(CANONICAL_ARCHIVE_PATH), "aggregated_ids.npz"))
+
+def _load_aggregator_state():
+    """증분 실행 상태. 상태 파일이나 canonical 결과가 없으면 None (→ 전체 계산)"""
+    if not os.path.exists(AGGREGATOR_STATE_PATH) or not os.path.exists(CANONICAL_ARCHIVE_PATH):
+        return None
+    try:
+        with open(AGGREGATOR_STATE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"[WARN] aggregator_state.json 로드 실패, 전체 계산으로 진행: {e}")
+        return None
+
+def _save_aggregator_state(watermark, canonical_count):
+    state = {
+        "watermark": watermark,
+        "canonical_count": int(canonical_count),
+        "updated_at": datetime.now().strftime(COLLECTED_AT_FORMAT),
+    }
+    os.makedirs(os.path.dirname(AGGREGATOR_STATE_PATH), exist_ok=True)
+    tmp_path = AGGREGATOR_STATE_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, AGGREGATOR_STATE_PATH)
+
+def _max_collected_at(df, default=None):
+    if "collected_at" not in df.columns:
+        return default
+    values = df["collected_at"].dropna().astype(str)
+    return values.max() if not values.empty else default
+
+def _reset_incremental_state(df_total, canonical_count):
+    """전체 계산 직후: 입력 전체를 처리한 것으로 인덱스/상태를 새로 만든다."""
+    watermark = _max_collected_at(df_total, default=datetime.now().strftime(COLLECTED_AT_FORMAT))
+    _processed_index().rebuild(news_ids_of(df_total), watermark)
+    _save_aggregator_state(watermark, canonical_count)
+
+# ---------------------------------------------------------
+# 증분 dedup
+# ---------------------------------------------------------
+def _select_new_articles(df_total, state, index):
+    """watermark 이후 수집분 중 아직 처리하지 않은 news_id만"""
+    df = df_total
+    if "collected_at" in df.columns and state.get("watermark"):
+        cutoff = (pd.Timestamp(state["watermark"]) - WATERMARK_MARGIN).strftime(COLLECTED_AT_FORMAT)
+        collected = df["collected_at"].astype("string").fillna(cutoff)
+        df = df[(collected >= cutoff).to_numpy(dtype=bool)]
+    return df[~index.contains(news_ids_of(df))]
+
+def _deduplicate_against_existing(df_after_link, df_window):
+    """
+    신규 기사(news_id 중복 제거 후) ↔ 이미 확정된 canonical(df_window) 비교
+    - 기존 canonical과 title OR body가 유사한 신규 기사는 제거 (기존 기사 우선)
+    - 남은 신규 기사끼리는 _deduplicate_global_similarity
+    → (kept_df, dropped_df, 기존 canonical과 유사해 제거된 수)
+    """
+    df_after_link = df_after_link.reset_index(drop=True)
+    df_window = df_window.reset_index(drop=True)
+
+    m = len(df_window)
+    combined = pd.concat(
+        [df_window[["news_id", "title", "content"]], df_after_link[["news_id", "title", "content"]]],
+        ignore_index=True,
+    )
+    titles = [NewsTextNormalizer.normalize_title(t) for t in combined["title"].fillna("").astype(str)]
+    bodies = combined["content"].fillna("").astype(str).tolist()
+
+    # 윈도우 안의 기존 canonical과 title OR body가 유사한 신규 기사 → 제거 (신규 × 기존 쌍만 계산)
+    title_grouper = ArticleSimilarityGrouper(GLOBAL_TITLE_THRESHOLD, field_name="GLOBAL_TITLE", assign_mode=SIMILARITY_ASSIGN_MODE)
+    body_grouper = ArticleSimilarityGrouper(GLOBAL_CONTENT_THRESHOLD, field_name="GLOBAL_BODY", assign_mode=SIMILARITY_ASSIGN_MODE)
+    title_rows, _ = title_grouper.similar_pairs_against(titles, m)
+    body_rows, _ = body_grouper.similar_pairs_against(bodies, m)
+
+    matched = np.zeros(len(df_after_link), dtype=bool)
+    matched[np.concatenate([title_rows, body_rows]) - m] = True
+
+    dropped_existing = df_after_link[matched].copy()
+    dropped_existing["removed_by"] = "global_similarity_existing"
+
+    # 남은 신규 기사끼리는 전체 계산과 같은 OR + chaining 규칙
+    kept_df, dropped_new = _deduplicate_global_similarity(
+        df_after_link[~matched],
+        title_threshold=GLOBAL_TITLE_THRESHOLD,
+        content_threshold=GLOBAL_CONTENT_THRESHOLD,
+    )
+    dropped_df = pd.concat([dropped_existing, dropped_new], ignore_index=True)
+
+    return kept_df, dropped_df, int(matched.sum())
+
+def _deduplicate_incremental(df_new, logger):
+    """
+    신규 기사만 전역 dedup
+    1) 신규 기사끼리 news_id 중복 제거 (기존 처리분과의 news_id 중복은 _select_new_articles에서 제외됨)
+    2) 신규 기사 ↔ pubDate 윈도우 안의 기존 canonical 비교
+       - 기존 canonical과 title OR body가 유사하면 제거 (기존 기사 우선, 이미 확정된 canonical은 바꾸지 않음)
+    3) 남은 신규 기사끼리는 _deduplicate_global_similarity (OR + chaining, CanonicalNewsPolicy)
+    """
+    logger.start_step("Global dedup (증분)", step_number=3)
+
+    df_new = df_new.copy()
+    df_new["pubDate"] = pd.to_datetime(df_new["pubDate"], errors="coerce")
+    df_new = df_new.sort_values("pubDate", ascending=False)
+    df_after_link = df_new.drop_duplicates(subset=["news_id"], keep="first").reset_index(drop=True)
+    link_removed_count = len(df_new) - len(df_after_link)
+
+    # 비교 대상: 신규 기사 pubDate 앞뒤 AGGREGATE_WINDOW_HOURS 안의 기존 canonical
+    pub = df_after_link["pubDate"].dropna()
+    if pub.empty:
+        df_window = pd.DataFrame(columns=df_after_link.columns)
+    else:
+        window = pd.Timedelta(hours=AGGREGATE_WINDOW_HOURS)
+        df_window = load_canonical_archive(
+            ARCHIVE_BACKEND, CANONICAL_ARCHIVE_PATH, ARTICLE_STORE_PATH,
+            since=pub.min() - window, until=pub.max() + window,
+            columns=["news_id", "title", "content"],
+        ).reset_index(drop=True)
+
+    kept_df, dropped_df, n_matched = _deduplicate_against_existing(df_after_link, df_window)
+    m = len(df_window)
+
+    # 제거 기사는 기존 excluded 파일 끝에 이어 쓴다. (기존 파일은 읽지 않음)
+    if not dropped_df.empty:
+        excluded_path = os.path.join(
+            os.path.dirname(CANONICAL_ARCHIVE_PATH),
+            "excluded_global_similarity.csv"
+        )
+        _append_csv(dropped_df, excluded_path)
+
+    logger.add_metric("new_articles", len(df_new))
+    logger.add_metric("window_canonical", m)
+    logger.add_metric("compared_pairs", len(df_after_link) * (len(df_after_link) + m))
+    logger.add_metric("similar_to_existing", n_matched)
+    logger.add_metric("link_removed", link_removed_count)
+    logger.add_metric("similarity_removed", len(dropped_df))
+    logger.add_metric("new_canonical_count", len(kept_df))
+
+    print(
+    f"[GLOBAL 증분] 신규 {len(df_new)}건 | 비교 윈도우 canonical {m}건 | "
+    f"link 중복 제거: {link_removed_count}건 | 유사도 제거: {len(dropped_df)}건 | "
+    f"신규 canonical: {len(kept_df)}건"
+    )
+
+    logger.end_step(result_count=len(kept_df))
+    return kept_df
+
+def _load_new_articles(state, index, logger):
+    """키워드 아카이브를 청크로 읽으며 신규 기사만 모은다. → (df_new, 전체 행 수, 최대 collected_at)"""
+    logger.start_step("신규 기사 로드", step_number=1)
+    new_chunks, total, max_collected = [], 0, None
+
+    for _, chunk in _iter_keyword_chunks(logger):
+        total += len(chunk)
+        max_collected = max(filter(None, [max_collected, _max_collected_at(chunk)]), default=None)
+        chunk_new = _select_new_articles(chunk, state, index)
+        if not chunk_new.empty:
+            new_chunks.append(chunk_new)
+
+    df_new = pd.concat(new_chunks, ignore_index=True) if new_chunks else pd.DataFrame()
+    logger.add_metric("total_articles", total)
+    logger.end_step(result_count=len(df_new))
+    return df_new, total, max_collected
+
+def _append_csv(df, path):
+    """
+    CSV 끝에 행을 이어 쓴다. (기존 행은 읽지도 다시 쓰지도 않음)
+    - 파일이 있으면 헤더만 읽어 그 컬럼 순서로 맞춘다. (없는 컬럼은 빈 값, 헤더에 없는 컬럼은 [WARN] 후 버림)
+    - 파일이 없으면 canonical_df_save와 같은 컬럼 순서로 헤더부터 쓴다.
+    """
+    if df.empty:
+        return
+    if os.path.exists(path) and os.path.getsize(path) > 0:
+        header = pd.read_csv(path, nrows=0, encoding="utf-8-sig").columns.tolist()
+        extra = [c for c in df.columns if c not in header]
+        if extra:
+            print(f"[WARN] {os.path.basename(path)} 헤더에 없는 컬럼은 저장하지 않습니다: {extra}")
+        df.reindex(columns=header).to_csv(path, mode="a", header=False, index=False, encoding="utf-8")
+    else:
+        df[_save_order(df.columns)].to_csv(path, index=False, encoding="utf-8-sig")
+
+def _append_canonical_results(kept_df, logger):
+    """증분 결과 저장: 신규 canonical만 canonical_archive.csv (+copy, sqlite) 끝에 이어 쓴다."""
+    from utils.logger import verify_file_before_write
+
+    logger.start_step("메타데이터 생성", step_number=4)
+    verify_file_before_write(CANONICAL_ARCHIVE_PATH)
+    os.makedirs(os.path.dirname(CANONICAL_ARCHIVE_PATH), exist_ok=True)
+
+    kept_df = kept_df.sort_values("pubDate", ascending=False, kind="stable")
+    _append_csv(kept_df, CANONICAL_ARCHIVE_PATH)
+
+    if ARCHIVE_BACKEND == "sqlite" and not kept_df.empty:
+        get_article_store(ARTICLE_STORE_PATH).append(ARCHIVE_CANONICAL, kept_df)
+
+    copy_cols = [c for c in ["news_id", "pubDate", "title", "description"] if c in kept_df.columns]
+    copy_path = os.path.join(os.path.dirname(CANONICAL_ARCHIVE_PATH), "canonical_archive_copy.csv")
+    _append_csv(kept_df[copy_cols], copy_path)
+
+    logger.end_step(result_count=len(kept_df))
+    return len(kept_df)
+
+def _run_incremental(state, logger):
+    """
+    증분 통합: 신규 기사만 dedup 후 기존 canonical 끝에 이어 쓴다. → 전체 canonical 수 (신규 기사가 없으면 None)
+    기존 canonical은 dedup 비교 윈도우만 읽고, 파일 전체를 읽거나 다시 쓰지 않는다.
+    (그래서 파일 안 pubDate 정렬은 전체 계산 때만 보장된다. 시간 구간 조회는 pubDate로 거른다)
+    """
+    index = _processed_index()
+    df_new, _, max_collected = _load_new_articles(state, index, logger)
+    watermark = max(filter(None, [state.get("watermark"), max_collected]), default=None)
+
+    if df_new.empty:
+        print("[GLOBAL 증분] 신규 기사가 없습니다.")
+        _save_aggregator_state(watermark, state.get("canonical_count", 0))
+        return None
+
+    kept_df = _deduplicate_incremental(df_new, logger)
+    added = _append_canonical_results(kept_df, logger)
+
+    canonical_count = state.get("canonical_count", 0) + added
+    index.add(news_ids_of(df_new), watermark)
+    _save_aggregator_state(watermark, canonical_count)
+    return canonical_count
+
+# ---------------------------------------------------------
+# 청크 단위 읽기 / 스트리밍 전체 계산
+# ---------------------------------------------------------
+def _iter_keyword_chunks(logger, chunksize=AGGREGATE_CHUNK_ROWS):
+    """키워드별 selected_archive를 chunksize건씩 (전체 이력을 한 번에 메모리에 올리지 않음) → (keyword, chunk)"""
+    for kw, _, _ in SEARCH_KEYWORDS: # kw, is_strict, fetch_count
+        archive = open_archive(
+            ARCHIVE_BACKEND, os.path.join(OUTPUT_ROOT, kw, "selected_archive.csv"), store_path=ARTICLE_STORE_PATH
+        )
+        if not archive.exists():
+            continue
+
+        try:
+            for chunk in archive.iter_chunks(chunksize):
+                if not chunk.empty:
+                    yield kw, chunk
+        except Exception as e:
+            logger.add_metric(f"error_{kw}", str(e))
+
+def _first_unseen(news_ids, seen):
+    """news_id별로 (seen에 없고 이번 청크 안에서 처음 나온 행) 여부. seen은 정렬된 uint64 배열"""
+    values = news_ids_to_uint64(news_ids)
+    _, first = np.unique(values, return_index=True)
+    fresh = np.zeros(len(values), dtype=bool)
+    fresh[first] = True
+    if len(seen):
+        pos = np.searchsorted(seen, values)
+        pos[pos == len(seen)] = 0
+        fresh &= seen[pos] != values
+    return fresh, values
+
+def _spill_by_date(spill_dir, logger):
+    """
+    1) 청크를 읽으며 news_id 중복 제거(누적 인덱스) 후 pubDate(KST) 날짜별 임시 파일로 나눈다.
+    → (처리한 news_id 배열, 전체 컬럼, 전체 행 수, 중복 제거 수, 최대 collected_at)
+    """
+    logger.start_step("파일 로드 (스트리밍)", step_number=1)
+    seen = np.empty(0, dtype=np.uint64)
+    columns, total, link_removed, max_collected = [], 0, 0, None
+
+    for chunk_no, (_, chunk) in enumerate(_iter_keyword_chunks(logger)):
+        total += len(chunk)
+        max_collected = max(filter(None, [max_collected, _max_collected_at(chunk)]), default=None)
+        columns += [c for c in chunk.columns if c not in columns]
+
+        fresh, values = _first_unseen(news_ids_of(chunk), seen)
+        link_removed += int((~fresh).sum())
+        seen = np.union1d(seen, values[fresh])
+
+        chunk = chunk[fresh]
+        pub = pubdate_sort_key(chunk["pubDate"].astype("string")).dt.tz_convert("Asia/Seoul")
+        chunk = chunk.assign(pubDate=pub)
+        days = pub.dt.strftime("%Y-%m-%d").fillna("unknown")
+        for day, df_part in chunk.groupby(days, sort=False):
+            day_dir = os.path.join(spill_dir, "in", day)
+            os.makedirs(day_dir, exist_ok=True)
+            df_part.to_pickle(os.path.join(day_dir, f"{chunk_no:06d}.pkl"))
+
+    logger.add_metric("total_articles", total)
+    logger.add_metric("link_removed", link_removed)
+    logger.end_step(result_count=total - link_removed)
+    return seen, columns, total, link_removed, max_collected
+
+def _spilled_days(spill_dir, stage):
+    """임시 파일의 날짜 목록 (오래된 날짜부터, pubDate 파싱 실패는 마지막)"""
+    stage_dir = os.path.join(spill_dir, stage)
+    if not os.path.isdir(stage_dir):
+        return []
+    names = [os.path.splitext(name)[0] for name in os.listdir(stage_dir)]
+    days = sorted(d for d in names if d != "unknown")
+    return days + (["unknown"] if "unknown" in names else [])
+
+def _deduplicate_streaming(spill_dir, columns, logger):
+    """
+    2) 날짜 순서대로 그날 기사를 윈도우(AGGREGATE_WINDOW_HOURS) 안의 먼저 처리된 기사와 비교한다.
+       (증분 실행과 같은 규칙. 먼저 제거된 기사도 비교 대상에 남겨 같은 묶음이 이어지도록 함)
+       생존 기사는 날짜별 임시 파일, 제거 기사는 excluded 파일에 이어 쓴다.
+    """
+    logger.start_step("Global dedup (스트리밍)", step_number=2)
+    window = pd.Timedelta(hours=AGGREGATE_WINDOW_HOURS)
+    window_cols = ["news_id", "pubDate", "title", "content"]
+    df_window = pd.DataFrame(columns=window_cols)
+    kept_total, similarity_removed = 0, 0
+
+    excluded_path = os.path.join(os.path.dirname(CANONICAL_ARCHIVE_PATH), "excluded_global_similarity.csv")
+    excluded_columns = _save_order(columns + ["removed_by"])
+    os.makedirs(os.path.join(spill_dir, "out"), exist_ok=True)
+
+    with open(excluded_path, "w", encoding="utf-8-sig", newline="") as excluded_file:
+        pd.DataFrame(columns=excluded_columns).to_csv(excluded_file, index=False)
+
+        for day in _spilled_days(spill_dir, "in"):
+            day_dir = os.path.join(spill_dir, "in", day)
+            df_day = pd.concat(
+                [pd.read_pickle(os.path.join(day_dir, name)) for name in sorted(os.listdir(day_dir))],
+                ignore_index=True,
+            )
+            df_day = df_day.sort_values("pubDate", ascending=False, kind="stable")
+
+            if day == "unknown":
+                df_window = df_window.iloc[0:0]
+            else:
+                df_window = df_window[df_window["pubDate"] >= pd.Timestamp(day, tz="Asia/Seoul") - window]
+
+            kept_df, dropped_df, _ = _deduplicate_against_existing(df_day, df_window)
+            kept_df.to_pickle(os.path.join(spill_dir, "out", f"{day}.pkl"))
+            if not dropped_df.empty:
+                dropped_df.reindex(columns=excluded_columns).to_csv(excluded_file, index=False, header=False)
+
+            df_window = pd.concat([df_window, kept_df[window_cols], dropped_df[window_cols]], ignore_index=True)
+            kept_total += len(kept_df)
+            similarity_removed += len(dropped_df)
+
+    logger.add_metric("similarity_removed", similarity_removed)
+    logger.add_metric("global_canonical_count", kept_total)
+    logger.end_step(result_count=kept_total)
+    return kept_total, similarity_removed
+
+def _save_order(columns):
+    """canonical_df_save와 같은 컬럼 순서"""
+    columns = _reorder_columns(columns)
+    return [c for c in CANONICAL_COLUMNS if c in columns] + [c for c in columns if c not in CANONICAL_COLUMNS]
+
+def _write_streaming_results(spill_dir, columns, logger):
+    """3) 날짜별 생존 기사를 최신 날짜부터 canonical_archive.csv (+copy, sqlite)에 이어 쓴다."""
+    from utils.logger import verify_file_before_write
+
+    logger.start_step("메타데이터 생성", step_number=3)
+    verify_file_before_write(CANONICAL_ARCHIVE_PATH)
+    os.makedirs(os.path.dirname(CANONICAL_ARCHIVE_PATH), exist_ok=True)
+
+    columns = _save_order(columns)
+    copy_columns = [c for c in ["news_id", "pubDate", "title", "description"] if c in columns]
+    copy_path = os.path.join(os.path.dirname(CANONICAL_ARCHIVE_PATH), "canonical_archive_copy.csv")
+
+    store = None
+    if ARCHIVE_BACKEND == "sqlite":
+        store = get_article_store(ARTICLE_STORE_PATH)
+        store.replace_archive(ARCHIVE_CANONICAL, pd.DataFrame())
+
+    days = _spilled_days(spill_dir, "out")
+    days = [d for d in days if d != "unknown"][::-1] + [d for d in days if d == "unknown"]
+
+    # 다른 프로세스가 쓰는 중인 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+    tmp_path = CANONICAL_ARCHIVE_PATH + ".tmp"
+    tmp_copy_path = copy_path + ".tmp"
+    written = 0
+    with open(tmp_path, "w", encoding="utf-8-sig", newline="") as canonical_file, \
+            open(tmp_copy_path, "w", encoding="utf-8-sig", newline="") as copy_file:
+        pd.DataFrame(columns=columns).to_csv(canonical_file, index=False)
+        pd.DataFrame(columns=copy_columns).to_csv(copy_file, index=False)
+
+        for day in days:
+            df_day = pd.read_pickle(os.path.join(spill_dir, "out", f"{day}.pkl")).reindex(columns=columns)
+            df_day.to_csv(canonical_file, index=False, header=False)
+            df_day[copy_columns].to_csv(copy_file, index=False, header=False)
+            if store is not None:
+                store.append(ARCHIVE_CANONICAL, df_day)
+            written += len(df_day)
+
+    os.replace(tmp_path, CANONICAL_ARCHIVE_PATH)
+    os.replace(tmp_copy_path, copy_path)
+
+    logger.end_step(result_count=written)
+    return written
+
+def _run_streaming(logger):
+    """스트리밍 전체 계산 (AGGREGATE_STREAMING)"""
+    spill_dir = tempfile.mkdtemp(prefix="aggregate_", dir=os.path.dirname(CANONICAL_ARCHIVE_PATH))
+    try:
+        seen, columns, total, link_removed, max_collected = _spill_by_date(spill_dir, logger)
+        if total == 0:
+            return None
+        kept_total, similarity_removed = _deduplicate_streaming(spill_dir, columns, logger)
+        written = _write_streaming_results(spill_dir, columns, logger)
+    finally:
+        shutil.rmtree(spill_dir, ignore_errors=True)
+
+    print(
+    f"[GLOBAL 스트리밍] link 중복 제거: {link_removed}건 | "
+    f"유사도 제거: {similarity_removed}건 | "
+    f"최종 canonical: {kept_total}건"
+    )
+
+    if AGGREGATE_INCREMENTAL:
+        watermark = max_collected or datetime.now().strftime(COLLECTED_AT_FORMAT)
+        _processed_index().rebuild(seen, watermark)
+        _save_aggregator_state(watermark, written)
+    return total, written
+
 def run_aggregation():
     """전역 뉴스 데이터 통합 메인 실행 함수"""
     from utils.logger import PipelineLogger
@@ -269,6 +774,23 @@ def run_aggregation():
         module_name="aggregator"
     )
 
+    state = _load_aggregator_state() if AGGREGATE_INCREMENTAL else None
+    if state is not None:
+        # 증분: 신규 기사만 청크로 골라 dedup 후 이어 쓰기
+        canonical_count = _run_incremental(state, logger)
+        logger.save()
+        if canonical_count is not None:
+            print(f">>> 증분 통합 완료: 최종 {canonical_count}건")
+        return
+
+    if AGGREGATE_STREAMING:
+        # 스트리밍 전체 계산: 청크 읽기 → 날짜별 dedup → 이어 쓰기
+        result = _run_streaming(logger)
+        logger.save()
+        if result is not None:
+            print(f">>> 통합 완료: 전체 {result[0]}건 → 최종 {result[1]}건")
+        return
+
     # 1. 파일 로드
     all_dfs = _load_keyword_archives(logger)
     if not all_dfs:
@@ -276,7 +798,7 @@ def run_aggregation():
         return
 
     # 2. 데이터 병합
-    df_total, df_original = _merge_archives(all_dfs, logger)
+    df_total = _merge_archives(all_dfs, logger)
 
     # 3. 유사도 병합 및 중복 제거
     df_global_canonical = _deduplicate_global(df_total, logger)
@@ -284,6 +806,9 @@ def run_aggregation():
     # 4. 최종 저장
     df_global_canonical = _save_canonical_results(df_global_canonical, logger)
 
+    if AGGREGATE_INCREMENTAL:
+        _reset_incremental_state(df_total, len(df_global_canonical))
+
     logger.save()
 
     print(
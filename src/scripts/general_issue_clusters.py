@@ -8,23 +8,41 @@ scripts/general_issue_clusters.py
 """
 
 import os
+import argparse
 import json
-import pickle
 import pandas as pd
 import numpy as np
 import time
 from datetime import datetime
 
-from sentence_transformers import SentenceTransformer
 from sklearn.metrics import silhouette_score
 from sklearn.cluster import HDBSCAN
-from sklearn.metrics.pairwise import cosine_similarity
 
 from src.llm.issue_labeler import generate_issue_label
+from src.api.article_store import load_canonical_archive
+from src.embeddings.embedding_store import EmbeddingStore
+from src.embeddings.embedding_client import get_embedding_client
+from src.processors.issue_graph_clusterer import IssueGraphClusterer
+from src.processors.issue_cluster_sweep import append_results
+from src.processors.issue_cluster_summary import summarize_clusters, top_k_by_group
+from src.processors.rolling_issue_window import ArticleTimeIndex, RollingIssueWindow
+from src.processors.issue_map_updater import (
+    load_issue_state,
+    save_issue_state,
+    match_previous_ids,
+    update_issue_assignments,
+)
 from src.config import (    
     DATA_DIR,
     PROMPTS_DIR,
     CANONICAL_ARCHIVE_PATH,
+    ARCHIVE_BACKEND,
+    ARTICLE_STORE_PATH,
+    EMBEDDING_STORE_DIR,
+    EMBEDDING_SERVICE_URL,
+    EMBEDDING_SERVICE_TIMEOUT,
+    EMBEDDING_TOKEN_BUDGET,
+    EMBEDDING_TOKEN_BATCH_MAX,
     LLM_PROVIDER,    
     gen_client,
     GEMINI_MODEL_2_5,
@@ -64,9 +82,41 @@ FIXED_BASE_DATE = None #None이면 현재 시각으로 테스트한다.
 HOURS_WINDOW = 12  # 최근 N시간 치 뉴스로 이슈 판 구성
 
 # 아래 2개 값의 조합이 가장 중요하다. (3,3) (3,4) (4,3) (4,4)
+# 조합/시간창 비교는 상수를 고쳐 다시 돌리지 말고 스윕으로: python -m src.scripts.issue_cluster_sweep --sizes 3 4 --samples 3 4
 MIN_CLUSTER_SIZE = 3
 MIN_SAMPLES  = 4
 
+# 클러스터링 엔진 (processors/issue_graph_clusterer.py)
+# "hdbscan"   : HDBSCAN(metric="cosine")에 임베딩을 그대로 넣는다. n×n 코사인 거리 계산 (기존 방식)
+# "knn_graph" : k-NN 그래프를 먼저 만들고 그 sparse 그래프 위에서 HDBSCAN (dense 결과와 완전히 같지는 않음)
+#               k-NN은 기본 설치에서 정확 탐색(내적 n²번, 메모리만 절약)이다. hnswlib은 requirements.txt에 없는
+#               선택 의존성이라, pip install hnswlib 해야 근사 탐색이 켜진다.
+#               → HOURS_WINDOW를 넓히거나 하루치 전체 키워드를 묶을 때 사용
+# KNN_NEIGHBORS: k-NN 그래프의 이웃 수 (MIN_SAMPLES 이상, 클수록 "hdbscan" 결과에 가까움)
+# 비교: python validators/check_issue_cluster_engine_parity.py (FIXED_BASE_DATE 시간창)
+CLUSTER_ENGINE = "hdbscan"
+KNN_NEIGHBORS = 30
+
+# 증분 이슈 지도 갱신 (processors/issue_map_updater.py)
+# ISSUE_INCREMENTAL: True면 직전 실행의 current/ 이슈 지도(centers.json, article_map.csv, state.json)를 이어 받아
+#   처음 보는 기사만 기존 이슈 중심에 붙이고, 남은 기사(미배정 신규 + 노이즈 + 만료 이슈)만 다시 군집화한다.
+#   issue_cluster_id는 실행 간에 유지된다. (전체 재계산 때도 기사 과반이 겹치는 이전 id를 이어 씀)
+# ISSUE_ASSIGN_MIN_SIMILARITY: 새 기사를 기존 이슈에 붙이는 이슈 중심과의 최소 코사인 유사도
+# ISSUE_FULL_REBUILD_HOURS: 마지막 전체 재계산 후 이 시간이 지나면 전체를 다시 군집화한다. (중심 이동 누적 방지)
+#   설정(모델/템플릿/백엔드/시간창/HDBSCAN 파라미터/엔진)이 바뀌었거나 기준시가 이전 실행보다 앞서도 전체 재계산
+# 주의: 증분 모드의 이슈 지도는 순수 HDBSCAN 결과가 아니다. 새 기사는 cos ≥ ISSUE_ASSIGN_MIN_SIMILARITY면 기존 중심에 붙고,
+#   남은 기사는 전체 재계산 전까지 다른 이슈로 옮겨지지 않는다. 전체 재계산과의 차이(ARI, 기사별 id 유지율)를
+#   재서 기록하기 전까지 기본은 False. (False여도 issue_cluster_id는 match_previous_ids로 이어 쓴다)
+ISSUE_INCREMENTAL = False
+ISSUE_ASSIGN_MIN_SIMILARITY = 0.88
+ISSUE_FULL_REBUILD_HOURS = 24
+
+# 라이브 갱신 (python -m src.scripts.general_issue_clusters --live)
+# 프로세스를 띄워 두고 LIVE_REFRESH_MINUTES마다 현재 시각 기준 HOURS_WINDOW 창으로 이슈 지도를 다시 만든다.
+# 시간창은 processors/rolling_issue_window.py가 유지한다. 매 갱신마다 창에 새로 들어온 기사만 읽어 임베딩하고
+# (저장소에 있으면 재사용), 창에서 나간 기사는 버린다. canonical 전체를 다시 읽지 않는다. (csv는 이어 쓴 부분만 파싱)
+LIVE_REFRESH_MINUTES = 15
+
 """
 2026-02-14 16:42:15 | 2026-02-13 11:20:51  테스트 결과 (3,4)가 가장 마음에 든다
 2026-02-14 17:02:23 | 2026-02-14 17:02:11  테스트 결과는 (3,3)만 적절하다ㅠ
@@ -76,8 +126,9 @@ MIN_SAMPLES  = 4
 # 경로 설정
 PROMPT_PATH = PROMPTS_DIR / "general_issue_clusters.txt"
 ISSUE_CLUSTERS_ROOT = DATA_DIR / "issue_clusters"
-ARTICLE_EMBEDDINGS_CACHE = ISSUE_CLUSTERS_ROOT / "embeddings_cache.pkl"
 EXPERIMENT_LOG_PATH = ISSUE_CLUSTERS_ROOT / "clustering_experiments.log"
+# 구조화된 실험 결과 표 (이 스크립트 실행 기록 + scripts/issue_cluster_sweep.py 스윕 결과, 한 행 = 한 설정)
+EXPERIMENT_RESULTS_PATH = ISSUE_CLUSTERS_ROOT / "clustering_experiments.csv"
 
 
 # 웹 서비스용 최신 데이터 경로
@@ -86,8 +137,20 @@ CURRENT_ISSUE_DIR = ISSUE_CLUSTERS_ROOT / "current"
 MODEL_NAME = "dragonkue/multilingual-e5-small-ko-v2"
 # MODEL_NAME = "intfloat/multilingual-e5-base"
 
+# 임베딩 추론 방식 (embeddings/inference_backends.py)
+# "torch" 기본 / "onnx" ONNX Runtime / "torch-int8" 동적 int8 양자화 (CPU 서버용)
+# 임베딩 저장소 키에 들어가므로 바꾸면 기사를 새로 인코딩한다.
+# 바꾸기 전 확인: python validators/check_embedding_backend_parity.py --backend onnx --backend torch-int8
+# 기본은 sentence-transformers의 torch(fp32)로 유지한다. onnx/torch-int8은 실제 모델로 잰 패리티 기록
+# (min cos ≥ 0.98, ARI ≥ 0.90)이 inference_backends.VERIFIED_BACKENDS에 있어야 로드된다. 지금은 기록이 없다.
+EMBEDDING_BACKEND = "torch"
+
 RANDOM_STATE = 42
 
+# build_corpus의 문장 구성(제목/본문 길이/prefix)을 바꾸면 반드시 올린다.
+# 임베딩 저장소 키(news_id, 모델, 템플릿 버전)에 들어가므로, 올리지 않으면 예전 문장으로 만든 벡터가 그대로 쓰인다.
+CORPUS_TEMPLATE_VERSION = "v1"
+
 def build_corpus(df: pd.DataFrame):
     texts = []
     article_ids = []
@@ -113,52 +176,89 @@ def build_corpus(df: pd.DataFrame):
 
     return texts, article_ids
 
-# 임베딩 생성 함수 (캐시 미사용 버전)
+# 임베딩 생성 함수 (저장소 미사용 버전)
 def create_embeddings(texts):
     if not texts:
         return None
     
     print(f"임베딩 생성 시작... (총 {len(texts)}개 기사)")
-    model = SentenceTransformer(MODEL_NAME)
-    embeddings = model.encode(
+    # 상주 임베딩 서비스가 있으면 그쪽 모델을 쓰고, 없으면 여기서 로드한다. (embeddings/embedding_client.py)
+    # 로컬 인코딩은 EMBEDDING_TOKEN_BUDGET이 있으면 토큰 예산 배치로 나눈다. (이때 batch_size=32는 쓰이지 않음)
+    client = get_embedding_client(
+        MODEL_NAME, EMBEDDING_SERVICE_URL, EMBEDDING_SERVICE_TIMEOUT,
+        EMBEDDING_TOKEN_BUDGET, EMBEDDING_TOKEN_BATCH_MAX, EMBEDDING_BACKEND,
+    )
+    embeddings = client.encode(
         texts,
         batch_size=32,
         show_progress_bar=True,
-        normalize_embeddings=True
+        normalize=True
     )
     return embeddings
 
-# 임베딩 생성 함수 (캐시 사용 버전)
-def load_or_create_embeddings(texts):
-    # 캐시가 있어도 현재 텍스트 개수와 다르면 새로 생성해야 합니다.
-    # 하지만 더 안전하게 하기 위해, 이번에는 캐시를 쓰지 않거나 
-    # 파일명에 텍스트 개수를 포함하는 방식이 좋습니다.
-
-    if os.path.exists(ARTICLE_EMBEDDINGS_CACHE):
-        print("임베딩 캐시 로드")
-        with open(ARTICLE_EMBEDDINGS_CACHE, "rb") as f:
-            cached_embeddings = pickle.load(f)
-            # 캐시된 임베딩 개수와 현재 분석할 텍스트 개수가 일치할 때만 로드
-            if len(cached_embeddings) == len(texts):
-                print(f"임베딩 캐시 로드 완료 (개수: {len(texts)})")
-                return cached_embeddings
-            else:
-                print(f"캐시 불일치 (캐시: {len(cached_embeddings)}, 현재: {len(texts)}). 새로 생성합니다.")
+# 임베딩 생성 함수 (임베딩 저장소 사용 버전)
+def load_or_create_embeddings(texts, article_ids):
+    # (news_id, 모델, 템플릿 버전, 백엔드) 기준 EmbeddingStore에서 읽고, 처음 보는 기사만 새로 인코딩한다.
+    if not texts:
+        return None
 
-    print(f"임베딩 생성 중... ({len(texts)}개 기사)")
-    model = SentenceTransformer(MODEL_NAME)
-    embeddings = model.encode(
-        texts,
-        batch_size=32,
-        show_progress_bar=True,
-        normalize_embeddings=True
+    store = EmbeddingStore(EMBEDDING_STORE_DIR, MODEL_NAME, CORPUS_TEMPLATE_VERSION, EMBEDDING_BACKEND)
+    print(f"임베딩 저장소 로드 (저장: {len(store)}개, {store.dir_path})")
+
+    embeddings, n_encoded = store.get_or_encode(article_ids, texts, create_embeddings)
+    print(f"임베딩 준비 완료 (전체: {len(texts)}, 재사용: {len(texts) - n_encoded}, 신규 생성: {n_encoded})")
+    return embeddings
+
+def build_clusterer(engine: str = CLUSTER_ENGINE):
+    if engine == "knn_graph":
+        return IssueGraphClusterer(
+            min_cluster_size=MIN_CLUSTER_SIZE,
+            min_samples=MIN_SAMPLES,
+            n_neighbors=KNN_NEIGHBORS,
+        )
+
+    if engine != "hdbscan":
+        print(f"경고: 지원하지 않는 클러스터링 엔진 '{engine}'. hdbscan 사용.")
+
+    return HDBSCAN(
+        min_cluster_size=MIN_CLUSTER_SIZE,   # 최소 MIN_CLUSTER_SIZE개의 기사는 있어야 군집으로 인정
+        min_samples=MIN_SAMPLES,
+        metric="cosine",                                     # 임베딩 정합
+        copy=False  
     )
 
-    os.makedirs(os.path.dirname(ARTICLE_EMBEDDINGS_CACHE), exist_ok=True)
-    with open(ARTICLE_EMBEDDINGS_CACHE, "wb") as f:
-        pickle.dump(embeddings, f)
+def issue_map_settings():
+    # 이 값이 이전 실행과 다르면 증분 갱신 대신 전체 재계산
+    return {
+        "model": MODEL_NAME,
+        "template": CORPUS_TEMPLATE_VERSION,
+        "backend": EMBEDDING_BACKEND,
+        "hours_window": HOURS_WINDOW,
+        "min_cluster_size": MIN_CLUSTER_SIZE,
+        "min_samples": MIN_SAMPLES,
+        "engine": CLUSTER_ENGINE,
+    }
 
-    return embeddings
+def choose_issue_update_mode(previous_issue_map, base_timestamp):
+    # 반환: ("incremental" 또는 "full", 전체 재계산 이유)
+    if not ISSUE_INCREMENTAL:
+        return "full", "ISSUE_INCREMENTAL=False"
+    if previous_issue_map is None:
+        return "full", "이전 이슈 지도 없음"
+
+    state = previous_issue_map["state"]
+    if state.get("settings") != issue_map_settings():
+        return "full", "설정 변경"
+    try:
+        previous_base = pd.Timestamp(state["base_date"])
+        last_full_rebuild = pd.Timestamp(state["last_full_rebuild"])
+    except Exception:
+        return "full", "state.json 형식 오류"
+    if base_timestamp <= previous_base:
+        return "full", f"기준시가 이전 실행({previous_base})보다 앞섬"
+    if base_timestamp - last_full_rebuild >= pd.Timedelta(hours=ISSUE_FULL_REBUILD_HOURS):
+        return "full", f"마지막 전체 재계산({last_full_rebuild}) 후 {ISSUE_FULL_REBUILD_HOURS}시간 경과"
+    return "incremental", ""
 
 def select_representative_titles(
     embeddings,
@@ -167,49 +267,36 @@ def select_representative_titles(
     issue_centers,
     top_k=5
 ):
-    cluster_to_titles = {}
-
-    for cid, center in issue_centers.items():
-        idxs = np.where(cluster_ids == cid)[0]
-        if len(idxs) == 0:
-            cluster_to_titles[cid] = []
-            continue
-
-        sims = cosine_similarity(
-            embeddings[idxs],
-            center.reshape(1, -1)
-        ).flatten()
-
-        top_idxs = idxs[np.argsort(sims)[::-1][:top_k]]
-        cluster_to_titles[cid] = [article_titles[i] for i in top_idxs]
+    # 주어진 중심 기준 대표 기사 (군집별 반복 대신 행별 내적 한 번 + top_k_by_group)
+    cids = list(issue_centers.keys())
+    if not cids:
+        return {}
+    position = {cid: i for i, cid in enumerate(cids)}
+    group = np.array([position.get(cid, -1) for cid in cluster_ids], dtype=np.int64)
+
+    x = np.asarray(embeddings, dtype=np.float32)
+    centers = np.stack([np.asarray(issue_centers[cid], dtype=np.float32) for cid in cids])
+    x = x / np.maximum(np.linalg.norm(x, axis=1, keepdims=True), 1e-12)
+    centers = centers / np.maximum(np.linalg.norm(centers, axis=1, keepdims=True), 1e-12)
+    sims = np.full(len(x), -np.inf, dtype=np.float32)
+    member = group >= 0
+    sims[member] = np.einsum("ij,ij->i", x[member], centers[group[member]])
+
+    top_idxs = top_k_by_group(sims, group, len(cids), top_k)
+    return {
+        cid: [article_titles[i] for i in top_idxs[position[cid]] if i >= 0]
+        for cid in cids
+    }
 
-    return cluster_to_titles
+def embed_window_articles(df: pd.DataFrame):
+    # RollingIssueWindow가 창에 새로 들어온 기사에만 호출한다.
+    texts, article_ids = build_corpus(df)
+    return load_or_create_embeddings(texts, article_ids)
 
 def main():
 
     start_time = time.time()
-    df = pd.read_csv(CANONICAL_ARCHIVE_PATH)    # 데이터셋 로드
-    print(f"데이터셋 로드 완료 → 전체 기사 수: {len(df)}")
 
-    # [경로 설정] 실행 시점 기준 날짜-시간 폴더 생성
-    run_timestamp = datetime.now().strftime("%Y%m%d_%H%M")
-    current_output_dir = os.path.join(ISSUE_CLUSTERS_ROOT, run_timestamp)
-    
-    issue_centers_path = os.path.join(current_output_dir, "centers.json")
-    issue_meta_path = os.path.join(current_output_dir, "meta.json")
-    article_issue_map_path = os.path.join(current_output_dir, "article_map.csv")
-    
-    # === 기준 날짜 및 시간 설정 (이 시점부터 과거 N시간을 추적) ===
-    # 1. 날짜 데이터 전처리 (시간대 유지)    
-    # 방법: 모두 KST(Asia/Seoul)로 통일하여 비교
-    
-    df["pubDate"] = pd.to_datetime(df["pubDate"], errors="coerce").dt.tz_convert('Asia/Seoul')  
-    # [디버그용] 데이터셋의 실제 시간 범위 출력
-    print(f"데이터셋 시간 범위: {df['pubDate'].min()} ~ {df['pubDate'].max()}")
-    
-    # 2. 현재 시각을 기사 데이터와 동일한 타임존(+0900)으로 생성
-    # pd.Timestamp.now()에 tz 정보를 추가하여 데이터와 비교 가능하게 만듭니다.
-        
     # === 기준 날짜 및 시간 설정 부분 ===
     if FIXED_BASE_DATE is not None:
         print(f"FIXED_BASE_DATE를 사용합니다 =>", {FIXED_BASE_DATE})
@@ -228,6 +315,25 @@ def main():
     print(f"설정된 기준시: {base_timestamp}")
     print(f"윈도우 시작시: {cutoff_date}")
 
+    # 데이터셋 로드 (sqlite 저장소면 시간창 구간만 pubDate 인덱스로 읽는다)
+    df = load_canonical_archive(
+        ARCHIVE_BACKEND, CANONICAL_ARCHIVE_PATH, ARTICLE_STORE_PATH,
+        since=cutoff_date, until=base_timestamp,
+    )
+    print(f"데이터셋 로드 완료 → 전체 기사 수: {len(df)}")
+
+    # === 기준 날짜 및 시간 설정 (이 시점부터 과거 N시간을 추적) ===
+    # 1. 날짜 데이터 전처리 (시간대 유지)    
+    # 방법: 모두 KST(Asia/Seoul)로 통일하여 비교
+    
+    df["pubDate"] = pd.to_datetime(df["pubDate"], errors="coerce").dt.tz_convert('Asia/Seoul')  
+    # [디버그용] 데이터셋의 실제 시간 범위 출력
+    print(f"데이터셋 시간 범위: {df['pubDate'].min()} ~ {df['pubDate'].max()}")
+    
+    # 2. 현재 시각을 기사 데이터와 동일한 타임존(+0900)으로 생성
+    # pd.Timestamp.now()에 tz 정보를 추가하여 데이터와 비교 가능하게 만듭니다.
+        
+
     before_count = len(df)
     df_filtered = df[(df["pubDate"] >= cutoff_date) & (df["pubDate"] <= base_timestamp)].copy()
     after_count = len(df_filtered)
@@ -241,18 +347,55 @@ def main():
     article_titles = df_filtered["title"].tolist()
     texts, article_ids = build_corpus(df_filtered)
         
-    #embeddings = load_or_create_embeddings(texts)
-    embeddings = create_embeddings(texts)
-    
-    clusterer = HDBSCAN(
-        min_cluster_size=MIN_CLUSTER_SIZE,   # 최소 MIN_CLUSTER_SIZE개의 기사는 있어야 군집으로 인정
-        min_samples=MIN_SAMPLES,
-        metric="cosine",                                     # 임베딩 정합
-        copy=False  
-    )
+    #embeddings = create_embeddings(texts)
+    embeddings = load_or_create_embeddings(texts, article_ids)
 
-    cluster_ids = clusterer.fit_predict(embeddings)    
-    print(f"HDBSCAN 파라미터 → min_cluster_size={MIN_CLUSTER_SIZE}, min_samples={MIN_SAMPLES}")
+    build_issue_map(article_titles, texts, article_ids, embeddings, base_timestamp, start_time)
+
+def build_issue_map(article_titles, texts, article_ids, embeddings, base_timestamp, start_time):
+    # 시간창 기사(제목/문장/news_id/임베딩)로 이슈 지도를 만들어 저장한다. (main 1회 실행, run_live 매 갱신)
+    # [경로 설정] 실행 시점 기준 날짜-시간 폴더 생성
+    run_timestamp = datetime.now().strftime("%Y%m%d_%H%M")
+    current_output_dir = os.path.join(ISSUE_CLUSTERS_ROOT, run_timestamp)
+    
+    issue_centers_path = os.path.join(current_output_dir, "centers.json")
+    issue_meta_path = os.path.join(current_output_dir, "meta.json")
+    article_issue_map_path = os.path.join(current_output_dir, "article_map.csv")
+    
+    # 직전 이슈 지도(current/)를 이어 받을 수 있으면 새 기사와 남은 기사만 군집화한다. (issue_cluster_id 유지)
+    previous_issue_map = load_issue_state(CURRENT_ISSUE_DIR)
+    previous_state = previous_issue_map["state"] if previous_issue_map else {}
+    next_issue_id = int(previous_state.get("next_issue_id", 0))
+    update_mode, update_reason = choose_issue_update_mode(previous_issue_map, base_timestamp)
+    print(f"이슈 지도 갱신 방식: {update_mode}" + (f" ({update_reason})" if update_reason else ""))
+
+    if update_mode == "incremental":
+        cluster_ids, next_issue_id, update_stats = update_issue_assignments(
+            embeddings, article_ids, previous_issue_map, next_issue_id,
+            min_cluster_size=MIN_CLUSTER_SIZE,
+            min_similarity=ISSUE_ASSIGN_MIN_SIMILARITY,
+            recluster=lambda x: build_clusterer(CLUSTER_ENGINE).fit_predict(x),
+            min_residue=max(MIN_CLUSTER_SIZE, MIN_SAMPLES),
+        )
+        print(f"증분 갱신 결과 → {update_stats}")
+        last_full_rebuild = previous_state["last_full_rebuild"]
+    else:
+        clusterer = build_clusterer(CLUSTER_ENGINE)
+
+        cluster_ids = clusterer.fit_predict(embeddings)    
+        # 이전 이슈와 기사 과반이 겹치는 군집은 그 issue_cluster_id를 이어 쓴다.
+        previous_article_map = previous_issue_map["article_map"] if previous_issue_map else {}
+        cluster_ids, next_issue_id = match_previous_ids(cluster_ids, article_ids, previous_article_map, next_issue_id)
+        last_full_rebuild = base_timestamp.isoformat()
+    print(f"HDBSCAN 파라미터 → min_cluster_size={MIN_CLUSTER_SIZE}, min_samples={MIN_SAMPLES}, engine={CLUSTER_ENGINE}")
+
+    # 이전 실행에서 이어진 이슈는 라벨을 재사용한다. (LLM 재호출 생략, 테스트용 더미 라벨은 제외)
+    previous_labels = previous_issue_map["labels"] if previous_issue_map else {}
+    reused_issue_labels = {
+        cid: label for cid, label in previous_labels.items()
+        if label and label != f"issue_{cid}"
+    }
+    first_seen = previous_state.get("first_seen", {})
 
     #=============== HDBSCAN을 위한 점수 계산
 
@@ -297,6 +440,25 @@ def main():
                     f"{n_clusters:^5} | {n_noise:>3}({noise_ratio:>4.1f}%) | "
                     f"{log_entry['silhouette_score']:^5} | {MODEL_NAME[:12]}\n")
         f.write(log_line)  
+
+    # 같은 내용을 구조화된 결과 표에도 남긴다. (스윕 결과와 같은 컬럼, sweep_id="run")
+    append_results(EXPERIMENT_RESULTS_PATH, pd.DataFrame([{
+        "sweep_id": "run",
+        "base_date": log_entry["base_date"],
+        "hours": HOURS_WINDOW,
+        "n_articles": len(texts),
+        "engine": CLUSTER_ENGINE if update_mode == "full" else f"{CLUSTER_ENGINE}+incremental",
+        "min_cluster_size": MIN_CLUSTER_SIZE,
+        "min_samples": MIN_SAMPLES,
+        "n_clusters": n_clusters,
+        "n_noise": n_noise,
+        "noise_ratio": round(noise_ratio, 2),
+        "silhouette": round(float(score), 4),
+        "seconds": round(time.time() - start_time, 3),
+        "model": MODEL_NAME,
+        "template": CORPUS_TEMPLATE_VERSION,
+        "backend": EMBEDDING_BACKEND,
+    }]))
     
     # =======================================================
 
@@ -304,29 +466,28 @@ def main():
     issue_centers = []   # 기계용
     issue_meta = []      # 사람용
 
-    valid_labels = sorted([l for l in set(cluster_ids) if l != -1])
-    for cid in valid_labels:
-        idxs = np.where(cluster_ids == cid)[0]
-        if len(idxs) == 0:
-            continue
+    # 군집 중심/크기/대표 기사를 한 번에 계산 (processors/issue_cluster_summary.py)
+    # 중심: 정렬 후 reduceat 한 번, 유사도: 정규화 벡터와 중심의 행별 내적, 대표 기사: argpartition top 5
+    cluster_summary = summarize_clusters(embeddings, cluster_ids, top_k=5)
+    valid_labels = cluster_summary.labels
+    for pos, cid in enumerate(valid_labels):
+        cid = int(cid)
+        cluster_size = int(cluster_summary.sizes[pos])
 
-        center_embedding = embeddings[idxs].mean(axis=0)
+        center_embedding = cluster_summary.centers[pos]
 
         # 대표 기사 선택 (중심과 가장 가까운 5개)
-        sims = cosine_similarity(
-            embeddings[idxs],
-            center_embedding.reshape(1, -1)
-        ).flatten()
-
-        top_local_idxs = np.argsort(sims)[::-1][:5]
-        top_article_idxs = idxs[top_local_idxs]
+        top_article_idxs = cluster_summary.representatives[pos]
+        top_article_idxs = top_article_idxs[top_article_idxs >= 0]
         representative_titles = [article_titles[i] for i in top_article_idxs]
 
         print(f"- 이슈 클러스터 {cid}: 대표 기사 제목들")
         for title in representative_titles:
             print(f"  - {title}")
 
-        if DISABLE_LLM_FOR_TEST:
+        if cid in reused_issue_labels:
+            issue_label = reused_issue_labels[cid]
+        elif DISABLE_LLM_FOR_TEST:
             issue_label = f"issue_{cid}"  # 테스트용 더미 라벨
         # LLM 제공자에 따라 적절한 파라미터 전달
         else :
@@ -362,8 +523,9 @@ def main():
         issue_meta.append({
             "issue_cluster_id": int(cid),
             "issue_label": issue_label,
-            "cluster_size": int(len(idxs)),
-            "representative_titles": representative_titles
+            "cluster_size": cluster_size,
+            "representative_titles": representative_titles,
+            "first_seen": first_seen.get(str(cid), base_timestamp.isoformat()),
         })
 
     print("결과 저장")
@@ -395,12 +557,58 @@ def main():
 
     article_issue_df.to_csv(article_issue_map_path, index=False)   
 
+    # 다음 실행의 증분 갱신용 상태 (current/state.json, current/article_map.csv)
+    issue_state = {
+        "base_date": base_timestamp.isoformat(),
+        "last_full_rebuild": last_full_rebuild,
+        "update_mode": update_mode,
+        "next_issue_id": int(next_issue_id),
+        "settings": issue_map_settings(),
+        "first_seen": {str(m["issue_cluster_id"]): m["first_seen"] for m in issue_meta},
+    }
+    save_issue_state(CURRENT_ISSUE_DIR, issue_state, article_ids, cluster_ids)
+
     end_time = time.time()
     elapsed = end_time - start_time    
     print(f"- 총 실행시간: {elapsed:.1f}초")
     print(f"- 이슈 클러스터: {issue_centers_path}")
     print(f"- 기사 매핑: {article_issue_map_path}")
 
+def run_live(interval_minutes=LIVE_REFRESH_MINUTES):
+    # 현재 시각 기준 시간창을 interval_minutes마다 한 칸씩 옮기며 이슈 지도를 갱신한다. (Ctrl+C로 종료)
+    if FIXED_BASE_DATE is not None:
+        print(f"[WARN] 라이브 갱신은 현재 시각 기준입니다. FIXED_BASE_DATE({FIXED_BASE_DATE})는 무시합니다.")
+
+    window = RollingIssueWindow(
+        ArticleTimeIndex(ARCHIVE_BACKEND, CANONICAL_ARCHIVE_PATH, ARTICLE_STORE_PATH),
+        HOURS_WINDOW,
+        embed_window_articles,
+    )
+    while True:
+        start_time = time.time()
+        base_timestamp = pd.Timestamp.now(tz="Asia/Seoul")
+        try:
+            tick = window.tick(base_timestamp)
+            print(f"[LIVE] {tick.cutoff} ~ {base_timestamp}: 창 {len(tick.df)}건 "
+                  f"(들어옴 {len(tick.entering)}, 나감 {len(tick.leaving)}, 시간창 갱신 {time.time() - start_time:.1f}초)")
+
+            if len(tick.df) < max(MIN_CLUSTER_SIZE, MIN_SAMPLES, 2):
+                print("[LIVE] 창 안 기사가 너무 적어 이번 갱신은 건너뜁니다.")
+            else:
+                texts, article_ids = build_corpus(tick.df)
+                build_issue_map(tick.df["title"].tolist(), texts, article_ids, tick.embeddings, base_timestamp, start_time)
+        except Exception as e:
+            print(f"[WARN] 라이브 갱신 실패, 다음 주기에 다시 시도합니다: {e}")
+
+        time.sleep(max(0.0, interval_minutes * 60 - (time.time() - start_time)))
+
 if __name__ == "__main__":    
-    main()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--live", action="store_true", help="LIVE_REFRESH_MINUTES마다 이동 시간창으로 이슈 지도 갱신")
+    parser.add_argument("--interval-minutes", type=float, default=LIVE_REFRESH_MINUTES)
+    args = parser.parse_args()
+    if args.live:
+        run_live(args.interval_minutes)
+    else:
+        main()
     
@@ -0,0 +1,91 @@
+"""
+scripts/issue_cluster_sweep.py
+이슈 클러스터링 파라미터 스윕: (MIN_CLUSTER_SIZE, MIN_SAMPLES) 조합과 시간창을 한 번에 비교한다.
+실행 방법: python -m src.scripts.issue_cluster_sweep [--sizes 3 4] [--samples 3 4] [--hours 6 12 24] [--engine hdbscan]
+
+- 기준시는 general_issue_clusters와 같다. (FIXED_BASE_DATE, 없으면 현재 시각)
+- 가장 넓은 시간창의 기사만 읽어 한 번 임베딩하고(임베딩 저장소 재사용), 좁은 창은 그 앞부분을 쓴다.
+- 설정마다 HDBSCAN을 프로세스 풀에서 돌린다. 임베딩 행렬은 shared_memory로 공유한다. (processors/issue_cluster_sweep.py)
+- 결과(군집 수, 노이즈 비율, 실루엣, 소요 시간)는 clustering_experiments.csv에 이어 쓴다. (general_issue_clusters 실행 기록과 같은 표)
+"""
+
+import argparse
+import time
+from datetime import datetime
+
+import pandas as pd
+
+from src.api.archive_backends import pubdate_sort_key
+from src.api.article_store import load_canonical_archive
+from src.processors.issue_cluster_sweep import sweep_tasks, run_sweep, append_results
+from src.config import CANONICAL_ARCHIVE_PATH, ARCHIVE_BACKEND, ARTICLE_STORE_PATH
+from src.scripts import general_issue_clusters as gic
+
+
+def resolve_base_timestamp():
+    if gic.FIXED_BASE_DATE is None:
+        return pd.Timestamp.now(tz="Asia/Seoul")
+    base_timestamp = pd.to_datetime(gic.FIXED_BASE_DATE)
+    if base_timestamp.tzinfo is None:
+        return base_timestamp.tz_localize("Asia/Seoul")
+    return base_timestamp.tz_convert("Asia/Seoul")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 4], help="MIN_CLUSTER_SIZE 후보")
+    parser.add_argument("--samples", type=int, nargs="+", default=[3, 4], help="MIN_SAMPLES 후보")
+    parser.add_argument("--hours", type=float, nargs="+", default=[gic.HOURS_WINDOW], help="시간창(시간) 후보")
+    parser.add_argument("--engine", nargs="+", default=[gic.CLUSTER_ENGINE], choices=["hdbscan", "knn_graph"])
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: min(설정 수, CPU 수))")
+    args = parser.parse_args()
+
+    started = time.time()
+    base_timestamp = resolve_base_timestamp()
+    widest = max(args.hours)
+    cutoff = base_timestamp - pd.Timedelta(hours=widest)
+    print(f"기준시: {base_timestamp}, 가장 넓은 창: {cutoff} ~ {base_timestamp}")
+
+    df = load_canonical_archive(
+        ARCHIVE_BACKEND, CANONICAL_ARCHIVE_PATH, ARTICLE_STORE_PATH,
+        since=cutoff, until=base_timestamp,
+    )
+    pub = pubdate_sort_key(df["pubDate"])
+    df = df.assign(_pub=pub)
+    df = df[(df["_pub"] >= cutoff) & (df["_pub"] <= base_timestamp)]
+    # 최신 기사부터 → 각 시간창은 앞 n행
+    df = df.sort_values("_pub", ascending=False, kind="stable").reset_index(drop=True)
+    if df.empty:
+        print("[WARN] 시간창 안에 기사가 없습니다. FIXED_BASE_DATE를 확인하세요.")
+        return
+
+    texts, article_ids = gic.build_corpus(df)
+    embeddings = gic.load_or_create_embeddings(texts, article_ids)
+
+    window_sizes = {
+        h: int((df["_pub"] >= base_timestamp - pd.Timedelta(hours=h)).sum())
+        for h in args.hours
+    }
+    tasks = sweep_tasks(window_sizes, args.sizes, args.samples, args.engine, gic.KNN_NEIGHBORS)
+    print(f"설정 {len(tasks)}개 평가 시작 (창별 기사 수: {window_sizes})")
+
+    results = run_sweep(embeddings, tasks, args.workers)
+    if results.empty:
+        print("[WARN] 평가된 설정이 없습니다.")
+        return
+
+    results.insert(0, "sweep_id", datetime.now().strftime("%Y%m%d_%H%M%S"))
+    results.insert(1, "base_date", base_timestamp.strftime("%Y-%m-%d %H:%M:%S"))
+    results["model"] = gic.MODEL_NAME
+    results["template"] = gic.CORPUS_TEMPLATE_VERSION
+    results["backend"] = gic.EMBEDDING_BACKEND
+    append_results(gic.EXPERIMENT_RESULTS_PATH, results)
+
+    ranked = results.sort_values(["hours", "silhouette"], ascending=[True, False], na_position="last")
+    print(ranked[["hours", "n_articles", "engine", "min_cluster_size", "min_samples",
+                  "n_clusters", "noise_ratio", "silhouette", "seconds"]].to_string(index=False))
+    print(f"\n결과 저장: {gic.EXPERIMENT_RESULTS_PATH} (총 {time.time() - started:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
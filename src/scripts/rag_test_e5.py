@@ -3,10 +3,14 @@
 
 
 import pandas as pd
-from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
-from config import CANONICAL_ARCHIVE_PATH
+from config import (
+    CANONICAL_ARCHIVE_PATH, ARCHIVE_BACKEND, ARTICLE_STORE_PATH,
+    EMBEDDING_SERVICE_URL, EMBEDDING_SERVICE_TIMEOUT, EMBEDDING_TOKEN_BUDGET, EMBEDDING_TOKEN_BATCH_MAX,
+)
+from api.article_store import load_canonical_archive
+from embeddings.embedding_client import get_embedding_client
 
 MODEL_NAME = "dragonkue/multilingual-e5-small-ko-v2"
 
@@ -30,10 +34,14 @@ def build_corpus(df: pd.DataFrame):
 
 def main():
     print("데이터 로딩")
-    df = pd.read_csv(CANONICAL_ARCHIVE_PATH)
+    df = load_canonical_archive(ARCHIVE_BACKEND, CANONICAL_ARCHIVE_PATH, ARTICLE_STORE_PATH)
 
     print("모델 로딩")
-    model = SentenceTransformer(MODEL_NAME)
+    # 상주 임베딩 서비스가 떠 있으면 모델 로드 없이 바로 쓴다.
+    model = get_embedding_client(
+        MODEL_NAME, EMBEDDING_SERVICE_URL, EMBEDDING_SERVICE_TIMEOUT,
+        EMBEDDING_TOKEN_BUDGET, EMBEDDING_TOKEN_BATCH_MAX,
+    )
 
     print("코퍼스 구성")
     corpus_texts, meta = build_corpus(df)
@@ -43,7 +51,7 @@ def main():
         corpus_texts,
         batch_size=32,
         show_progress_bar=True,
-        normalize_embeddings=True
+        normalize=True
     )
 
     while True:
@@ -53,9 +61,9 @@ def main():
 
         query_text = f"query: {query}"
         query_embedding = model.encode(
-            query_text,
-            normalize_embeddings=True
-        )
+            [query_text],
+            normalize=True
+        )[0]
 
         sims = cosine_similarity(
             [query_embedding],
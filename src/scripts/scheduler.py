@@ -6,13 +6,14 @@ import time
 import os
 import sys
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
  
 # 프로젝트 루트 경로 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from pipeline import run_news_pipeline
-from config import SEARCH_KEYWORDS, AGGREGATE_PER_HOURS
+from config import SEARCH_KEYWORDS, AGGREGATE_PER_HOURS, KEYWORD_MAX_WORKERS
 from utils.logger import PipelineLogger, verify_file_before_write
 
 
@@ -87,6 +88,31 @@ def save_log_to_csv(stats_list):
         df_log.to_csv(f, index=False, header=is_new, lineterminator='\n')
         f.write(",,,,,,, \n")
 
+def _run_keyword(kw, is_required, fetch_count, log_dir):
+    """키워드 1건 실행 → (keyword, stats, error). 예외는 여기서 잡아 다른 키워드에 영향을 주지 않는다."""
+    try:
+        return kw, run_news_pipeline(kw, fetch_count, is_required, log_dir=log_dir), None
+    except Exception as e:
+        return kw, None, e
+
+def run_keywords(targets, log_dir, max_workers=KEYWORD_MAX_WORKERS):
+    """
+    대상 키워드들의 파이프라인 실행
+    - max_workers <= 1 이면 기존처럼 순차 실행
+    - 그 외에는 스레드 풀로 동시에 실행한다. (키워드별 archive 폴더가 분리되어 있어 저장 경로는 겹치지 않음)
+      API 호출/본문 수집은 겹쳐서 진행되고, CPU 구간은 pipeline의 PIPELINE_CPU_SLOTS로 제한된다.
+    - 결과는 완료 순서와 관계없이 targets 순서로 반환한다.
+    """
+    if max_workers <= 1 or len(targets) <= 1:
+        return [_run_keyword(kw, is_required, fetch_count, log_dir) for kw, is_required, fetch_count in targets]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(targets)), thread_name_prefix="keyword") as executor:
+        futures = [
+            executor.submit(_run_keyword, kw, is_required, fetch_count, log_dir)
+            for kw, is_required, fetch_count in targets
+        ]
+        return [future.result() for future in futures]
+
 def job():
     """전체 키워드 순회 및 수집 작업"""
     print(f"\n{'>'*10} 정기 수집 프로세스 시작: {datetime.now()} {'>'*10}")
@@ -104,6 +130,7 @@ def job():
 
     all_stats = []
     executed_keywords = []
+    targets = []
 
     for kw, is_required, fetch_count in SEARCH_KEYWORDS:
 
@@ -126,24 +153,27 @@ def job():
         if not should_execute:
             continue
 
-        try:
-            stats = run_news_pipeline(kw, fetch_count, is_required, log_dir=current_log_dir)
+        targets.append((kw, is_required, fetch_count))
+
+    # 키워드 파이프라인 실행 (병렬 실행 시에도 결과는 SEARCH_KEYWORDS 순서로 돌려받아 여기서만 병합)
+    logger.add_metric("keyword_workers", min(KEYWORD_MAX_WORKERS, len(targets)))
+    for kw, stats, error in run_keywords(targets, current_log_dir):
+        if error is None:
             if stats:
                 all_stats.append(stats)
                 executed_keywords.append(kw)
                 updated_last_executed[kw] = now.strftime("%Y-%m-%d %H:%M:%S")
                 logger.add_metric(f"result_{kw}", stats["status"])
-
-        except Exception as e:
-            print(f"!!! [{kw}] 실행 중 오류: {e}")
+        else:
+            print(f"!!! [{kw}] 실행 중 오류: {error}")
             error_stat = {
                 "keyword": kw, 
                 "new_raw": 0,
                 "final_added": 0,
-                "status": f"error: {str(e)}"
+                "status": f"error: {str(error)}"
             }
             all_stats.append(error_stat)
-            logger.add_metric(f"error_{kw}", str(e))
+            logger.add_metric(f"error_{kw}", str(error))
     
     logger.add_metric("executed_keywords", executed_keywords)
     logger.end_step(result_count=len(executed_keywords))
@@ -0,0 +1,147 @@
+# check_embedding_backend_parity.py
+# 실행법 python validators/check_embedding_backend_parity.py [--backend onnx] [--backend torch-int8] [--base 2026-02-14T06:00:00+09:00] [--model 경로] [--source CSV]
+"""
+1. 역할
+임베딩 추론 백엔드(embeddings/inference_backends.py: onnx / torch-int8)가 기본 fp32 torch와
+같은 이슈 지도를 만드는지 확인하고, 기사당 인코딩 시간을 비교한다.
+
+2. 대상
+canonical 기사 중 기준시(--base, 기본값은 가장 최근 pubDate) 이전 HOURS_WINDOW시간 치 기사 (general_issue_clusters와 같은 창).
+문장은 general_issue_clusters.build_corpus, HDBSCAN 파라미터도 general_issue_clusters 값을 그대로 쓴다.
+- 벡터: 기사별 fp32 벡터와의 코사인 유사도 (최소/평균)
+- 군집: 같은 HDBSCAN 설정으로 나눈 결과의 ARI, 노이즈 판정 일치율
+--model로 로컬 SentenceTransformer 폴더, --source로 pubDate/title/content 컬럼이 있는 다른 CSV를 지정할 수 있다.
+(오프라인 점검용. 이 결과는 VERIFIED_BACKENDS에 적지 않는다)
+
+3. 이게 깨지면 의미하는 것
+최소 코사인이 MIN_COSINE 미만이거나 ARI가 MIN_ARI 미만이면, 그 백엔드로 바꿨을 때 이슈 묶음이 달라진다는 뜻이다.
+EMBEDDING_BACKEND를 "torch"로 유지해야 한다.
+기준을 넘은 백엔드는 출력된 기록 줄을 embeddings/inference_backends.VERIFIED_BACKENDS에 적어야 로드할 수 있다.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.cluster import HDBSCAN
+from sklearn.metrics import adjusted_rand_score
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SRC_DIR)
+sys.path.insert(0, os.path.dirname(SRC_DIR))
+from config import CANONICAL_ARCHIVE_PATH, ARCHIVE_BACKEND, ARTICLE_STORE_PATH
+from api.archive_backends import pubdate_sort_key
+from api.article_store import load_canonical_archive
+from embeddings.inference_backends import load_sentence_transformer, PARITY_MIN_COSINE, PARITY_MIN_ARI
+from src.scripts.general_issue_clusters import (
+    build_corpus,
+    MODEL_NAME,
+    HOURS_WINDOW,
+    MIN_CLUSTER_SIZE,
+    MIN_SAMPLES,
+)
+
+MIN_COSINE = PARITY_MIN_COSINE   # 기사별 fp32 벡터와의 최소 코사인 유사도
+MIN_ARI = PARITY_MIN_ARI         # fp32 HDBSCAN 결과와의 adjusted Rand index
+BATCH_SIZE = 32
+
+
+def load_reference_window(base, source=None):
+    if source:
+        df = pd.read_csv(source, dtype={"news_id": str})
+    else:
+        df = load_canonical_archive(ARCHIVE_BACKEND, CANONICAL_ARCHIVE_PATH, ARTICLE_STORE_PATH)
+    pub = pubdate_sort_key(df["pubDate"])
+    if base is None:
+        base_ts = pub.max()
+    else:
+        base_ts = pd.Timestamp(base)
+        if base_ts.tzinfo is None:
+            base_ts = base_ts.tz_localize("Asia/Seoul")
+    cutoff = base_ts - pd.Timedelta(hours=HOURS_WINDOW)
+    window = df[(pub >= cutoff) & (pub <= base_ts)].reset_index(drop=True)
+    return window, cutoff, base_ts
+
+
+def encode(model, texts):
+    started = time.perf_counter()
+    vectors = model.encode(texts, batch_size=BATCH_SIZE, show_progress_bar=False, normalize_embeddings=True)
+    return np.asarray(vectors, dtype=np.float32), time.perf_counter() - started
+
+
+def cluster(embeddings):
+    return HDBSCAN(
+        min_cluster_size=MIN_CLUSTER_SIZE,
+        min_samples=MIN_SAMPLES,
+        metric="cosine",
+        copy=True,
+    ).fit_predict(embeddings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", action="append", help="비교할 백엔드 (기본: onnx, torch-int8)")
+    parser.add_argument("--base", default=None, help="기준시 (ISO 형식, 기본: 가장 최근 pubDate)")
+    parser.add_argument("--model", default=MODEL_NAME, help="모델 이름 또는 로컬 SentenceTransformer 폴더")
+    parser.add_argument("--source", default=None, help="pubDate/title/content 컬럼이 있는 CSV (기본: canonical 아카이브)")
+    args = parser.parse_args()
+    backends = args.backend or ["onnx", "torch-int8"]
+
+    df, cutoff, base_ts = load_reference_window(args.base, args.source)
+    texts, _ = build_corpus(df)
+    print(f"[기준 창] {cutoff} ~ {base_ts}: {len(texts)}건 (모델: {args.model})")
+    if len(texts) < MIN_CLUSTER_SIZE * 2:
+        print("[WARN] 기준 창의 기사가 너무 적어 비교할 수 없습니다. --base를 지정하세요.")
+        sys.exit(2)
+
+    reference_model = load_sentence_transformer(args.model, "torch")
+    encode(reference_model, texts[:BATCH_SIZE])  # 예열
+    reference, ref_seconds = encode(reference_model, texts)
+    ref_labels = cluster(reference)
+    ref_noise = ref_labels == -1
+    print(f"[torch fp32] {ref_seconds / len(texts) * 1000:.2f}ms/건, "
+          f"군집 {len(set(ref_labels) - {-1})}개, 노이즈 {int(ref_noise.sum())}건")
+
+    print(f"\n{'백엔드':<12} {'ms/건':>8} {'속도':>6} {'최소 cos':>9} {'평균 cos':>9} {'ARI':>6} {'노이즈 일치':>10} {'군집 수':>6}")
+    failed, records = [], []
+    for backend in backends:
+        try:
+            model = load_sentence_transformer(args.model, backend, check_parity=False)
+        except Exception as e:
+            print(f"{backend:<12} [WARN] 로드 실패: {e}")
+            failed.append(backend)
+            continue
+        encode(model, texts[:BATCH_SIZE])  # 예열
+        vectors, seconds = encode(model, texts)
+        cos = np.sum(reference * vectors, axis=1)
+        labels = cluster(vectors)
+        ari = adjusted_rand_score(ref_labels, labels)
+        noise_agree = float(np.mean((labels == -1) == ref_noise))
+        ok = cos.min() >= MIN_COSINE and ari >= MIN_ARI
+        if not ok:
+            failed.append(backend)
+        else:
+            records.append(
+                f'("{args.model}", "{backend}"): {{"min_cos": {cos.min():.4f}, "ari": {ari:.3f}, '
+                f'"n": {len(texts)}, "checked": "{pd.Timestamp.now(tz="Asia/Seoul"):%Y-%m-%d}"}},'
+            )
+        print(f"{backend:<12} {seconds / len(texts) * 1000:>8.2f} {ref_seconds / seconds:>5.2f}x "
+              f"{cos.min():>9.4f} {cos.mean():>9.4f} {ari:>6.3f} {noise_agree:>10.1%} "
+              f"{len(set(labels) - {-1}):>6}  {'OK' if ok else 'FAIL'}")
+
+    if records and args.model == MODEL_NAME and not args.source:
+        print("\n[기록] embeddings/inference_backends.VERIFIED_BACKENDS에 옮겨 적을 줄:")
+        for record in records:
+            print(f"    {record}")
+
+    if failed:
+        print(f"\n[FAIL] 기준(min cos ≥ {MIN_COSINE}, ARI ≥ {MIN_ARI})을 만족하지 못한 백엔드: {', '.join(failed)}")
+        sys.exit(1)
+    print(f"\n[OK] 모든 백엔드가 기준(min cos ≥ {MIN_COSINE}, ARI ≥ {MIN_ARI})을 만족합니다.")
+
+
+if __name__ == "__main__":
+    main()
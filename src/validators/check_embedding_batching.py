@@ -0,0 +1,111 @@
+# check_embedding_batching.py
+# 실행법 python validators/check_embedding_batching.py [--limit N] [--budget 4096 --budget 8192] [--repeat R] [--model 경로] [--source CSV]
+"""
+1. 역할
+general_issue_clusters의 임베딩 단계에서 기존 호출(model.encode, batch_size=32 고정)과
+토큰 예산 배치(embeddings/token_batching.py)의 CPU 처리량을 비교하고, 두 결과 벡터가 같은지 확인한다.
+
+2. 대상
+canonical_archive.csv 앞쪽 N건 (기본 2000건)을 general_issue_clusters.build_corpus와 같은 문장
+(제목 + 본문 앞 300자)으로 만든 스냅샷. 모델은 dragonkue/multilingual-e5-small-ko-v2.
+--model로 로컬 SentenceTransformer 폴더, --source로 title/content 컬럼이 있는 다른 CSV를 지정할 수 있다. (오프라인 점검용)
+첫 측정 전에 한 번 예열하고, 각 방식을 R번 돌려 가장 빠른 값을 쓴다.
+패딩 포함 토큰 수(배치 건수 × 배치 안 최장 길이 합계)도 함께 출력한다.
+
+3. 이게 깨지면 의미하는 것
+최소 코사인 유사도가 0.9999 아래면 배치 구성에 따라 결과가 달라진다는 뜻이다. (순서 복원 오류 등)
+EMBEDDING_TOKEN_BUDGET을 켜지 말고(None 유지) token_batching.py를 확인해야 한다.
+속도 비율(xN)이 1 이하이면 그 예산으로는 켤 이유가 없다.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import CANONICAL_ARCHIVE_PATH, EMBEDDING_TOKEN_BUDGET, EMBEDDING_TOKEN_BATCH_MAX
+from embeddings.token_batching import token_lengths, plan_token_batches, encode_by_token_budget
+
+MODEL_NAME = "dragonkue/multilingual-e5-small-ko-v2"
+FIXED_BATCH_SIZE = 32
+MIN_COSINE = 0.9999
+
+
+def load_snapshot(limit, source=CANONICAL_ARCHIVE_PATH):
+    df = pd.read_csv(source, usecols=["title", "content"], nrows=limit)
+    # general_issue_clusters.build_corpus (dragonkue 모델)와 같은 구성
+    return [f"{row.title} {str(row.content)[:300]}" for row in df.itertuples(index=False)]
+
+
+def padded_tokens_fixed(lengths, batch_size):
+    """SentenceTransformer.encode와 같은 방식(문자 길이 내림차순, 건수 고정)의 패딩 포함 토큰 수"""
+    return sum(int(chunk.max()) * len(chunk) for chunk in np.array_split(lengths, list(range(batch_size, len(lengths), batch_size))))
+
+
+def timed(fn, repeat):
+    best, result = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--limit", type=int, default=2000)
+    parser.add_argument("--budget", type=int, action="append", help="비교할 토큰 예산 (여러 번 지정 가능)")
+    parser.add_argument("--max-batch", type=int, default=EMBEDDING_TOKEN_BATCH_MAX)
+    parser.add_argument("--repeat", type=int, default=2)
+    parser.add_argument("--model", default=MODEL_NAME, help="모델 이름 또는 로컬 SentenceTransformer 폴더")
+    parser.add_argument("--source", default=CANONICAL_ARCHIVE_PATH, help="title/content 컬럼이 있는 CSV")
+    args = parser.parse_args()
+    budgets = args.budget or [EMBEDDING_TOKEN_BUDGET or 8192]
+
+    from sentence_transformers import SentenceTransformer
+
+    texts = load_snapshot(args.limit, args.source)
+    print(f"[스냅샷] {len(texts)}건 ({args.source}, 모델: {args.model})")
+    model = SentenceTransformer(args.model, device="cpu")
+
+    lengths = token_lengths(model.tokenizer, texts, model.max_seq_length)
+    by_chars = lengths[np.argsort([-len(t) for t in texts], kind="stable")]
+    print(f"[토큰 길이] 평균 {lengths.mean():.1f}, 최소 {lengths.min()}, 최대 {lengths.max()}")
+
+    # 예열 (첫 호출의 스레드 풀/메모리 할당 비용 제외)
+    model.encode(texts[:64], batch_size=FIXED_BATCH_SIZE, normalize_embeddings=True)
+
+    base_seconds, base = timed(
+        lambda: model.encode(texts, batch_size=FIXED_BATCH_SIZE, normalize_embeddings=True), args.repeat
+    )
+    base = np.asarray(base, dtype=np.float32)
+    print(f"\n{'방식':<24} {'초':>8} {'건/초':>9} {'배치 수':>7} {'패딩 포함 토큰':>14} {'최소 cos':>9}")
+    print(f"{'fixed batch_size=' + str(FIXED_BATCH_SIZE):<24} {base_seconds:>8.2f} {len(texts) / base_seconds:>9.1f} "
+          f"{(len(texts) + FIXED_BATCH_SIZE - 1) // FIXED_BATCH_SIZE:>7} "
+          f"{padded_tokens_fixed(by_chars, FIXED_BATCH_SIZE):>14} {'-':>9}")
+
+    failed = False
+    for budget in budgets:
+        batches = plan_token_batches(lengths, budget, args.max_batch)
+        padded = sum(int(lengths[idxs].max()) * len(idxs) for idxs in batches)
+        seconds, vectors = timed(
+            lambda: encode_by_token_budget(model, texts, budget, args.max_batch, normalize=True), args.repeat
+        )
+        min_cos = float(np.min(np.sum(base * vectors, axis=1)))
+        failed |= min_cos < MIN_COSINE
+        print(f"{'token budget=' + str(budget):<24} {seconds:>8.2f} {len(texts) / seconds:>9.1f} "
+              f"{len(batches):>7} {padded:>14} {min_cos:>9.5f}  (x{base_seconds / seconds:.2f})")
+
+    if failed:
+        print(f"\n[FAIL] 최소 코사인 유사도가 {MIN_COSINE} 미만인 방식이 있습니다.")
+        sys.exit(1)
+    print("\n[OK] 모든 방식의 벡터가 기존 호출과 일치합니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+# check_html_extractor_parity.py
+# 실행법 python validators/check_html_extractor_parity.py [HTML 폴더] [--collect N] [--repeat R]
+"""
+1. 역할
+기사 본문 추출기 "bs4"(기존) / "lxml"(고속)이 같은 HTML에서 같은 텍스트를 만드는지 확인하고,
+페이지당 추출 시간을 비교한다.
+
+2. 대상
+저장해 둔 기사 HTML 파일(*.html) 폴더. 기본값은 data/scrape_corpus
+--collect N: canonical_archive.csv의 link 중 N건을 내려받아 폴더에 저장한 뒤 비교한다.
+비교는 normalize_html_text 적용 후 텍스트(실제 저장되는 값) 기준이다.
+
+3. 이게 깨지면 의미하는 것
+lxml 추출기가 bs4 get_text 규칙(노이즈 태그 제거, 주석 제외, 조각별 strip 후 공백 결합)과 다르게 동작한다는 뜻이다.
+SCRAPE_HTML_ENGINE을 "bs4"로 되돌리고 불일치 페이지를 확인해야 한다.
+"""
+
+import argparse
+import glob
+import hashlib
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import CANONICAL_ARCHIVE_PATH, DATA_DIR
+from api.http_session import get_shared_session
+from processors.article_html_extractor import EXTRACTORS
+from utils.text_normalizer import normalize_html_text
+
+DEFAULT_CORPUS_DIR = str(DATA_DIR / "scrape_corpus")
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'}
+
+
+def collect_pages(corpus_dir, limit, delay=0.1):
+    """canonical_archive.csv의 기사 링크를 내려받아 <news_id>.html로 저장"""
+    os.makedirs(corpus_dir, exist_ok=True)
+    df = pd.read_csv(CANONICAL_ARCHIVE_PATH, usecols=["link"])
+    session = get_shared_session()
+
+    saved = 0
+    for link in df["link"].dropna().head(limit):
+        path = os.path.join(corpus_dir, hashlib.md5(str(link).encode()).hexdigest()[:12] + ".html")
+        if os.path.exists(path):
+            continue
+        try:
+            resp = session.get(link, headers=HEADERS)
+            if resp.status_code == 200:
+                with open(path, "w", encoding="utf-8") as f:
+                    f.write(resp.text)
+                saved += 1
+        except Exception as e:
+            print(f"  - 수집 실패: {link} ({e})")
+        time.sleep(delay)
+    print(f"[수집] {saved}건 저장 → {corpus_dir}")
+
+
+def load_pages(corpus_dir):
+    pages = []
+    for path in sorted(glob.glob(os.path.join(corpus_dir, "*.html"))):
+        with open(path, "r", encoding="utf-8") as f:
+            pages.append((os.path.basename(path), f.read()))
+    return pages
+
+
+def time_engine(extract, pages, repeat):
+    """페이지별 최소 소요 시간(ms)"""
+    best = np.full(len(pages), np.inf)
+    for _ in range(repeat):
+        for i, (_, html) in enumerate(pages):
+            started = time.perf_counter()
+            extract(html)
+            best[i] = min(best[i], time.perf_counter() - started)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("corpus_dir", nargs="?", default=DEFAULT_CORPUS_DIR)
+    parser.add_argument("--collect", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.collect:
+        collect_pages(args.corpus_dir, args.collect)
+
+    pages = load_pages(args.corpus_dir)
+    if not pages:
+        print(f"비교할 HTML이 없습니다: {args.corpus_dir} (--collect N 으로 수집)")
+        sys.exit(1)
+
+    # 1. 결과 동일성
+    mismatches = []
+    empty = 0
+    for name, html in pages:
+        expected = normalize_html_text(EXTRACTORS["bs4"](html))
+        actual = normalize_html_text(EXTRACTORS["lxml"](html))
+        if expected != actual:
+            mismatches.append((name, expected, actual))
+        elif not expected:
+            empty += 1
+
+    print(f"[동일성] 페이지 {len(pages)}건 | 본문 없음 {empty}건 | 불일치 {len(mismatches)}건")
+    for name, expected, actual in mismatches[:10]:
+        pos = next((k for k, (a, b) in enumerate(zip(expected, actual)) if a != b), min(len(expected), len(actual)))
+        print(f"  - {name} @ {pos}: bs4={expected[pos:pos + 40]!r} lxml={actual[pos:pos + 40]!r}")
+
+    # 2. 처리 시간
+    timings = {engine: time_engine(extract, pages, args.repeat) for engine, extract in EXTRACTORS.items()}
+    for engine, ms in timings.items():
+        print(
+            f"[{engine:4}] 페이지당(ms) 평균 {ms.mean():.2f} | p50 {np.percentile(ms, 50):.2f} | "
+            f"p95 {np.percentile(ms, 95):.2f} | 합계 {ms.sum():.0f}"
+        )
+    print(f"[속도] lxml / bs4 = {timings['bs4'].sum() / timings['lxml'].sum():.1f}배 빠름")
+
+    sys.exit(2 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
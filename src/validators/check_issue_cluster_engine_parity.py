@@ -0,0 +1,103 @@
+# check_issue_cluster_engine_parity.py
+# 실행법 python validators/check_issue_cluster_engine_parity.py [--base 2026-02-14T06:00:00+09:00] [--hours 12] [--k 15 --k 30]
+"""
+1. 역할
+이슈 클러스터링 엔진 "knn_graph"(processors/issue_graph_clusterer.py)가 기존 "hdbscan"(HDBSCAN metric="cosine")과
+같은 이슈 지도를 만드는지 확인하고, 클러스터링 시간을 비교한다.
+
+2. 대상
+general_issue_clusters의 FIXED_BASE_DATE(없으면 가장 최근 pubDate) 기준 HOURS_WINDOW시간 창.
+--hours로 창을 넓혀 시간 차이를 볼 수 있다. 임베딩은 general_issue_clusters와 같은 저장소에서 읽는다. (없는 기사만 인코딩)
+- ARI, 노이즈 판정 일치율, 군집 수
+- k-NN 방식: hnswlib이 설치되어 있으면 근사(hnsw), 아니면 정확 탐색(exact)
+
+3. 이게 깨지면 의미하는 것
+ARI가 MIN_ARI 미만이면 k-NN 그래프에 빠진 간선 때문에 군집 선택이 달라진다는 뜻이다.
+KNN_NEIGHBORS를 늘리거나 CLUSTER_ENGINE을 "hdbscan"으로 유지해야 한다.
+(mutual reachability 거리는 동점이 많아, 완전한 그래프에서도 병합 순서에 따라 경계 기사 몇 건은 달라질 수 있다)
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import adjusted_rand_score
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SRC_DIR)
+sys.path.insert(0, os.path.dirname(SRC_DIR))
+from config import CANONICAL_ARCHIVE_PATH, ARCHIVE_BACKEND, ARTICLE_STORE_PATH
+from api.archive_backends import pubdate_sort_key
+from api.article_store import load_canonical_archive
+from src.scripts import general_issue_clusters as gic
+
+MIN_ARI = 0.95
+
+
+def load_window(base, hours):
+    df = load_canonical_archive(ARCHIVE_BACKEND, CANONICAL_ARCHIVE_PATH, ARTICLE_STORE_PATH)
+    pub = pubdate_sort_key(df["pubDate"])
+    if base is None:
+        base_ts = pub.max()
+    else:
+        base_ts = pd.Timestamp(base)
+        if base_ts.tzinfo is None:
+            base_ts = base_ts.tz_localize("Asia/Seoul")
+    cutoff = base_ts - pd.Timedelta(hours=hours)
+    return df[(pub >= cutoff) & (pub <= base_ts)].reset_index(drop=True), cutoff, base_ts
+
+
+def timed_fit(clusterer, embeddings):
+    started = time.perf_counter()
+    labels = clusterer.fit_predict(embeddings)
+    return labels, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base", default=gic.FIXED_BASE_DATE, help="기준시 (ISO 형식, 기본: FIXED_BASE_DATE 또는 가장 최근 pubDate)")
+    parser.add_argument("--hours", type=float, default=gic.HOURS_WINDOW)
+    parser.add_argument("--k", type=int, action="append", help="비교할 KNN_NEIGHBORS (여러 번 지정 가능)")
+    parser.add_argument("--knn", default="auto", choices=["auto", "hnsw", "exact"])
+    args = parser.parse_args()
+    ks = args.k or [gic.KNN_NEIGHBORS]
+
+    df, cutoff, base_ts = load_window(args.base, args.hours)
+    print(f"[기준 창] {cutoff} ~ {base_ts}: {len(df)}건")
+    if len(df) < gic.MIN_CLUSTER_SIZE * 2:
+        print("[WARN] 기준 창의 기사가 너무 적어 비교할 수 없습니다. --base를 지정하세요.")
+        sys.exit(2)
+
+    texts, article_ids = gic.build_corpus(df)
+    embeddings = gic.load_or_create_embeddings(texts, article_ids)
+
+    ref_labels, ref_seconds = timed_fit(gic.build_clusterer("hdbscan"), embeddings)
+    ref_noise = ref_labels == -1
+    print(f"\n{'엔진':<20} {'초':>7} {'속도':>6} {'ARI':>6} {'노이즈 일치':>10} {'군집 수':>6} {'노이즈':>6}")
+    print(f"{'hdbscan':<20} {ref_seconds:>7.2f} {'-':>6} {'-':>6} {'-':>10} "
+          f"{len(set(ref_labels) - {-1}):>6} {int(ref_noise.sum()):>6}")
+
+    failed = []
+    for k in ks:
+        clusterer = gic.IssueGraphClusterer(gic.MIN_CLUSTER_SIZE, gic.MIN_SAMPLES, n_neighbors=k, knn_method=args.knn)
+        labels, seconds = timed_fit(clusterer, embeddings)
+        ari = adjusted_rand_score(ref_labels, labels)
+        ok = ari >= MIN_ARI
+        if not ok:
+            failed.append(k)
+        name = f"knn_graph k={k}"
+        print(f"{name:<20} {seconds:>7.2f} {ref_seconds / seconds:>5.2f}x {ari:>6.3f} "
+              f"{np.mean((labels == -1) == ref_noise):>10.1%} {len(set(labels) - {-1}):>6} "
+              f"{int((labels == -1).sum()):>6}  {'OK' if ok else 'FAIL'}")
+
+    if failed:
+        print(f"\n[FAIL] ARI {MIN_ARI} 미만: k={', '.join(map(str, failed))}")
+        sys.exit(1)
+    print(f"\n[OK] knn_graph 결과가 hdbscan과 일치합니다. (ARI ≥ {MIN_ARI})")
+
+
+if __name__ == "__main__":
+    main()
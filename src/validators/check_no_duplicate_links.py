@@ -5,15 +5,23 @@ import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import CANONICAL_ARCHIVE_PATH
+from config import CANONICAL_ARCHIVE_PATH, ARCHIVE_BACKEND, ARTICLE_STORE_PATH
+from api.article_store import load_canonical_archive
 
 def main():
+    # ARCHIVE_BACKEND가 sqlite면 저장소의 canonical, 아니면 canonical_archive.csv (news_id, link만 읽음)
     try:
-        df = pd.read_csv(CANONICAL_ARCHIVE_PATH)
+        df = load_canonical_archive(
+            ARCHIVE_BACKEND, CANONICAL_ARCHIVE_PATH, ARTICLE_STORE_PATH, columns=["news_id", "link"]
+        )
     except FileNotFoundError:
         print(f"파일이 없습니다: {CANONICAL_ARCHIVE_PATH}")
         sys.exit(1)
 
+    if ARCHIVE_BACKEND == "sqlite" and df.empty:
+        print(f"저장소에 canonical 기사가 없습니다: {ARTICLE_STORE_PATH}")
+        sys.exit(1)
+
     if 'link' not in df.columns:
         print("검증 실패: link 컬럼이 없습니다.")
         sys.exit(1)
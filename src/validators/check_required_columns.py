@@ -4,7 +4,7 @@
 데이터 파일이 예상한 스키마를 유지하고 있는지 확인한다.
 
 2. 대상
-canonical_archive.csv
+canonical_archive.csv (ARCHIVE_BACKEND가 sqlite면 저장소의 canonical 기사)
 
 3. 확인하는 것
 필수 컬럼 존재 여부
@@ -24,7 +24,8 @@ import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import CANONICAL_ARCHIVE_PATH
+from config import CANONICAL_ARCHIVE_PATH, ARCHIVE_BACKEND, ARTICLE_STORE_PATH
+from api.article_store import load_canonical_archive
 
 TARGETS = {
     f"{CANONICAL_ARCHIVE_PATH}": ["news_id", "link", "title", "pubDate"],
@@ -34,11 +35,15 @@ TARGETS = {
 def main(): 
     for path, required_cols in TARGETS.items():
         try:
-            df = pd.read_csv(path)
+            df = load_canonical_archive(ARCHIVE_BACKEND, path, ARTICLE_STORE_PATH)
         except FileNotFoundError:
             print(f"[FAIL] 파일 없음: {path}")
             sys.exit(1)
 
+        if ARCHIVE_BACKEND == "sqlite" and df.empty:
+            print(f"[FAIL] 저장소에 canonical 기사 없음: {ARTICLE_STORE_PATH}")
+            sys.exit(1)
+
         missing = [c for c in required_cols if c not in df.columns]
         if missing:
             print(f"[FAIL] {path} 누락 컬럼: {missing}")
@@ -0,0 +1,66 @@
+# check_similarity_assign_modes.py
+# 실행법 python validators/check_similarity_assign_modes.py [CSV 경로]
+"""
+1. 역할
+ArticleSimilarityGrouper의 두 그룹 번호 부여 방식("loop" / "vectorized")이
+동일한 title_id / body_id를 만드는지 확인한다.
+
+2. 대상
+기본값은 canonical_archive.csv, 인자로 키워드별 selected_archive.csv 등을 지정할 수 있다.
+SingleNewsClusterer와 동일하게 제목은 정규화 후, 본문은 그대로 비교한다.
+
+3. 이게 깨지면 의미하는 것
+vectorized 방식이 기존 "먼저 나온 seed가 잡고, 뒤 seed가 덮어쓰는" 규칙을 재현하지 못한다는 뜻이다.
+SIMILARITY_ASSIGN_MODE를 "loop"로 되돌리고 원인을 확인해야 한다.
+"""
+
+import contextlib
+import io
+import pandas as pd
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import CANONICAL_ARCHIVE_PATH, SINGLE_TITLE_THRESHOLD, SINGLE_CONTENT_THRESHOLD
+from processors.article_similarity_grouper import ArticleSimilarityGrouper
+from utils.text_normalizer import NewsTextNormalizer
+
+
+def compare_modes(texts, threshold, label):
+    # loop 방식은 유사 쌍마다 출력하므로 결과 비교 시에는 출력을 버린다.
+    with contextlib.redirect_stdout(io.StringIO()):
+        loop_ids = ArticleSimilarityGrouper(threshold, field_name=label, assign_mode="loop").group(texts)
+        vec_ids = ArticleSimilarityGrouper(threshold, field_name=label, assign_mode="vectorized").group(texts)
+
+    mismatches = [i for i, (a, b) in enumerate(zip(loop_ids, vec_ids)) if a != b]
+    print(f"[{label}] 기사 {len(texts)}건 | 그룹 {len(set(loop_ids))}개 | 불일치 {len(mismatches)}건")
+    for i in mismatches[:10]:
+        print(f"  - [{i}] loop={loop_ids[i]} vectorized={vec_ids[i]} | {texts[i][:60]}")
+    return len(mismatches)
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else CANONICAL_ARCHIVE_PATH
+    try:
+        df = pd.read_csv(path)
+    except FileNotFoundError:
+        print(f"파일이 없습니다: {path}")
+        sys.exit(1)
+
+    titles = [NewsTextNormalizer.normalize_title(t) for t in df["title"].fillna("").tolist()]
+    body_col = "content" if "content" in df.columns else "body"
+    bodies = df[body_col].fillna("").tolist()
+
+    total = 0
+    total += compare_modes(titles, SINGLE_TITLE_THRESHOLD, "title_id")
+    total += compare_modes(bodies, SINGLE_CONTENT_THRESHOLD, "body_id")
+
+    if total == 0:
+        print("검증 통과: loop / vectorized 결과 동일")
+        sys.exit(0)
+
+    print(f"검증 실패: 불일치 {total}건")
+    sys.exit(2)
+
+if __name__ == "__main__":
+    main()
@@ -22,7 +22,7 @@ from datetime import datetime
 from time import perf_counter
 
 from processors.article_similarity_grouper import ArticleSimilarityGrouper
-from config import CANONICAL_ARCHIVE_PATH, PROBE_TITLE_THRESHOLD, PROBE_CONTENT_THRESHOLD
+from config import CANONICAL_ARCHIVE_PATH, PROBE_TITLE_THRESHOLD, PROBE_CONTENT_THRESHOLD, SIMILARITY_ASSIGN_MODE
 from utils.dataframe_utils import canonical_df_save, global_similarity_df_save
 
 class ProbeGlobalSimilarity:
@@ -57,13 +57,13 @@ class ProbeGlobalSimilarity:
         
 
         # 1. 제목 유사도 그룹
-        title_grouper = ArticleSimilarityGrouper(self.title_threshold)
+        title_grouper = ArticleSimilarityGrouper(self.title_threshold, assign_mode=SIMILARITY_ASSIGN_MODE)
         title_ids = title_grouper.group(df["title"].fillna("").tolist())
         print(f"[제목] 유사그룹: {n_total-len(set(title_ids))}개\n")
 
         # 2. 본문 유사도 그룹
         body_col = "content" if "content" in df.columns else "body"
-        body_grouper = ArticleSimilarityGrouper(self.content_threshold)
+        body_grouper = ArticleSimilarityGrouper(self.content_threshold, assign_mode=SIMILARITY_ASSIGN_MODE)
         body_ids = body_grouper.group(df[body_col].fillna("").tolist())
         print(f"[본문] 유사그룹: {n_total-len(set(body_ids))}개\n")
 